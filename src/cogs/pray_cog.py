@@ -8,7 +8,7 @@ from src.services.redis_service import RedisService
 from src.services.transaction_logger import TransactionLogger
 from src.services.event_bus import EventBus
 from src.services.resource_service import ResourceService
-from src.exceptions import InsufficientResourcesError, ValidationError
+from src.exceptions import InsufficientResourcesError, LockContendedError, ValidationError
 from src.services.logger import get_logger
 from src.utils.decorators import ratelimit
 from utils.embed_builder import EmbedBuilder
@@ -52,109 +52,115 @@ class PrayCog(commands.Cog):
             if charges > 5:
                 raise ValidationError("charges", "Cannot pray more than 5 times at once")
 
-            async with RedisService.acquire_lock(f"pray:{ctx.author.id}", timeout=5):
+            # The lock covers only the row-locked transaction; event listeners
+            # and Discord I/O run after it is released. TTL comfortably exceeds
+            # that section so the lock cannot lapse mid-prayer.
+            async with RedisService.acquire_lock(
+                f"pray:{ctx.author.id}", timeout=10, blocking=False
+            ):
                 async with DatabaseService.get_transaction() as session:
                     player = await PlayerService.get_player_with_regen(
                         session, ctx.author.id, lock=True
                     )
 
-                    if not player:
-                        embed = EmbedBuilder.error(
-                            title="Not Registered",
-                            description="You need to register first!",
-                            help_text="Use `/register` to create your account.",
-                        )
-                        await ctx.send(embed=embed, ephemeral=True)
-                        return
-
-                    if player.prayer_charges < charges:
-                        raise InsufficientResourcesError(
-                            resource="prayer charges",
-                            required=charges,
-                            current=player.prayer_charges,
-                        )
-
-                    result = await PlayerService.perform_prayer(
-                        session, player, charges_to_spend=charges
-                    )
-
-                    await TransactionLogger.log_transaction(
-                        player_id=ctx.author.id,
-                        transaction_type="prayer_performed",
-                        details={
-                            "charges_spent": charges,
-                            "grace_gained": result["grace_gained"],
-                            "class_bonus": result.get("class_bonus", 0),
-                            "remaining_charges": result["remaining_charges"],
-                            "modifiers_applied": result.get("modifiers_applied", {}),
-                        },
-                        context=f"command:/{ctx.command.name} guild:{ctx.guild.id if ctx.guild else 'DM'}",
-                    )
+                    if player is not None:
+                        if player.prayer_charges < charges:
+                            raise InsufficientResourcesError(
+                                resource="prayer charges",
+                                required=charges,
+                                current=player.prayer_charges,
+                            )
 
-                    await EventBus.publish(
-                        "prayer_completed",
-                        {
-                            "player_id": ctx.author.id,
-                            "charges_spent": charges,
-                            "grace_gained": result["grace_gained"],
-                            "channel_id": ctx.channel.id,
-                            "__topic__": "prayer_completed",
-                            "timestamp": discord.utils.utcnow(),
-                        },
-                    )
+                        result = await PlayerService.perform_prayer(
+                            session, player, charges_to_spend=charges
+                        )
 
-                    # --- Embed Construction ---
-                    embed = EmbedBuilder.success(
-                        title="🙏 Prayer Complete",
-                        description=(
-                            f"Your prayers have been answered!\n\n"
-                            f"You gained **{result['grace_gained']} Grace**."
-                        ),
-                        footer=f"Total Grace: {result['total_grace']}",
-                    )
+                        await TransactionLogger.log_transaction(
+                            session=session,
+                            player_id=ctx.author.id,
+                            transaction_type="prayer_performed",
+                            details={
+                                "charges_spent": charges,
+                                "grace_gained": result["grace_gained"],
+                                "class_bonus": result.get("class_bonus", 0),
+                                "remaining_charges": result["remaining_charges"],
+                                "modifiers_applied": result.get("modifiers_applied", {}),
+                            },
+                            context=f"command:/{ctx.command.name} guild:{ctx.guild.id if ctx.guild else 'DM'}",
+                        )
 
-                    embed.add_field(
-                        name="Prayer Charges",
-                        value=(
-                            f"**Remaining:** {result['remaining_charges']}/{player.max_prayer_charges}\n"
-                            f"**Next Regen:** {player.get_prayer_regen_display()}"
-                        ),
-                        inline=True,
-                    )
+            if player is None:
+                embed = EmbedBuilder.error(
+                    title="Not Registered",
+                    description="You need to register first!",
+                    help_text="Use `/register` to create your account.",
+                )
+                await ctx.send(embed=embed, ephemeral=True)
+                return
+
+            await EventBus.publish(
+                "prayer_completed",
+                {
+                    "player_id": ctx.author.id,
+                    "charges_spent": charges,
+                    "grace_gained": result["grace_gained"],
+                    "channel_id": ctx.channel.id,
+                    "__topic__": "prayer_completed",
+                    "timestamp": discord.utils.utcnow(),
+                },
+            )
 
-                    # Class bonus (existing)
-                    if result.get("class_bonus", 0) > 0:
-                        embed.add_field(
-                            name="✨ Class Bonus",
-                            value=f"+{result['class_bonus']} grace from **{player.player_class}** class",
-                            inline=True,
-                        )
+            # --- Embed Construction ---
+            embed = EmbedBuilder.success(
+                title="🙏 Prayer Complete",
+                description=(
+                    f"Your prayers have been answered!\n\n"
+                    f"You gained **{result['grace_gained']} Grace**."
+                ),
+                footer=f"Total Grace: {result['total_grace']}",
+            )
 
-                    # NEW: Active modifier bonuses (leader/class effects)
-                    modifiers = result.get("modifiers_applied", {})
-                    income_boost = modifiers.get("income_boost", 1.0)
-                    xp_boost = modifiers.get("xp_boost", 1.0)
-
-                    if income_boost > 1.0 or xp_boost > 1.0:
-                        bonus_lines = []
-                        if income_boost > 1.0:
-                            bonus_lines.append(f"💰 **Grace Boost:** +{(income_boost - 1.0) * 100:.0f}%")
-                        if xp_boost > 1.0:
-                            bonus_lines.append(f"📈 **XP Bonus:** +{(xp_boost - 1.0) * 100:.0f}%")
-                        embed.add_field(
-                            name="🌟 Active Modifiers",
-                            value="\n".join(bonus_lines),
-                            inline=False,
-                        )
+            embed.add_field(
+                name="Prayer Charges",
+                value=(
+                    f"**Remaining:** {result['remaining_charges']}/{player.max_prayer_charges}\n"
+                    f"**Next Regen:** {player.get_prayer_regen_display()}"
+                ),
+                inline=True,
+            )
 
-                    embed.add_field(
-                        name="💡 Tip",
-                        value="Prayer charges regenerate every 5 minutes. Use them regularly to maximize grace!",
-                        inline=False,
-                    )
+            # Class bonus (existing)
+            if result.get("class_bonus", 0) > 0:
+                embed.add_field(
+                    name="✨ Class Bonus",
+                    value=f"+{result['class_bonus']} grace from **{player.player_class}** class",
+                    inline=True,
+                )
+
+            # NEW: Active modifier bonuses (leader/class effects)
+            if result.get("has_modifiers"):
+                modifiers = result["modifiers_applied"]
+                income_boost = modifiers.get("income_boost", 1.0)
+                xp_boost = modifiers.get("xp_boost", 1.0)
+                bonus_lines = []
+                if income_boost > 1.0:
+                    bonus_lines.append(f"💰 **Grace Boost:** +{(income_boost - 1.0) * 100:.0f}%")
+                if xp_boost > 1.0:
+                    bonus_lines.append(f"📈 **XP Bonus:** +{(xp_boost - 1.0) * 100:.0f}%")
+                embed.add_field(
+                    name="🌟 Active Modifiers",
+                    value="\n".join(bonus_lines),
+                    inline=False,
+                )
+
+            embed.add_field(
+                name="💡 Tip",
+                value="Prayer charges regenerate every 5 minutes. Use them regularly to maximize grace!",
+                inline=False,
+            )
 
-                    view = PrayActionView(ctx.author.id, result["total_grace"])
-                    await ctx.send(embed=embed, view=view)
+            view = PrayActionView(ctx.author.id, result["total_grace"])
+            await ctx.send(embed=embed, view=view)
 
         except InsufficientResourcesError as e:
             embed = EmbedBuilder.error(
@@ -179,6 +185,13 @@ class PrayCog(commands.Cog):
 
             await ctx.send(embed=embed, ephemeral=True)
 
+        except LockContendedError:
+            embed = EmbedBuilder.warning(
+                title="Prayer In Progress",
+                description="You're already praying! Wait for your current prayer to finish.",
+            )
+            await ctx.send(embed=embed, ephemeral=True)
+
         except ValidationError as e:
             embed = EmbedBuilder.error(
                 title="Invalid Input",
@@ -36,11 +36,13 @@ class RegisterCog(commands.Cog):
             async with DatabaseService.get_transaction() as session:
                 existing = await session.get(Player, ctx.author.id, with_for_update=True)
                 if existing:
+                    # Rows predating created_at_unix fall back to the datetime conversion
+                    created_ts = existing.created_at_unix or int(existing.created_at.timestamp())
                     embed = EmbedBuilder.warning(
                         title="Already Registered",
                         description=(
                             f"Welcome back, {ctx.author.mention}!\n"
-                            f"You registered on <t:{int(existing.created_at.timestamp())}:D>."
+                            f"You registered on <t:{created_ts}:D>."
                         ),
                         footer=f"Level {existing.level} • {existing.total_maidens_owned} Maidens"
                     )
@@ -1,26 +1,58 @@
+import heapq
+import operator
+from collections import OrderedDict
+from datetime import datetime
 import discord
 from discord.ext import commands
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 from src.services.database_service import DatabaseService
 from src.services.player_service import PlayerService
 from src.database.models.player import Player
 from src.database.models.transaction_log import TransactionLog
 from src.services.logger import get_logger
-from utils.embed_builder import EmbedBuilder
+from utils.embed_builder import EmbedBuilder, RIKI_COLOR
 
 logger = get_logger(__name__)
 
+# Every field here has a model-level default, so one C-level attrgetter
+# replaces the per-field getattr/default chain in /stats.
+_PLAYER_ATTRS = operator.attrgetter(
+    "level", "created_at", "created_at_unix", "total_summons", "pity_counter", "unique_maidens",
+    "total_fusions", "fusion_shards", "total_maidens_owned", "highest_tier_achieved",
+    "total_power", "rikis", "grace", "riki_gems", "stats", "discord_id",
+)
+
 
 def _safe_value(text: str, limit: int = 1024) -> str:
+    """Clamp user-derived field text to Discord's limit; static fields skip this."""
     return text if len(text) <= limit else text[: limit - 3] + "..."
 
 
+_PRETTY_TIER: Dict[str, str] = {}
+
+_STATS_EMBED_CACHE_SIZE = 4096
+_STATS_EMBED_CACHE: "OrderedDict[Tuple[int, datetime, str], Dict[str, Any]]" = OrderedDict()
+
+
+def _pretty_tier(tier: str) -> str:
+    """'tier_3' -> 'Tier 3', memoized since shard keys come from a small fixed set."""
+    pretty = _PRETTY_TIER.get(tier)
+    if pretty is None:
+        pretty = _PRETTY_TIER[tier] = tier.replace("_", " ").title()
+    return pretty
+
+
 def _as_dict(value: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     return value if isinstance(value, dict) else {}
 
 
-def _fusion_success_rate(player: Player) -> float:
+def _shard_counts(value: Optional[Dict[str, Any]]) -> Dict[str, int]:
+    """fusion_shards with every count coerced to int once; JSON nulls count as 0."""
+    return {tier: int(count or 0) for tier, count in _as_dict(value).items()}
+
+
+def _fusion_success_rate(player: Player, stats_json: Dict[str, Any], total_fusions: int) -> float:
     method = getattr(player, "calculate_fusion_success_rate", None)
     if callable(method):
         try:
@@ -28,14 +60,167 @@ def _fusion_success_rate(player: Player) -> float:
             return max(0.0, min(rate, 100.0))
         except Exception:
             pass
-    stats = _as_dict(getattr(player, "stats", None))
-    successes = int(stats.get("fusions_successful", 0))
-    total = int(getattr(player, "total_fusions", 0)) or int(stats.get("fusions_total", 0)) or 0
+    successes = int(stats_json.get("fusions_successful", 0))
+    total = int(total_fusions)
+    if total <= 0:
+        total = int(stats_json.get("fusions_total", 0))
     if total <= 0:
         return 0.0
     return round((successes / total) * 100.0, 1)
 
 
+def _prayer_fields(player: Player) -> List[Dict[str, Any]]:
+    prayers_performed = player.prayers_performed
+    return [{
+        "name": "🙏 Prayer Statistics",
+        "value": (
+            f"**Total Prayers:** {prayers_performed:,}\n"
+            f"**Current Charges:** {player.prayer_charges}/{player.max_prayer_charges}\n"
+            f"**Next Regen:** {player.get_prayer_regen_display()}"
+        ),
+        "inline": True,
+    }]
+
+
+def _progression_fields(player: Player) -> List[Dict[str, Any]]:
+    level_ups = player.level_ups
+    return [{
+        "name": "📈 Progression",
+        "value": (
+            f"**Experience:** {player.experience:,}\n"
+            f"**Level Ups:** {level_ups:,}\n"
+            f"**Class:** {player.player_class or 'None'}"
+        ),
+        "inline": True,
+    }]
+
+
+def _economy_fields(player: Player) -> List[Dict[str, Any]]:
+    rikis_earned = player.total_rikis_earned
+    rikis_spent = player.total_rikis_spent
+    net_rikis = rikis_earned - rikis_spent
+    fields = [{
+        "name": "💹 Economy Statistics",
+        "value": (
+            f"**Earned:** {rikis_earned:,} rikis\n"
+            f"**Spent:** {rikis_spent:,} rikis\n"
+            f"**Net:** {net_rikis:,} rikis"
+        ),
+        "inline": False,
+    }]
+
+    fusion_shards = _shard_counts(player.fusion_shards)
+    if sum(fusion_shards.values()) > 0:
+        sorted_shards = heapq.nlargest(3, fusion_shards.items(), key=lambda kv: kv[1])
+        shard_text = "\n".join(
+            f"**{_pretty_tier(tier)}:** {count:,}" for tier, count in sorted_shards if count > 0
+        ) or "No shards collected yet"
+        fields.append({
+            "name": "🔷 Top Fusion Shards",
+            "value": _safe_value(shard_text),
+            "inline": True,
+        })
+    return fields
+
+
+def _build_stats_embed_dict(player: Player, display_name: str) -> Dict[str, Any]:
+    """Core /stats embed payload; a pure function of persisted player state."""
+    (
+        level, created_at, created_ts, total_summons, pity_counter, unique_maidens,
+        total_fusions, fusion_shards, total_maidens_owned, highest_tier_achieved,
+        total_power, rikis, grace, gems, stats_json, discord_id,
+    ) = _PLAYER_ATTRS(player)
+
+    if created_ts is None and created_at:
+        created_ts = int(created_at.timestamp())
+
+    title = f"📊 {display_name}'s Statistics"
+    desc_parts = [f"Level {level}"]
+    if created_ts:
+        desc_parts.append(f"Playing since <t:{created_ts}:D>")
+
+    pity_percentage = (pity_counter / 90) * 100 if pity_counter > 0 else 0.0
+
+    stats_json = _as_dict(stats_json)
+    success_rate = _fusion_success_rate(player, stats_json, total_fusions)
+    fusion_shards = _shard_counts(fusion_shards)
+    total_shards = sum(fusion_shards.values())
+
+    # attrgetter would hand back the bound method; call the display helper directly
+    total_power_str = player.get_power_display()
+
+    # Fields are assembled as plain dicts and handed to Embed.from_dict
+    # in one shot. Prayer/Progression/Economy panes are built on demand
+    # by StatsActionView from the same player snapshot.
+    fields = [
+        {
+            "name": "✨ Summon Statistics",
+            "value": (
+                f"**Total Summons:** {total_summons:,}\n"
+                f"**Pity Counter:** {pity_counter}/90 ({pity_percentage:.1f}%)\n"
+                f"**Unique Maidens:** {unique_maidens:,}"
+            ),
+            "inline": True,
+        },
+        {
+            "name": "⚗️ Fusion Statistics",
+            "value": (
+                f"**Total Fusions:** {total_fusions:,}\n"
+                f"**Success Rate:** {success_rate:.1f}%\n"
+                f"**Fusion Shards:** {total_shards:,}"
+            ),
+            "inline": True,
+        },
+        {
+            "name": "🎴 Collection",
+            "value": (
+                f"**Total Maidens:** {total_maidens_owned:,}\n"
+                f"**Highest Tier:** {highest_tier_achieved}\n"
+                f"**Total Power:** {total_power_str}"
+            ),
+            "inline": True,
+        },
+        {
+            "name": "💰 Resources",
+            "value": (
+                f"**Rikis:** {rikis:,}\n"
+                f"**Grace:** {grace:,}\n"
+                f"**Gems:** {gems:,}"
+            ),
+            "inline": True,
+        },
+    ]
+
+    return {
+        "type": "rich",
+        "title": title,
+        "description": " • ".join(desc_parts),
+        "color": RIKI_COLOR["primary"],
+        "footer": {"text": f"Player ID: {discord_id}"},
+        "fields": fields,
+    }
+
+
+def _stats_embed_dict(player: Player, display_name: str) -> Dict[str, Any]:
+    """
+    Return the cached core embed payload for this player version.
+    
+    Keyed on (discord_id, updated_at, display_name): updated_at is bumped by
+    every committed write, so an unchanged player reuses the previous payload
+    instead of rebuilding every field.
+    """
+    key = (player.discord_id, player.updated_at, display_name)
+    cached = _STATS_EMBED_CACHE.get(key)
+    if cached is not None:
+        _STATS_EMBED_CACHE.move_to_end(key)
+        return cached
+
+    cached = _STATS_EMBED_CACHE[key] = _build_stats_embed_dict(player, display_name)
+    if len(_STATS_EMBED_CACHE) > _STATS_EMBED_CACHE_SIZE:
+        _STATS_EMBED_CACHE.popitem(last=False)
+    return cached
+
+
 class StatsCog(commands.Cog):
     """
     Detailed statistics display system.
@@ -66,12 +251,12 @@ class StatsCog(commands.Cog):
         target_user = user or ctx.author
 
         try:
-            async with DatabaseService.get_transaction() as session:
+            async with DatabaseService.get_readonly_session() as session:
                 player: Optional[Player] = await PlayerService.get_player_with_regen(
                     session, target_user.id, lock=False
                 )
 
-                if not player:
+                if player is None:
                     if target_user == ctx.author:
                         embed = EmbedBuilder.error(
                             title="Not Registered",
@@ -86,145 +271,14 @@ class StatsCog(commands.Cog):
                     await ctx.send(embed=embed, ephemeral=True)
                     return
 
-                level = int(getattr(player, "level", 0))
-                created_at = getattr(player, "created_at", None)
-                created_ts = int(created_at.timestamp()) if created_at else None
-
-                title = f"📊 {target_user.name}'s Statistics"
-                desc_parts = [f"Level {level}"]
-                if created_ts:
-                    desc_parts.append(f"Playing since <t:{created_ts}:D>")
-
-                embed = EmbedBuilder.primary(
-                    title=title,
-                    description=" • ".join(desc_parts),
-                    footer=f"Player ID: {getattr(player, 'discord_id', target_user.id)}",
-                )
+                embed_data = _stats_embed_dict(player, target_user.name)
+                # from_dict adopts the fields list, so hand it a copy of the cached one
+                embed = discord.Embed.from_dict({**embed_data, "fields": list(embed_data["fields"])})
                 embed.timestamp = discord.utils.utcnow()
-
-                total_summons = int(getattr(player, "total_summons", 0))
-                pity_counter = int(getattr(player, "pity_counter", 0))
-                unique_maidens = int(getattr(player, "unique_maidens", 0))
-                pity_percentage = (pity_counter / 90) * 100 if pity_counter > 0 else 0.0
-
-                embed.add_field(
-                    name="✨ Summon Statistics",
-                    value=_safe_value(
-                        f"**Total Summons:** {total_summons:,}\n"
-                        f"**Pity Counter:** {pity_counter}/90 ({pity_percentage:.1f}%)\n"
-                        f"**Unique Maidens:** {unique_maidens:,}"
-                    ),
-                    inline=True,
-                )
-
-                total_fusions = int(getattr(player, "total_fusions", 0))
-                success_rate = _fusion_success_rate(player)
-                fusion_shards: Dict[str, int] = _as_dict(getattr(player, "fusion_shards", None))
-                total_shards = int(sum(int(v or 0) for v in fusion_shards.values()))
-
-                embed.add_field(
-                    name="⚗️ Fusion Statistics",
-                    value=_safe_value(
-                        f"**Total Fusions:** {total_fusions:,}\n"
-                        f"**Success Rate:** {success_rate:.1f}%\n"
-                        f"**Fusion Shards:** {total_shards:,}"
-                    ),
-                    inline=True,
-                )
-
-                total_maidens_owned = int(getattr(player, "total_maidens_owned", 0))
-                highest_tier_achieved = getattr(player, "highest_tier_achieved", "—")
-                total_power = getattr(player, "get_power_display", None)
-                total_power_str = total_power() if callable(total_power) else f"{int(getattr(player, 'total_power', 0)):,}"
-
-                embed.add_field(
-                    name="🎴 Collection",
-                    value=_safe_value(
-                        f"**Total Maidens:** {total_maidens_owned:,}\n"
-                        f"**Highest Tier:** {highest_tier_achieved}\n"
-                        f"**Total Power:** {total_power_str}"
-                    ),
-                    inline=True,
-                )
-
-                rikis = int(getattr(player, "rikis", 0))
-                grace = int(getattr(player, "grace", 0))
-                gems = int(getattr(player, "riki_gems", 0))
-
-                embed.add_field(
-                    name="💰 Resources",
-                    value=_safe_value(
-                        f"**Rikis:** {rikis:,}\n"
-                        f"**Grace:** {grace:,}\n"
-                        f"**Gems:** {gems:,}"
-                    ),
-                    inline=True,
-                )
-
-                stats_json = _as_dict(getattr(player, "stats", None))
-                prayers_performed = int(stats_json.get("prayers_performed", 0))
-                prayer_charges = int(getattr(player, "prayer_charges", 0))
-                max_prayer_charges = int(getattr(player, "max_prayer_charges", 0))
-                regen_disp = getattr(player, "get_prayer_regen_display", None)
-                next_regen_str = regen_disp() if callable(regen_disp) else "—"
-
-                embed.add_field(
-                    name="🙏 Prayer Statistics",
-                    value=_safe_value(
-                        f"**Total Prayers:** {prayers_performed:,}\n"
-                        f"**Current Charges:** {prayer_charges}/{max_prayer_charges}\n"
-                        f"**Next Regen:** {next_regen_str}"
-                    ),
-                    inline=True,
-                )
-
-                experience = int(getattr(player, "experience", 0))
-                level_ups = int(stats_json.get("level_ups", 0))
-                player_class = getattr(player, "player_class", None) or "None"
-
-                embed.add_field(
-                    name="📈 Progression",
-                    value=_safe_value(
-                        f"**Experience:** {experience:,}\n"
-                        f"**Level Ups:** {level_ups:,}\n"
-                        f"**Class:** {player_class}"
-                    ),
-                    inline=True,
-                )
-
-                rikis_earned = int(stats_json.get("total_rikis_earned", 0))
-                rikis_spent = int(stats_json.get("total_rikis_spent", 0))
-                net_rikis = rikis_earned - rikis_spent
-
-                embed.add_field(
-                    name="💹 Economy Statistics",
-                    value=_safe_value(
-                        f"**Earned:** {rikis_earned:,} rikis\n"
-                        f"**Spent:** {rikis_spent:,} rikis\n"
-                        f"**Net:** {net_rikis:,} rikis"
-                    ),
-                    inline=False,
-                )
-
-                if total_shards > 0:
-                    sorted_shards = sorted(
-                        ((k, int(v or 0)) for k, v in fusion_shards.items()),
-                        key=lambda x: x[1],
-                        reverse=True,
-                    )[:3]
-                    shard_text = "\n".join(
-                        f"**{tier.replace('_', ' ').title()}:** {count:,}" for tier, count in sorted_shards if count > 0
-                    ) or "No shards collected yet"
-                    embed.add_field(
-                        name="🔷 Top Fusion Shards",
-                        value=_safe_value(shard_text),
-                        inline=True,
-                    )
-
                 if target_user.display_avatar:
                     embed.set_thumbnail(url=target_user.display_avatar.url)
 
-                view = StatsActionView(ctx.author.id)
+                view = StatsActionView(ctx.author.id, player)
                 msg = await ctx.send(embed=embed, view=view)
                 view.set_message(msg)
 
@@ -317,14 +371,26 @@ class StatsCog(commands.Cog):
 class StatsActionView(discord.ui.View):
     """Action buttons for stats view."""
 
-    def __init__(self, user_id: int):
+    def __init__(self, user_id: int, player: Player):
         super().__init__(timeout=180)
         self.user_id = user_id
+        # Snapshot from /stats; detail panes render from it without another query
+        self.player = player
         self.message: Optional[discord.Message] = None
 
     def set_message(self, message: discord.Message) -> None:
         self.message = message
 
+    async def _expand(self, interaction: discord.Interaction, button: discord.ui.Button, build) -> None:
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message("This button is not for you!", ephemeral=True)
+            return
+        embed = interaction.message.embeds[0]
+        for field in build(self.player):
+            embed.add_field(**field)
+        button.disabled = True
+        await interaction.response.edit_message(embed=embed, view=self)
+
     @discord.ui.button(
         label="👤 Profile",
         style=discord.ButtonStyle.primary,
@@ -347,6 +413,30 @@ class StatsActionView(discord.ui.View):
             return
         await interaction.response.send_message("Use `/collection` to view your maiden collection!", ephemeral=True)
 
+    @discord.ui.button(
+        label="🙏 Prayer",
+        style=discord.ButtonStyle.secondary,
+        custom_id="expand_prayer_from_stats",
+    )
+    async def prayer_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._expand(interaction, button, _prayer_fields)
+
+    @discord.ui.button(
+        label="💹 Economy",
+        style=discord.ButtonStyle.secondary,
+        custom_id="expand_economy_from_stats",
+    )
+    async def economy_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._expand(interaction, button, _economy_fields)
+
+    @discord.ui.button(
+        label="📈 Progression",
+        style=discord.ButtonStyle.secondary,
+        custom_id="expand_progression_from_stats",
+    )
+    async def progression_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._expand(interaction, button, _progression_fields)
+
     async def on_timeout(self):
         for item in self.children:
             if isinstance(item, discord.ui.Button):
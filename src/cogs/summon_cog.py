@@ -1,6 +1,9 @@
 import discord
 from discord.ext import commands
-from typing import List, Dict, Any
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional
+import weakref
 
 from src.services.database_service import DatabaseService
 from src.services.player_service import PlayerService
@@ -17,6 +20,67 @@ from utils.embed_builder import EmbedBuilder
 
 logger = get_logger(__name__)
 
+_TIER_FLAVOR: Dict[int, str] = {
+    1: "Common maiden - fusion material",
+    2: "Uncommon maiden - steady ally",
+    3: "Rare maiden - solid find",
+    4: "Epic maiden - excellent pull!",
+    5: "Legendary maiden - incredible luck!",
+    6: "Mythic maiden - extremely rare!",
+    7: "Divine maiden - blessed by fate!",
+    8: "Transcendent maiden - one in a million!",
+    9: "Celestial maiden - beyond mortal power!",
+    10: "Primordial maiden - ancient force reborn!",
+    11: "Eternal maiden - timeless perfection!",
+    12: "Absolute maiden - ultimate existence!"
+}
+_DEFAULT_FLAVOR = "Mysterious maiden..."
+
+
+@dataclass(eq=False)
+class BatchSummonSession:
+    """Pending batch reveal; owned by its BatchSummonView, tracked weakly by the cog."""
+    user_id: int
+    results: List[Dict[str, Any]]
+
+
+def _build_result_embed(
+    result: Dict[str, Any],
+    index: int,
+    total: int,
+    remaining: int
+) -> discord.Embed:
+    """Create embed for an individual summon result."""
+    name = result.get("maiden_name", "Unknown Maiden")
+    tier = result.get("tier", 1)
+    element = result.get("element", "Unknown")
+    emoji = result.get("element_emoji", "❓")
+    is_new = result.get("is_new", False)
+    pity = result.get("pity_triggered", False)
+
+    title = f"{'🌟 PITY! ' if pity else '✨ '}{name} Summoned!"
+    desc = "".join((
+        f"{emoji} **{element.title()}** Element • **Tier {tier}**\n",
+        "🆕 New to your collection!" if is_new else "📦 Added to your collection.",
+        f"\n\n*{_TIER_FLAVOR.get(tier, _DEFAULT_FLAVOR)}*",
+    ))
+
+    embed = EmbedBuilder.success(
+        title=title,
+        description=desc,
+        footer=f"Summon {index}/{total} • {remaining} grace remaining"
+    )
+
+    atk = result.get("attack", 0)
+    dfs = result.get("defense", 0)
+    embed.add_field(
+        name="⚔️ Stats",
+        value=f"ATK: {atk:,} • DEF: {dfs:,}\nPower: {atk + dfs:,}",
+        inline=True
+    )
+
+    return embed
+
 
 class SummonCog(commands.Cog):
     """
@@ -37,7 +101,18 @@ class SummonCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.active_summon_sessions: Dict[int, List[Dict[str, Any]]] = {}
+        # Entries vanish once the owning view drops its session (summary, timeout, GC)
+        self.active_summon_sessions: "weakref.WeakValueDictionary[int, BatchSummonSession]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._grace_cost: int = ConfigManager.get("summon.grace_cost", 1)
+
+    async def cog_load(self):
+        # Hoisted per-summon cost stays in sync with live config edits
+        EventBus.subscribe("config_reloaded", self._refresh_config)
+
+    def _refresh_config(self, payload: Dict[str, Any]) -> None:
+        self._grace_cost = ConfigManager.get("summon.grace_cost", 1)
 
     @commands.hybrid_command(
         name="summon",
@@ -62,7 +137,7 @@ class SummonCog(commands.Cog):
                 async with DatabaseService.get_transaction() as session:
                     player = await PlayerService.get_player_with_regen(session, ctx.author.id, lock=True)
 
-                    if not player:
+                    if player is None:
                         embed = EmbedBuilder.error(
                             title="Not Registered",
                             description="You need to register first!",
@@ -71,7 +146,7 @@ class SummonCog(commands.Cog):
                         await ctx.send(embed=embed, ephemeral=True)
                         return
 
-                    grace_cost = ConfigManager.get("summon.grace_cost", 1) * count
+                    grace_cost = self._grace_cost * count
                     if player.grace < grace_cost:
                         raise InsufficientResourcesError(
                             resource="grace", required=grace_cost, current=player.grace
@@ -79,7 +154,10 @@ class SummonCog(commands.Cog):
 
                     results = await SummonService.perform_summons(session, player, count=count)
 
+                    # Article I.2: the audit row is a plain session.add, so it stays in
+                    # the transaction and commits atomically with the summon itself
                     await TransactionLogger.log_transaction(
+                        session=session,
                         player_id=ctx.author.id,
                         transaction_type="summons_performed",
                         details={
@@ -94,24 +172,27 @@ class SummonCog(commands.Cog):
                         context=f"command:/{ctx.command.name} guild:{ctx.guild.id if ctx.guild else 'DM'}"
                     )
 
-                    await EventBus.publish("summons_completed", {
-                        "player_id": ctx.author.id,
-                        "count": count,
-                        "results": results,
-                        "channel_id": ctx.channel.id,          
-                        "__topic__": "prayer_completed",  
-                        "timestamp": discord.utils.utcnow()
-                    })
-
                 remaining = player.grace - grace_cost
 
-                if count == 1:
-                    await self._display_single(ctx, results[0], remaining)
-                else:
-                    self.active_summon_sessions[ctx.author.id] = results
-                    view = BatchSummonView(ctx.author.id, results, self.active_summon_sessions)
-                    first = self._build_result_embed(results[0], 1, count, remaining)
-                    await ctx.send(embed=first, view=view)
+            # Lock released and summon committed: listeners and Discord I/O no
+            # longer extend the per-player critical section
+            await EventBus.publish("summons_completed", {
+                "player_id": ctx.author.id,
+                "count": count,
+                "results": results,
+                "channel_id": ctx.channel.id,          
+                "__topic__": "prayer_completed",  
+                "timestamp": discord.utils.utcnow()
+            })
+
+            if count == 1:
+                await self._display_single(ctx, results[0], remaining)
+            else:
+                batch = BatchSummonSession(user_id=ctx.author.id, results=results)
+                self.active_summon_sessions[ctx.author.id] = batch
+                view = BatchSummonView(batch)
+                first = _build_result_embed(results[0], 1, count, remaining)
+                await ctx.send(embed=first, view=view)
 
         except InsufficientResourcesError as e:
             embed = EmbedBuilder.error(
@@ -140,70 +221,19 @@ class SummonCog(commands.Cog):
 
     async def _display_single(self, ctx: commands.Context, result: Dict[str, Any], remaining: int):
         """Display a single summon result."""
-        embed = self._build_result_embed(result, 1, 1, remaining)
+        embed = _build_result_embed(result, 1, 1, remaining)
         view = SingleSummonView(ctx.author.id, remaining)
         await ctx.send(embed=embed, view=view)
 
-    def _build_result_embed(
-        self,
-        result: Dict[str, Any],
-        index: int,
-        total: int,
-        remaining: int
-    ) -> discord.Embed:
-        """Create embed for an individual summon result."""
-        name = result.get("maiden_name", "Unknown Maiden")
-        tier = result.get("tier", 1)
-        element = result.get("element", "Unknown")
-        emoji = result.get("element_emoji", "❓")
-        is_new = result.get("is_new", False)
-        pity = result.get("pity_triggered", False)
-
-        title = f"{'🌟 PITY! ' if pity else '✨ '}{name} Summoned!"
-        desc = f"{emoji} **{element.title()}** Element • **Tier {tier}**\n"
-        desc += "🆕 New to your collection!" if is_new else "📦 Added to your collection."
-
-        flavor = {
-            1: "Common maiden - fusion material",
-            2: "Uncommon maiden - steady ally",
-            3: "Rare maiden - solid find",
-            4: "Epic maiden - excellent pull!",
-            5: "Legendary maiden - incredible luck!",
-            6: "Mythic maiden - extremely rare!",
-            7: "Divine maiden - blessed by fate!",
-            8: "Transcendent maiden - one in a million!",
-            9: "Celestial maiden - beyond mortal power!",
-            10: "Primordial maiden - ancient force reborn!",
-            11: "Eternal maiden - timeless perfection!",
-            12: "Absolute maiden - ultimate existence!"
-        }
-        desc += f"\n\n*{flavor.get(tier, 'Mysterious maiden...')}*"
-
-        embed = EmbedBuilder.success(
-            title=title,
-            description=desc,
-            footer=f"Summon {index}/{total} • {remaining} grace remaining"
-        )
-
-        atk = result.get("attack", 0)
-        dfs = result.get("defense", 0)
-        embed.add_field(
-            name="⚔️ Stats",
-            value=f"ATK: {atk:,} • DEF: {dfs:,}\nPower: {atk + dfs:,}",
-            inline=True
-        )
-
-        return embed
-
 
 class BatchSummonView(discord.ui.View):
     """Interactive viewer for batch summons."""
 
-    def __init__(self, user_id: int, results: List[Dict[str, Any]], session: Dict[int, List[Dict[str, Any]]]):
+    def __init__(self, batch: BatchSummonSession):
         super().__init__(timeout=300)
-        self.user_id = user_id
-        self.results = results
-        self.session = session
+        self.user_id = batch.user_id
+        self.results = batch.results
+        self.batch: Optional[BatchSummonSession] = batch
         self.index = 0
 
     @discord.ui.button(label="Next ▶️", style=discord.ButtonStyle.primary)
@@ -217,9 +247,7 @@ class BatchSummonView(discord.ui.View):
             await self._show_summary(interaction)
             return
 
-        embed = SummonCog._build_result_embed(self=SummonCog, result=self.results[self.index],
-                                              index=self.index + 1, total=len(self.results),
-                                              remaining=0)
+        embed = _build_result_embed(self.results[self.index], self.index + 1, len(self.results), 0)
         if self.index == len(self.results) - 1:
             button.label = "Finish ✓"
             button.style = discord.ButtonStyle.success
@@ -238,19 +266,16 @@ class BatchSummonView(discord.ui.View):
             i.disabled = True
 
         total = len(self.results)
-        tiers, new_count, high = {}, 0, 0
-        for r in self.results:
-            t = r["tier"]
-            tiers[t] = tiers.get(t, 0) + 1
-            new_count += 1 if r.get("is_new") else 0
-            high = max(high, t)
-
-        text = f"You summoned **{total}** maidens!\n"
+        tiers = Counter(r["tier"] for r in self.results)
+        new_count = sum(1 for r in self.results if r.get("is_new"))
+        high = max(tiers, default=0)
+
+        parts: List[str] = [f"You summoned **{total}** maidens!\n"]
         if new_count:
-            text += f"🆕 **{new_count}** new to your collection!\n\n"
-        text += "**Tier Breakdown:**\n"
-        for t in sorted(tiers.keys(), reverse=True):
-            text += f"• Tier {t}: **{tiers[t]}**\n"
+            parts.append(f"🆕 **{new_count}** new to your collection!\n\n")
+        parts.append("**Tier Breakdown:**\n")
+        parts.extend(f"• Tier {t}: **{tiers[t]}**\n" for t in sorted(tiers, reverse=True))
+        text = "".join(parts)
 
         embed = EmbedBuilder.success(
             title=f"🎊 Summon Summary ({total} Summons)",
@@ -263,16 +288,14 @@ class BatchSummonView(discord.ui.View):
             inline=False
         )
 
-        if self.user_id in self.session:
-            del self.session[self.user_id]
+        self.batch = None
 
         await interaction.response.edit_message(embed=embed, view=self)
 
     async def on_timeout(self):
         for i in self.children:
             i.disabled = True
-        if self.user_id in self.session:
-            del self.session[self.user_id]
+        self.batch = None
 
 
 class SingleSummonView(discord.ui.View):
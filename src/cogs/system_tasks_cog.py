@@ -1,13 +1,21 @@
 # src/cogs/system_tasks_cog.py
+import asyncio
+import time
+from typing import Awaitable, Callable
 import discord
 from discord.ext import commands, tasks
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from src.services.database_service import DatabaseService
 from src.services.cache_service import CacheService
 from src.services.config_manager import ConfigManager
+from src.services.daily_service import DailyService
+from src.services.event_bus import EventBus
+from src.services.leaderboard_cache import LeaderboardCache
 from src.services.logger import get_logger
+from src.services.redis_service import RedisService
 from src.services.transaction_logger import TransactionLogger
+from src.database.models.transaction_log import DEFAULT_PARTITION
 from utils.embed_builder import EmbedBuilder
 
 logger = get_logger(__name__)
@@ -19,7 +27,11 @@ class SystemTasksCog(commands.Cog):
     
     Automated Tasks:
         - Transaction log cleanup (daily at 3 AM UTC)
-        - Cache refresh for active players (every 5 minutes)
+        - Cache warm-up on player-mutating events (coalesced, 1s window)
+        - Hourly rewarm of recently active players (fallback after restarts)
+        - Daily quest streak view refresh (every 30 minutes)
+        - Weekly transaction log partition pre-creation (4 weeks ahead)
+        - Live leaderboard rebuild on startup, snapshot persist every 15 minutes
     
     Admin Commands:
         - /system status: View system health and metrics
@@ -32,26 +44,82 @@ class SystemTasksCog(commands.Cog):
         - ConfigManager for all intervals
     """
 
+    # Events that change a player's cached resource summary
+    CACHE_WARM_TOPICS = ("summons_completed", "prayer_completed", "fusion_completed", "daily_claimed")
+    CACHE_WARM_WINDOW = 1.0
+    CACHE_WARM_CONCURRENCY = 16
+    # Health checks are reused across /system status calls for this long
+    STATUS_HEALTH_TTL = 30.0
+
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.last_cleanup: datetime | None = None
         self.last_cache_refresh: datetime | None = None
+        self._cleanup_task: asyncio.Task | None = None
+        self._warm_queue: asyncio.Queue[int] = asyncio.Queue()
+        self._warm_task: asyncio.Task | None = None
+        self._health_lock = asyncio.Lock()
+        self._health_cached: tuple[bool, bool] = (False, False)
+        self._health_cached_at: float = float("-inf")
+        # /system trigger aliases -> handler returning the reply embed
+        self._trigger_dispatch: dict[str, Callable[[], Awaitable[discord.Embed]]] = {
+            "cleanup": self._trigger_cleanup,
+            "cleanup_logs": self._trigger_cleanup,
+            "logs": self._trigger_cleanup,
+            "cache": self._trigger_cache_refresh,
+            "cache_refresh": self._trigger_cache_refresh,
+            "refresh": self._trigger_cache_refresh,
+        }
 
     async def cog_load(self):
         """Start background tasks when cog loads."""
         logger.info("Starting SystemTasksCog background tasks...")
-        self.cleanup_transaction_logs.start()
+        self._cleanup_task = asyncio.create_task(self._cleanup_runner())
+        for topic in self.CACHE_WARM_TOPICS:
+            EventBus.subscribe(topic, self._enqueue_cache_warm)
+        self._warm_task = asyncio.create_task(self._cache_warm_consumer())
         self.refresh_active_caches.start()
+        self.refresh_daily_streaks.start()
+        self.ensure_log_partitions.start()
+        self.persist_leaderboards.start()
         logger.info("SystemTasksCog background tasks started successfully")
 
     async def cog_unload(self):
         """Stop background tasks when cog unloads."""
         logger.info("Stopping SystemTasksCog background tasks...")
-        self.cleanup_transaction_logs.cancel()
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+            self._cleanup_task = None
+        if self._warm_task is not None:
+            self._warm_task.cancel()
+            self._warm_task = None
         self.refresh_active_caches.cancel()
+        self.refresh_daily_streaks.cancel()
+        self.ensure_log_partitions.cancel()
+        self.persist_leaderboards.cancel()
         logger.info("SystemTasksCog background tasks stopped")
 
-    @tasks.loop(hours=24)
+    async def _cleanup_runner(self):
+        """
+        Run log cleanup daily at 3 AM UTC.
+        
+        Recomputes the next 3 AM from the wall clock every iteration, so the
+        schedule never drifts the way a fixed 24h interval does.
+        """
+        await self.bot.wait_until_ready()
+        target_hour = 3  # 3 AM UTC
+
+        while True:
+            now = datetime.now(timezone.utc)
+            next_run = now.replace(hour=target_hour, minute=0, second=0, microsecond=0)
+            if now >= next_run:
+                next_run += timedelta(days=1)
+
+            wait_seconds = (next_run - now).total_seconds()
+            logger.info(f"Transaction log cleanup scheduled for {next_run} ({wait_seconds:.0f}s from now)")
+            await asyncio.sleep(wait_seconds)
+            await self.cleanup_transaction_logs()
+
     async def cleanup_transaction_logs(self):
         """
         Clean up old transaction logs daily.
@@ -60,9 +128,9 @@ class SystemTasksCog(commands.Cog):
         """
         try:
             retention_days = ConfigManager.get("resource_system.audit_retention_days", 90)
-            deleted_count = await TransactionLogger.cleanup_old_logs(retention_days)
+            deleted_count = await self._cleanup_logs_in_batches(retention_days)
 
-            self.last_cleanup = datetime.utcnow()
+            self.last_cleanup = datetime.now(timezone.utc)
             logger.info(
                 f"Transaction log cleanup completed: {deleted_count} logs deleted "
                 f"(>{retention_days} days old)"
@@ -71,32 +139,88 @@ class SystemTasksCog(commands.Cog):
         except Exception as e:
             logger.error(f"Transaction log cleanup failed: {e}", exc_info=True)
 
-    @cleanup_transaction_logs.before_loop
-    async def before_cleanup(self):
-        """Wait until 3 AM UTC to start cleanup task."""
-        await self.bot.wait_until_ready()
-
-        now = datetime.utcnow()
-        target_hour = 3  # 3 AM UTC
-        if now.hour >= target_hour:
-            next_run = now.replace(hour=target_hour, minute=0, second=0, microsecond=0) + timedelta(days=1)
-        else:
-            next_run = now.replace(hour=target_hour, minute=0, second=0, microsecond=0)
-
-        wait_seconds = (next_run - now).total_seconds()
-        logger.info(f"Transaction log cleanup scheduled for {next_run} UTC ({wait_seconds:.0f}s from now)")
-        await discord.utils.sleep_until(next_run)
-
-    @tasks.loop(minutes=5)
+    async def _cleanup_logs_in_batches(self, retention_days: int) -> int:
+        """
+        Delete expired logs in short per-batch transactions.
+        
+        Keeps row locks and WAL bursts small on transaction_logs and yields to
+        the event loop between batches so commands are not starved.
+        
+        Expired weekly partitions are dropped first; the batched DELETE then
+        only sweeps the default partition (or the whole table if it was
+        created before partitioning).
+        """
+        dropped = await TransactionLogger.drop_expired_partitions(retention_days)
+        table_name = None if dropped is None else DEFAULT_PARTITION
+
+        batch_size = ConfigManager.get("resource_system.audit_cleanup_batch_size", 5000)
+        total = 0
+        while True:
+            deleted = await TransactionLogger.cleanup_old_logs(
+                retention_days, limit=batch_size, table_name=table_name
+            )
+            total += deleted
+            if deleted < batch_size:
+                return total
+            await asyncio.sleep(0.1)
+
+    def _enqueue_cache_warm(self, payload: dict) -> None:
+        """EventBus listener; just queues the id so publishers are never slowed."""
+        player_id = payload.get("player_id")
+        if player_id is not None:
+            self._warm_queue.put_nowait(player_id)
+
+    async def _cache_warm_consumer(self):
+        """
+        Drain warm requests, coalescing duplicates over a short window.
+        
+        A burst of events for the same player becomes a single warm, and
+        distinct players are warmed concurrently under a small semaphore.
+        """
+        semaphore = asyncio.Semaphore(self.CACHE_WARM_CONCURRENCY)
+
+        async def _warm(player_id: int):
+            async with semaphore:
+                try:
+                    await CacheService.warm(player_id)
+                except Exception as e:
+                    logger.error(f"Cache warm failed for {player_id}: {e}")
+
+        while True:
+            pending = {await self._warm_queue.get()}
+            await asyncio.sleep(self.CACHE_WARM_WINDOW)
+            while not self._warm_queue.empty():
+                pending.add(self._warm_queue.get_nowait())
+
+            await asyncio.gather(*(_warm(player_id) for player_id in pending))
+            self.last_cache_refresh = datetime.now(timezone.utc)
+            logger.debug(f"Cache warm completed for {len(pending)} players")
+
+    @tasks.loop(hours=1)
     async def refresh_active_caches(self):
         """
-        Refresh caches for active players periodically.
+        Rewarm caches for recently active players.
         
-        Runs every 5 minutes. Keeps frequently accessed data warm in Redis.
+        Fallback for the event-driven path: repopulates Redis after restarts
+        or flushes by queueing everyone active in the last hour.
         """
         try:
-            self.last_cache_refresh = datetime.utcnow()
-            logger.debug("Cache refresh completed (placeholder for active player refresh logic)")
+            from sqlalchemy import select
+            from src.database.models.player import Player
+
+            # last_active is stored as naive UTC
+            since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=1)
+            async with DatabaseService.get_readonly_session() as session:
+                result = await session.execute(
+                    select(Player.discord_id).where(Player.last_active >= since)
+                )
+                player_ids = result.scalars().all()
+
+            for player_id in player_ids:
+                self._warm_queue.put_nowait(player_id)
+
+            self.last_cache_refresh = datetime.now(timezone.utc)
+            logger.debug(f"Queued {len(player_ids)} active players for cache rewarm")
 
         except Exception as e:
             logger.error(f"Cache refresh failed: {e}", exc_info=True)
@@ -106,6 +230,52 @@ class SystemTasksCog(commands.Cog):
         """Wait until bot ready before starting cache refresh."""
         await self.bot.wait_until_ready()
 
+    @tasks.loop(hours=168)
+    async def ensure_log_partitions(self):
+        """Keep weekly transaction_logs partitions created 4 weeks ahead."""
+        try:
+            await TransactionLogger.ensure_partitions(weeks_ahead=4)
+        except Exception as e:
+            logger.error(f"Transaction log partition creation failed: {e}", exc_info=True)
+
+    @ensure_log_partitions.before_loop
+    async def before_partition_check(self):
+        """Wait until bot ready before touching transaction_logs DDL."""
+        await self.bot.wait_until_ready()
+
+    @tasks.loop(minutes=15)
+    async def persist_leaderboards(self):
+        """Persist live Redis leaderboards into LeaderboardSnapshot."""
+        try:
+            await LeaderboardCache.persist_snapshots()
+        except Exception as e:
+            logger.error(f"Leaderboard snapshot persist failed: {e}", exc_info=True)
+
+    @persist_leaderboards.before_loop
+    async def before_leaderboard_persist(self):
+        """Wait until bot ready, then rebuild the live leaderboards from the database."""
+        await self.bot.wait_until_ready()
+        try:
+            await LeaderboardCache.rebuild_all()
+        except Exception as e:
+            logger.error(f"Leaderboard rebuild failed: {e}", exc_info=True)
+
+    @tasks.loop(minutes=30)
+    async def refresh_daily_streaks(self):
+        """Refresh the daily quest streak materialized view."""
+        try:
+            async with DatabaseService.get_transaction() as session:
+                await DailyService.refresh_streak_view(session)
+            logger.debug("Daily quest streak view refreshed")
+
+        except Exception as e:
+            logger.error(f"Daily streak view refresh failed: {e}", exc_info=True)
+
+    @refresh_daily_streaks.before_loop
+    async def before_streak_refresh(self):
+        """Wait until bot ready before refreshing streak view."""
+        await self.bot.wait_until_ready()
+
     @commands.hybrid_group(name="system", description="System administration commands")
     @commands.has_permissions(administrator=True)
     async def system(self, ctx: commands.Context):
@@ -113,24 +283,43 @@ class SystemTasksCog(commands.Cog):
         if ctx.invoked_subcommand is None:
             await ctx.send_help(ctx.command)
 
+    async def _get_health(self) -> tuple[bool, bool]:
+        """
+        (redis_healthy, db_healthy), memoized for STATUS_HEALTH_TTL seconds.
+        
+        Single-flight: concurrent callers wait on the lock and reuse the
+        result of whichever call refreshed it.
+        """
+        async with self._health_lock:
+            if time.monotonic() - self._health_cached_at >= self.STATUS_HEALTH_TTL:
+                results = await asyncio.gather(
+                    RedisService.health_check(),
+                    DatabaseService.health_check(),
+                    return_exceptions=True
+                )
+                # A check that raised counts as unhealthy rather than failing the command
+                redis_healthy, db_healthy = (r is True for r in results)
+                self._health_cached = (redis_healthy, db_healthy)
+                self._health_cached_at = time.monotonic()
+            return self._health_cached
+
     @system.command(name="status", description="View system health and metrics")
     @commands.has_permissions(administrator=True)
     async def status(self, ctx: commands.Context):
         """Display system status and metrics."""
         await ctx.defer(ephemeral=True)
         try:
-            from src.services.redis_service import RedisService
-            redis_healthy = await RedisService.health_check()
-            db_healthy = await DatabaseService.health_check()
+            redis_healthy, db_healthy = await self._get_health()
 
             cache_metrics = CacheService.get_metrics()
             hit_rate = CacheService.get_hit_rate()
+            per_cache = CacheService.get_cache_hit_rates(limit=5)
 
             embed = discord.Embed(
                 title="🔧 System Status",
                 description="Current system health and performance metrics",
                 color=0x2c2d31,
-                timestamp=datetime.utcnow()
+                timestamp=datetime.now(timezone.utc)
             )
 
             embed.add_field(
@@ -156,13 +345,24 @@ class SystemTasksCog(commands.Cog):
                 inline=False
             )
 
+            if per_cache:
+                embed.add_field(
+                    name="🗂️ Per-Cache Hit Rate",
+                    value="\n".join(
+                        f"**{name}:** {rate:.1f}% ({lookups:,} lookups)"
+                        for name, lookups, rate in per_cache
+                    ),
+                    inline=False
+                )
+
             embed.add_field(
                 name="🧹 Background Tasks",
                 value=(
-                    f"**Log Cleanup:** {'✅ Running' if self.cleanup_transaction_logs.is_running() else '❌ Stopped'}\n"
+                    f"**Log Cleanup:** {'✅ Running' if self._cleanup_task and not self._cleanup_task.done() else '❌ Stopped'}\n"
                     f"**Last Run:** {self.last_cleanup.strftime('%Y-%m-%d %H:%M UTC') if self.last_cleanup else 'Never'}\n"
                     f"**Cache Refresh:** {'✅ Running' if self.refresh_active_caches.is_running() else '❌ Stopped'}\n"
-                    f"**Last Run:** {self.last_cache_refresh.strftime('%Y-%m-%d %H:%M UTC') if self.last_cache_refresh else 'Never'}"
+                    f"**Last Run:** {self.last_cache_refresh.strftime('%Y-%m-%d %H:%M UTC') if self.last_cache_refresh else 'Never'}\n"
+                    f"**Streak View:** {'✅ Running' if self.refresh_daily_streaks.is_running() else '❌ Stopped'}"
                 ),
                 inline=False
             )
@@ -186,6 +386,28 @@ class SystemTasksCog(commands.Cog):
             )
             await ctx.send(embed=embed, ephemeral=True)
 
+    async def _trigger_cleanup(self) -> discord.Embed:
+        """Run transaction log cleanup now."""
+        retention_days = ConfigManager.get("resource_system.audit_retention_days", 90)
+        deleted = await self._cleanup_logs_in_batches(retention_days)
+        return EmbedBuilder.success(
+            title="Task Triggered",
+            description=(
+                f"Transaction log cleanup executed manually.\n"
+                f"Deleted {deleted} logs older than retention period."
+            ),
+            footer=f"Last cleanup: {self.last_cleanup.strftime('%Y-%m-%d %H:%M UTC') if self.last_cleanup else 'Just now'}"
+        )
+
+    async def _trigger_cache_refresh(self) -> discord.Embed:
+        """Queue active players for cache rewarm now."""
+        await self.refresh_active_caches()
+        return EmbedBuilder.success(
+            title="Task Triggered",
+            description="Cache refresh executed manually.\nActive player caches updated.",
+            footer=f"Last refresh: {self.last_cache_refresh.strftime('%Y-%m-%d %H:%M UTC') if self.last_cache_refresh else 'Just now'}"
+        )
+
     @system.command(name="trigger", description="Manually trigger a background task")
     @commands.has_permissions(administrator=True)
     async def trigger(self, ctx: commands.Context, task: str):
@@ -197,26 +419,9 @@ class SystemTasksCog(commands.Cog):
         """
         await ctx.defer(ephemeral=True)
         try:
-            task_name = task.lower()
-            if task_name in ["cleanup", "cleanup_logs", "logs"]:
-                deleted = await TransactionLogger.cleanup_old_logs()
-                embed = EmbedBuilder.success(
-                    title="Task Triggered",
-                    description=(
-                        f"Transaction log cleanup executed manually.\n"
-                        f"Deleted {deleted} logs older than retention period."
-                    ),
-                    footer=f"Last cleanup: {self.last_cleanup.strftime('%Y-%m-%d %H:%M UTC') if self.last_cleanup else 'Just now'}"
-                )
-
-            elif task_name in ["cache", "cache_refresh", "refresh"]:
-                await self.refresh_active_caches()
-                embed = EmbedBuilder.success(
-                    title="Task Triggered",
-                    description="Cache refresh executed manually.\nActive player caches updated.",
-                    footer=f"Last refresh: {self.last_cache_refresh.strftime('%Y-%m-%d %H:%M UTC') if self.last_cache_refresh else 'Just now'}"
-                )
-
+            handler = self._trigger_dispatch.get(task.strip().lower())
+            if handler is not None:
+                embed = await handler()
             else:
                 embed = EmbedBuilder.error(
                     title="Unknown Task",
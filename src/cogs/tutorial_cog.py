@@ -1,5 +1,7 @@
 import discord
 from discord.ext import commands
+from functools import partial
+from typing import Any, Dict, NamedTuple, Optional
 
 from src.services.database_service import DatabaseService
 from src.services.player_service import PlayerService
@@ -11,22 +13,38 @@ from utils.embed_builder import EmbedBuilder
 logger = get_logger(__name__)
 
 
+class TutorialEvent(NamedTuple):
+    """The two payload fields the tutorial handler needs, coerced once."""
+    player_id: int
+    channel_id: int
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> Optional["TutorialEvent"]:
+        player_id = payload.get("player_id")
+        channel_id = payload.get("channel_id")
+        if not player_id or not channel_id:
+            return None
+        return cls(int(player_id), int(channel_id))
+
+
 class TutorialCog(commands.Cog):
     """
     Reacts to gameplay events and announces tangible tutorial completions.
-    Sends a public embed, followed by a plain text reward line.
+    Sends a public embed with the plain text reward line in a single message.
     """
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
     async def cog_load(self):
-        # Subscribe to all tutorial triggers
-        for topic in TRIGGER_INDEX.keys():
-            EventBus.subscribe(topic, self._handle_event)
+        # One bound handler per trigger topic: the step is resolved at subscribe time
+        for topic, step in TRIGGER_INDEX.items():
+            EventBus.subscribe(topic, partial(self._handle_event_bound, step=step))
 
-    async def _handle_event(self, payload: dict):
+    async def _handle_event_bound(self, payload: dict, *, step: Dict[str, Any]):
         """
+        Complete ``step`` for the player in the payload and announce it.
+
         Expected payload:
         {
           "player_id": int,
@@ -35,26 +53,13 @@ class TutorialCog(commands.Cog):
         }
         """
         try:
-            player_id = payload.get("player_id")
-            channel_id = payload.get("channel_id")
-            topic = payload.get("topic") or payload.get("event")  # optional
-
-            # Best effort: infer topic from subscription by checking fields we got
-            # EventBus should give us the topic; if not, payload should imply it by caller convention.
-            if not player_id or not channel_id:
-                return
-
-            # Determine which step to complete from topic name; fallback to payload-provided.
-            # We pass the topic explicitly on publish in all cogs, so rely on that:
-            trigger = payload.get("__topic__") or topic or payload.get("trigger")
-            # If not provided, try a smart guess: the handler was bound to a specific topic per subscribe.
-            # For simplicity, check common keys by presence:
-            if not trigger:
-                # No strong inference -> bail quietly
+            event = TutorialEvent.from_payload(payload)
+            if event is None:
                 return
+            player_id = event.player_id
 
-            step = TRIGGER_INDEX.get(trigger)
-            if not step:
+            # Finished steps short-circuit before the row lock and regen
+            if step["key"] in await TutorialService.get_completed_steps(player_id):
                 return
 
             async with DatabaseService.get_transaction() as session:
@@ -63,10 +68,13 @@ class TutorialCog(commands.Cog):
                     return
 
                 done = await TutorialService.complete_step(session, player, step["key"])
-                if not done:
-                    return  # already completed or invalid
 
-            channel = self.bot.get_channel(int(channel_id))
+            # Only after commit, so a rolled-back grant is retried on the next event
+            TutorialService.remember_completed(player_id, step["key"])
+            if not done:
+                return  # already completed or invalid
+
+            channel = self.bot.get_channel(event.channel_id)
             if not channel:
                 return
 
@@ -76,18 +84,18 @@ class TutorialCog(commands.Cog):
                 description=done["congrats"],
                 footer="Keep going — complete all steps for starter boosts!"
             )
-            await channel.send(embed=embed)
 
-            # Plain text reward message (no embed)
+            # Plain text reward line rides on the same message (one REST call)
             rikis = done["reward"].get("rikis", 0)
             grace = done["reward"].get("grace", 0)
-            if rikis or grace:
-                parts = []
-                if rikis:
-                    parts.append(f"+{rikis} rikis")
-                if grace:
-                    parts.append(f"+{grace} grace")
-                await channel.send(f"You received {' and '.join(parts)} as a tutorial reward!")
+            parts = []
+            if rikis:
+                parts.append(f"+{rikis} rikis")
+            if grace:
+                parts.append(f"+{grace} grace")
+            content = f"You received {' and '.join(parts)} as a tutorial reward!" if parts else None
+
+            await channel.send(content=content, embed=embed)
 
         except Exception as e:
             logger.error(f"Tutorial event handling failed: {e}", exc_info=True)
@@ -1,23 +1,50 @@
-from .player import Player
-from .maiden import Maiden
-from .maiden_base import MaidenBase
-from .game_config import GameConfig
-from .daily_quest import DailyQuest
-from .leaderboard import LeaderboardSnapshot
-from .transaction_log import TransactionLog
-from .tutorial import Tutorial
-from .sector_progress import SectorProgress
-from .ascension_progress import AscensionProgress
-
-__all__ = [
-    "Player",
-    "Maiden",
-    "MaidenBase",
-    "GameConfig",
-    "DailyQuest",
-    "LeaderboardSnapshot",
-    "TransactionLog",
-    "Tutorial",
-    "SectorProgress",
-    "AscensionProgress",
-]
+"""
+Database models package.
+
+Models are resolved lazily on first attribute access so importing one
+model (or the package itself) does not execute every table module.
+Call load_all() before touching SQLModel.metadata as a whole.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Dict, Tuple
+
+# Public name -> (submodule, class name)
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "Player": ("player", "Player"),
+    "Maiden": ("maiden", "Maiden"),
+    "MaidenBase": ("maiden_base", "MaidenBase"),
+    "GameConfig": ("game_config", "GameConfig"),
+    "DailyQuest": ("daily_quest", "DailyQuest"),
+    "LeaderboardSnapshot": ("leaderboard", "LeaderboardSnapshot"),
+    "TransactionLog": ("transaction_log", "TransactionLog"),
+    "TutorialProgress": ("tutorial", "TutorialProgress"),
+    "Tutorial": ("tutorial", "TutorialProgress"),
+    "SectorProgress": ("sector_progress", "SectorProgress"),
+    "AscensionProgress": ("ascension_progress", "AscensionProgress"),
+}
+
+__all__ = [*_LAZY, "load_all"]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
+
+
+def load_all() -> None:
+    """Import every model module so all tables are registered on SQLModel.metadata."""
+    for name in _LAZY:
+        __getattr__(name)
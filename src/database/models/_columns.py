@@ -0,0 +1,28 @@
+"""Column factories shared by the table models."""
+
+from sqlalchemy import BigInteger, Column, DateTime, text
+
+
+# Naive UTC, matching the datetime.utcnow() values the rest of the code compares against
+UTC_NOW = text("timezone('utc', now())")
+
+
+def utc_timestamp_column(primary_key: bool = False) -> Column:
+    """
+    Non-null timestamp filled by Postgres at insert time.
+    
+    Pair with ``Field(default=None, ...)``: the ORM omits None from the
+    INSERT so the server default applies, and models set
+    ``eager_defaults`` to read the value back via RETURNING.
+    """
+    return Column(DateTime, nullable=False, primary_key=primary_key, server_default=UTC_NOW)
+
+
+def counter_column() -> Column:
+    """
+    Non-null BIGINT counter starting at zero.
+    
+    The server default also backfills existing rows when the column is
+    added with ALTER TABLE ... ADD COLUMN.
+    """
+    return Column(BigInteger, nullable=False, server_default=text("0"))
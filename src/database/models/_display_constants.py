@@ -0,0 +1,31 @@
+"""Read-only display tables and formatters shared by the table models."""
+
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+
+# "Tier 1".."Tier 6", then roman numerals for the high tiers
+TIER_LABELS: Tuple[str, ...] = tuple(f"Tier {n}" for n in range(1, 7)) + tuple(
+    f"Tier {r}" for r in ("VII", "VIII", "IX", "X", "XI", "XII")
+)
+
+ELEMENT_EMOJI: Mapping[str, str] = MappingProxyType({
+    "infernal": "🔥", "umbral": "🌑", "earth": "🌍",
+    "tempest": "⚡", "radiant": "✨", "abyssal": "🌊"
+})
+
+RARITY_NAMES: Mapping[int, str] = MappingProxyType({
+    1: "Common", 2: "Common", 3: "Uncommon",
+    4: "Uncommon", 5: "Rare", 6: "Rare",
+    7: "Epic", 8: "Epic", 9: "Legendary",
+    10: "Legendary", 11: "Mythic", 12: "Mythic"
+})
+
+
+def compact_number(value: int) -> str:
+    """Format a count with K/M abbreviations (1234 -> '1.2K', 2500000 -> '2.5M')."""
+    if value >= 1_000_000:
+        return f"{value / 1_000_000:.1f}M"
+    if value >= 1_000:
+        return f"{value / 1_000:.1f}K"
+    return str(value)
@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import BigInteger, Index
+from sqlalchemy import BigInteger, DateTime, Index, func
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
 
 
@@ -24,19 +25,28 @@ class AscensionProgress(SQLModel, table=True):
         total_xp_earned: Cumulative XP from floors
         last_attempt: Timestamp of most recent attempt
         last_victory: Timestamp of most recent floor clear
+        pending_enemy: Enemy snapshot from the open attempt, cleared on resolve
     
     Indexes:
         - player_id (unique)
-        - highest_floor for leaderboards
-        - last_attempt for activity tracking
+        - highest_floor covering (player_id, current_floor, victories, attempts)
+          for index-only leaderboard scans
+        - last_attempt covering (player_id, current_floor) for activity tracking
     """
     
     __tablename__ = "ascension_progress"
     __table_args__ = (
         Index("ix_ascension_progress_player", "player_id", unique=True),
-        Index("ix_ascension_progress_highest_floor", "highest_floor"),
-        Index("ix_ascension_progress_last_attempt", "last_attempt"),
+        Index(
+            "ix_ascension_progress_highest_floor", "highest_floor",
+            postgresql_include=["player_id", "current_floor", "total_victories", "total_attempts"]
+        ),
+        Index(
+            "ix_ascension_progress_last_attempt", "last_attempt",
+            postgresql_include=["player_id", "current_floor"]
+        ),
     )
+    __mapper_args__ = {"eager_defaults": True}
     
     id: Optional[int] = Field(default=None, primary_key=True)
     player_id: int = Field(
@@ -45,7 +55,7 @@ class AscensionProgress(SQLModel, table=True):
     )
     
     current_floor: int = Field(default=0, ge=0)
-    highest_floor: int = Field(default=0, ge=0, index=True)
+    highest_floor: int = Field(default=0, ge=0)
     
     total_floors_cleared: int = Field(default=0, ge=0)
     total_attempts: int = Field(default=0, ge=0)
@@ -55,9 +65,16 @@ class AscensionProgress(SQLModel, table=True):
     total_rikis_earned: int = Field(default=0, ge=0, sa_column=Column(BigInteger))
     total_xp_earned: int = Field(default=0, ge=0, sa_column=Column(BigInteger))
     
-    last_attempt: Optional[datetime] = Field(default=None, index=True)
+    last_attempt: Optional[datetime] = Field(default=None)
     last_victory: Optional[datetime] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    pending_enemy: Optional[Dict[str, Any]] = Field(
+        default=None,
+        sa_column=Column(JSONB, nullable=True)
+    )
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
     
     def get_win_rate(self) -> float:
         """Calculate win rate percentage."""
@@ -1,10 +1,29 @@
 from typing import Optional, Dict
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import BigInteger, Index
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy import DDL, BigInteger, DateTime, Index, SmallInteger, event, func, text
 from datetime import datetime, date
 
 
+# Completion bit per quest type; a finished day has every bit set
+QUEST_BITS: Dict[str, int] = {
+    "prayer_performed": 1 << 0,
+    "summon_maiden": 1 << 1,
+    "attempt_fusion": 1 << 2,
+    "spend_energy": 1 << 3,
+    "spend_stamina": 1 << 4,
+}
+ALL_QUESTS_MASK = 0b11111
+
+# Typed progress column per quest type
+QUEST_PROGRESS_FIELDS: Dict[str, str] = {
+    "prayer_performed": "prayers_done",
+    "summon_maiden": "summons_done",
+    "attempt_fusion": "fusions_attempted",
+    "spend_energy": "energy_spent",
+    "spend_stamina": "stamina_spent",
+}
+
+
 class DailyQuest(SQLModel, table=True):
     """
     Daily quest progress tracking for a player.
@@ -22,19 +41,26 @@ class DailyQuest(SQLModel, table=True):
     Attributes:
         player_id: Owner's Discord ID
         quest_date: Date for this quest set
-        quests_completed: Boolean flags for each quest
-        quest_progress: Integer counters for each quest
+        completed_mask: Completion bitmask (see QUEST_BITS); 31 = all done
+        prayers_done / summons_done / fusions_attempted / energy_spent /
+            stamina_spent: Integer progress counters per quest
         rewards_claimed: Whether rewards have been collected
         bonus_streak: Consecutive days completed (for bonuses)
     
     Indexes:
         - (player_id, quest_date) composite for fast lookups
+        - quest_date partial on completed_mask = 31 ("who finished today")
     """
     
     __tablename__ = "daily_quests"
     __table_args__ = (
         Index("ix_daily_quests_player_date", "player_id", "quest_date"),
+        Index(
+            "ix_daily_quests_completed_date", "quest_date",
+            postgresql_where=text(f"completed_mask = {ALL_QUESTS_MASK}")
+        ),
     )
+    __mapper_args__ = {"eager_defaults": True}
     
     id: Optional[int] = Field(default=None, primary_key=True)
     player_id: int = Field(
@@ -43,48 +69,84 @@ class DailyQuest(SQLModel, table=True):
     )
     quest_date: date = Field(default_factory=date.today, nullable=False, index=True)
     
-    quests_completed: Dict[str, bool] = Field(
-        default_factory=lambda: {
-            "prayer_performed": False,
-            "summon_maiden": False,
-            "attempt_fusion": False,
-            "spend_energy": False,
-            "spend_stamina": False,
-        },
-        sa_column=Column(JSON)
-    )
+    completed_mask: int = Field(default=0, sa_column=Column(SmallInteger, nullable=False, server_default="0"))
     
-    quest_progress: Dict[str, int] = Field(
-        default_factory=lambda: {
-            "prayers_done": 0,
-            "summons_done": 0,
-            "fusions_attempted": 0,
-            "energy_spent": 0,
-            "stamina_spent": 0,
-        },
-        sa_column=Column(JSON)
-    )
+    prayers_done: int = Field(default=0, ge=0)
+    summons_done: int = Field(default=0, ge=0)
+    fusions_attempted: int = Field(default=0, ge=0)
+    energy_spent: int = Field(default=0, ge=0)
+    stamina_spent: int = Field(default=0, ge=0)
     
     rewards_claimed: bool = Field(default=False)
     bonus_streak: int = Field(default=0)
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
+    
+    @property
+    def quests_completed(self) -> Dict[str, bool]:
+        """Completion flags per quest type (derived from completed_mask)."""
+        return {quest: bool(self.completed_mask & bit) for quest, bit in QUEST_BITS.items()}
+    
+    @property
+    def quest_progress(self) -> Dict[str, int]:
+        """Progress counters keyed by progress name."""
+        return {field: getattr(self, field) for field in QUEST_PROGRESS_FIELDS.values()}
+    
+    def is_quest_completed(self, quest_type: str) -> bool:
+        """Check a single quest's completion bit."""
+        return bool(self.completed_mask & QUEST_BITS[quest_type])
+    
+    def mark_completed(self, quest_type: str) -> None:
+        """Set a single quest's completion bit."""
+        self.completed_mask |= QUEST_BITS[quest_type]
     
     def is_complete(self) -> bool:
         """Check if all daily quests are completed."""
-        return all(self.quests_completed.values())
+        return self.completed_mask == ALL_QUESTS_MASK
     
     def get_completion_count(self) -> int:
         """Count how many quests are completed."""
-        return sum(1 for completed in self.quests_completed.values() if completed)
+        return self.completed_mask.bit_count()
     
     def get_completion_percent(self) -> float:
         """Calculate completion percentage (0-100)."""
-        total = len(self.quests_completed)
-        completed = self.get_completion_count()
-        return (completed / total) * 100 if total > 0 else 0.0
+        return (self.get_completion_count() / len(QUEST_BITS)) * 100
     
     def __repr__(self) -> str:
         return (
             f"<DailyQuest(player={self.player_id}, date={self.quest_date}, "
             f"complete={self.is_complete()}, streak={self.bonus_streak})>"
-        )
\ No newline at end of file
+        )
+
+
+# Weekly streak/completion rollup, refreshed by SystemTasksCog instead of
+# aggregating daily rows per leaderboard read
+STREAKS_VIEW = "daily_quest_streaks_mv"
+_COMPLETED_COUNT_SQL = " + ".join(
+    f"((completed_mask & {bit}) <> 0)::int" for bit in QUEST_BITS.values()
+)
+
+event.listen(
+    DailyQuest.__table__,
+    "after_create",
+    DDL(
+        f"CREATE MATERIALIZED VIEW IF NOT EXISTS {STREAKS_VIEW} AS "
+        f"SELECT player_id, MAX(bonus_streak) AS best_streak, "
+        f"SUM({_COMPLETED_COUNT_SQL}) AS week_total "
+        f"FROM daily_quests WHERE quest_date > current_date - 7 "
+        f"GROUP BY player_id"
+    )
+)
+# Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+event.listen(
+    DailyQuest.__table__,
+    "after_create",
+    DDL(f"CREATE UNIQUE INDEX IF NOT EXISTS ix_{STREAKS_VIEW}_player ON {STREAKS_VIEW} (player_id)")
+)
+event.listen(
+    DailyQuest.__table__,
+    "before_drop",
+    DDL(f"DROP MATERIALIZED VIEW IF EXISTS {STREAKS_VIEW}")
+)
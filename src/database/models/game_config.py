@@ -1,6 +1,6 @@
 from typing import Optional, Any, Dict
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import String
+from sqlalchemy import DateTime, String, func
 from sqlalchemy.dialects.postgresql import JSON
 from datetime import datetime
 
@@ -21,6 +21,7 @@ class GameConfig(SQLModel, table=True):
     """
     
     __tablename__ = "game_config"
+    __mapper_args__ = {"eager_defaults": True}
     
     id: Optional[int] = Field(default=None, primary_key=True)
     config_key: str = Field(
@@ -33,7 +34,10 @@ class GameConfig(SQLModel, table=True):
     config_value: Dict[str, Any] = Field(sa_column=Column(JSON), nullable=False)
     description: str = Field(default="", max_length=500)
     
-    last_modified: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    last_modified: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
     modified_by: Optional[str] = Field(default=None, max_length=100)
     
     def __repr__(self) -> str:
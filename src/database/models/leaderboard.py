@@ -1,8 +1,17 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import BigInteger, Index
+from sqlalchemy import BigInteger, Index, String, delete, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
+from ._columns import utc_timestamp_column
+from ._display_constants import compact_number
+
+
+_MEDALS = {1: "🥇 #1", 2: "🥈 #2", 3: "🥉 #3"}
+_NO_RANK_CHANGE = "➡️ 0"
+_BULK_CHUNK_SIZE = 10_000
+
 
 class LeaderboardSnapshot(SQLModel, table=True):
     """
@@ -18,56 +27,99 @@ class LeaderboardSnapshot(SQLModel, table=True):
         rank: Current ranking position
         rank_change: Change since last snapshot (positive = moving up)
         value: The actual value being ranked
+        value_display: value pre-formatted with K/M abbreviations at snapshot time
         snapshot_version: Version counter for this leaderboard generation
         updated_at: When this snapshot was taken
     
     Indexes:
-        - (category, rank) for fast leaderboard queries
+        - (category, rank) INCLUDE display fields for index-only leaderboard scans
+          (also serves category-only filters)
         - player_id for player-specific lookups
         - updated_at for cleanup of old snapshots
     """
     
     __tablename__ = "leaderboard_snapshots"
     __table_args__ = (
-        Index("ix_leaderboard_category_rank", "category", "rank"),
+        Index(
+            "ix_leaderboard_category_rank_cov", "category", "rank",
+            postgresql_include=["player_id", "username", "value", "value_display", "rank_change"]
+        ),
         Index("ix_leaderboard_player", "player_id"),
         Index("ix_leaderboard_updated", "updated_at"),
     )
+    __mapper_args__ = {"eager_defaults": True}
     
     id: Optional[int] = Field(default=None, primary_key=True)
     player_id: int = Field(
-        sa_column=Column(BigInteger, nullable=False, index=True),
+        sa_column=Column(BigInteger, nullable=False),
         foreign_key="players.discord_id"
     )
     username: str = Field(max_length=100)
     
-    category: str = Field(max_length=50, nullable=False, index=True)
-    rank: int = Field(nullable=False, index=True)
+    category: str = Field(max_length=50, nullable=False)
+    rank: int = Field(nullable=False)
     rank_change: int = Field(default=0)
     value: int = Field(sa_column=Column(BigInteger), nullable=False)
+    value_display: str = Field(
+        default="",
+        sa_column=Column(String(16), nullable=False, server_default=text("''"))
+    )
     
     snapshot_version: int = Field(default=1)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False, index=True)
+    updated_at: Optional[datetime] = Field(default=None, sa_column=utc_timestamp_column())
+    
+    @classmethod
+    async def bulk_replace(
+        cls,
+        session: AsyncSession,
+        category: str,
+        rows: List[Dict[str, Any]],
+        chunk_size: int = _BULK_CHUNK_SIZE
+    ) -> int:
+        """
+        Replace every snapshot row for a category in one pass.
+        
+        Deletes the old generation, then inserts the new rows as Core
+        executemany batches of chunk_size, bypassing the identity map and
+        per-row flushes. Runs inside the caller's transaction, so readers
+        never see a half-built leaderboard.
+        
+        Args:
+            session: Database session (must be part of active transaction)
+            category: Leaderboard type being regenerated
+            rows: Dicts with player_id, username, rank, value and optionally
+                rank_change / snapshot_version / value_display (derived from
+                value when omitted)
+            chunk_size: Rows per INSERT round-trip
+        
+        Returns:
+            Number of rows inserted
+        """
+        await session.execute(delete(cls).where(cls.category == category))
+        
+        # Core inserts skip SQLModel defaults; updated_at comes from the server default
+        defaults = {"category": category, "rank_change": 0, "snapshot_version": 1}
+        stmt = insert(cls.__table__)
+        
+        for start in range(0, len(rows), chunk_size):
+            chunk = [
+                {**defaults, "value_display": compact_number(row["value"]), **row}
+                for row in rows[start:start + chunk_size]
+            ]
+            await session.execute(stmt, chunk)
+        
+        return len(rows)
     
     def get_rank_display(self) -> str:
         """Format rank with medal emojis for top 3."""
-        if self.rank == 1:
-            return "🥇 #1"
-        elif self.rank == 2:
-            return "🥈 #2"
-        elif self.rank == 3:
-            return "🥉 #3"
-        else:
-            return f"#{self.rank}"
+        return _MEDALS.get(self.rank) or f"#{self.rank}"
     
     def get_rank_change_display(self) -> str:
         """Format rank change with directional indicators."""
-        if self.rank_change > 0:
-            return f"📈 +{self.rank_change}"
-        elif self.rank_change < 0:
-            return f"📉 {self.rank_change}"
-        else:
-            return "➡️ 0"
+        change = self.rank_change
+        if not change:
+            return _NO_RANK_CHANGE
+        return f"📈 +{change}" if change > 0 else f"📉 {change}"
     
     def __repr__(self) -> str:
         return (
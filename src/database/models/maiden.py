@@ -1,8 +1,11 @@
 from typing import Optional
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import BigInteger, Index, String, UniqueConstraint
+from sqlalchemy import DDL, BigInteger, Index, String, UniqueConstraint, event, text
 from datetime import datetime
 
+from ._columns import utc_timestamp_column
+from ._display_constants import ELEMENT_EMOJI, TIER_LABELS
+
 
 class Maiden(SQLModel, table=True):
     """
@@ -23,47 +26,46 @@ class Maiden(SQLModel, table=True):
         (player_id, maiden_base_id, tier) - prevents duplicate stacks
     
     Indexes:
-        - player_id
+        - player_id via the unique constraint's leading column
         - maiden_base_id
-        - tier
         - element
-        - (player_id, tier, quantity) for fusion queries
+        - (player_id, tier) partial on quantity >= 2 AND tier < 12 for fusion queries
     """
     
     __tablename__ = "maidens"
     __table_args__ = (
         UniqueConstraint("player_id", "maiden_base_id", "tier", name="uq_player_maiden_tier"),
-        Index("ix_maidens_player_id", "player_id"),
         Index("ix_maidens_base_id", "maiden_base_id"),
-        Index("ix_maidens_tier", "tier"),
         Index("ix_maidens_element", "element"),
-        Index("ix_maidens_fusable", "player_id", "tier", "quantity"),
+        Index(
+            "ix_maidens_fusable_partial", "player_id", "tier",
+            postgresql_where=text("quantity >= 2 AND tier < 12")
+        ),
     )
+    __mapper_args__ = {"eager_defaults": True}
     
     id: Optional[int] = Field(default=None, primary_key=True)
     player_id: int = Field(
-        sa_column=Column(BigInteger, nullable=False, index=True),
+        sa_column=Column(BigInteger, nullable=False),
         foreign_key="players.discord_id"
     )
-    maiden_base_id: int = Field(foreign_key="maiden_bases.id", nullable=False, index=True)
+    maiden_base_id: int = Field(foreign_key="maiden_bases.id", nullable=False)
     
     quantity: int = Field(default=1, ge=0, sa_column=Column(BigInteger))
-    tier: int = Field(default=1, ge=1, le=12, index=True)
+    tier: int = Field(default=1, ge=1, le=12)
     
     element: str = Field(sa_column=Column(String(20)), nullable=False, index=True)
     
-    acquired_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    last_modified: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    acquired_at: Optional[datetime] = Field(default=None, sa_column=utc_timestamp_column())
+    last_modified: Optional[datetime] = Field(default=None, sa_column=utc_timestamp_column())
     
     acquired_from: str = Field(default="summon", max_length=50)
     times_fused: int = Field(default=0, ge=0)
     
     def get_tier_display(self) -> str:
         """Format tier as 'Tier N' or 'Tier VII' for high tiers."""
-        if self.tier <= 6:
-            return f"Tier {self.tier}"
-        roman = ["VII", "VIII", "IX", "X", "XI", "XII"]
-        return f"Tier {roman[self.tier - 7]}" if self.tier <= 12 else f"Tier {self.tier}"
+        tier = self.tier
+        return TIER_LABELS[tier - 1] if 1 <= tier <= 12 else f"Tier {tier}"
     
     def get_stack_display(self) -> str:
         """Format tier with quantity indicator (e.g., 'Tier 3 ×5')."""
@@ -80,11 +82,7 @@ class Maiden(SQLModel, table=True):
     
     def get_element_emoji(self) -> str:
         """Get emoji representation of maiden's element."""
-        emojis = {
-            "infernal": "🔥", "umbral": "🌑", "earth": "🌍",
-            "tempest": "⚡", "radiant": "✨", "abyssal": "🌊"
-        }
-        return emojis.get(self.element, "❓")
+        return ELEMENT_EMOJI.get(self.element, "❓")
     
     def update_modification_time(self) -> None:
         """Update last_modified timestamp to current time."""
@@ -94,4 +92,12 @@ class Maiden(SQLModel, table=True):
         return (
             f"<Maiden(id={self.id}, player={self.player_id}, "
             f"base={self.maiden_base_id}, T{self.tier}, qty={self.quantity})>"
-        )
\ No newline at end of file
+        )
+
+
+# Updated on nearly every command: leave page headroom so updates stay HOT
+event.listen(
+    Maiden.__table__,
+    "after_create",
+    DDL("ALTER TABLE maidens SET (fillfactor = 70)")
+)
@@ -3,6 +3,8 @@ from sqlmodel import SQLModel, Field, Column
 from sqlalchemy import Index, String, Text
 from sqlalchemy.dialects.postgresql import JSON
 
+from ._display_constants import ELEMENT_EMOJI, RARITY_NAMES, TIER_LABELS
+
 
 class MaidenBase(SQLModel, table=True):
     """
@@ -58,28 +60,16 @@ class MaidenBase(SQLModel, table=True):
     
     def get_tier_display(self) -> str:
         """Format base tier as 'Tier N' or 'Tier VII' for high tiers."""
-        if self.base_tier <= 6:
-            return f"Tier {self.base_tier}"
-        roman = ["VII", "VIII", "IX", "X", "XI", "XII"]
-        return f"Tier {roman[self.base_tier - 7]}" if self.base_tier <= 12 else f"Tier {self.base_tier}"
+        tier = self.base_tier
+        return TIER_LABELS[tier - 1] if 1 <= tier <= 12 else f"Tier {tier}"
     
     def get_element_emoji(self) -> str:
         """Get emoji representation of maiden's element."""
-        emojis = {
-            "infernal": "🔥", "umbral": "🌑", "earth": "🌍",
-            "tempest": "⚡", "radiant": "✨", "abyssal": "🌊"
-        }
-        return emojis.get(self.element, "❓")
+        return ELEMENT_EMOJI.get(self.element, "❓")
     
     def get_rarity_tier_name(self) -> str:
         """Get human-readable rarity name based on base tier."""
-        rarity_names = {
-            1: "Common", 2: "Common", 3: "Uncommon",
-            4: "Uncommon", 5: "Rare", 6: "Rare",
-            7: "Epic", 8: "Epic", 9: "Legendary",
-            10: "Legendary", 11: "Mythic", 12: "Mythic"
-        }
-        return rarity_names.get(self.base_tier, "Unknown")
+        return RARITY_NAMES.get(self.base_tier, "Unknown")
     
     def has_leader_effect(self) -> bool:
         """Check if this maiden has a leader effect defined."""
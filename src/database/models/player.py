@@ -1,8 +1,49 @@
 from typing import Optional, Dict
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import BigInteger, Index
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy import DDL, BigInteger, DateTime, Index, event, text
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime, timedelta
+import time
+from types import MappingProxyType
+
+from ._columns import UTC_NOW, counter_column, utc_timestamp_column
+from ._display_constants import compact_number
+
+
+_CONFIG_MANAGER = None
+
+
+def _config_manager():
+    """
+    ConfigManager, imported on first use and then held at module scope.
+    
+    A top-level import would cycle (src.services imports PlayerService,
+    which imports this module); caching the class skips the per-call import.
+    """
+    global _CONFIG_MANAGER
+    if _CONFIG_MANAGER is None:
+        from src.services.config_manager import ConfigManager
+        _CONFIG_MANAGER = ConfigManager
+    return _CONFIG_MANAGER
+
+
+# Read-only prototypes for JSON defaults; each row gets a shallow copy
+_DEFAULT_FUSION_SHARDS = MappingProxyType({
+    "tier_1": 0, "tier_2": 0, "tier_3": 0, "tier_4": 0,
+    "tier_5": 0, "tier_6": 0, "tier_7": 0, "tier_8": 0,
+    "tier_9": 0, "tier_10": 0, "tier_11": 0
+})
+
+# Long-tail counters only; hot counters are real columns on Player
+_DEFAULT_STATS = MappingProxyType({
+    "overflow_energy_gained": 0,
+    "overflow_stamina_gained": 0,
+    "total_explorations": 0,
+    "total_miniboss_defeats": 0,
+    "total_maidens_purified": 0,
+    "total_floor_attempts": 0,
+    "total_floor_victories": 0,
+})
 
 
 class Player(SQLModel, table=True):
@@ -22,37 +63,53 @@ class Player(SQLModel, table=True):
         prayer_charges: Charges for prayer system (max 5)
         fusion_shards: Dictionary of shards per tier for guaranteed fusions
         total_power: Calculated combat power from all maidens
+        battles_fought, battles_won, total_rikis_earned, total_rikis_spent,
+        prayers_performed, shards_earned, shards_spent, level_ups: Hot lifetime
+            counters, one column each so increments don't rewrite the stats document
+        stats: JSONB of long-tail counters and flags (tutorial, overflow, etc.)
+        created_at_unix: Registration time as epoch seconds (immutable, for <t:...> renders)
+        updated_at: Bumped on every ORM UPDATE; row version for render caches
     
     Indexes:
         - discord_id (unique)
-        - level
         - total_power
         - last_active
         - player_class + level composite
+        - GIN on fusion_shards and stats (JSONB key/containment queries)
     """
     
     __tablename__ = "players"
     __table_args__ = (
         Index("ix_players_discord_id", "discord_id", unique=True),
-        Index("ix_players_level", "level"),
         Index("ix_players_total_power", "total_power"),
         Index("ix_players_last_active", "last_active"),
         Index("ix_players_last_level_up", "last_level_up"),
         Index("ix_players_class_level", "player_class", "level"),
         Index("ix_players_highest_sector", "highest_sector_reached"),
         Index("ix_players_highest_floor", "highest_floor_ascended"),
+        Index("ix_players_fusion_shards", "fusion_shards", postgresql_using="gin"),
+        Index("ix_players_stats", "stats", postgresql_using="gin"),
     )
+    __mapper_args__ = {"eager_defaults": True}
     
     id: Optional[int] = Field(default=None, primary_key=True)
     discord_id: int = Field(
         sa_column=Column(BigInteger, unique=True, nullable=False, index=True)
     )
     username: str = Field(default="Unknown", max_length=100)
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    last_active: datetime = Field(default_factory=datetime.utcnow, nullable=False, index=True)
+    created_at: Optional[datetime] = Field(default=None, sa_column=utc_timestamp_column())
+    created_at_unix: Optional[int] = Field(
+        default_factory=lambda: int(time.time()),
+        sa_column=Column(BigInteger, server_default=text("extract(epoch from now())::bigint"))
+    )
+    last_active: Optional[datetime] = Field(default=None, sa_column=utc_timestamp_column())
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, nullable=False, server_default=UTC_NOW, onupdate=datetime.utcnow)
+    )
     last_level_up: Optional[datetime] = Field(default=None, index=True)
     
-    level: int = Field(default=1, ge=1, index=True)
+    level: int = Field(default=1, ge=1)
     experience: int = Field(default=0, ge=0, sa_column=Column(BigInteger))
     
     grace: int = Field(default=5, ge=0)
@@ -69,12 +126,8 @@ class Player(SQLModel, table=True):
     last_prayer_regen: Optional[datetime] = Field(default=None)
     
     fusion_shards: Dict[str, int] = Field(
-        default_factory=lambda: {
-            "tier_1": 0, "tier_2": 0, "tier_3": 0, "tier_4": 0,
-            "tier_5": 0, "tier_6": 0, "tier_7": 0, "tier_8": 0,
-            "tier_9": 0, "tier_10": 0, "tier_11": 0
-        },
-        sa_column=Column(JSON)
+        default_factory=_DEFAULT_FUSION_SHARDS.copy,
+        sa_column=Column(JSONB)
     )
     
     total_attack: int = Field(default=0, ge=0, sa_column=Column(BigInteger))
@@ -98,25 +151,18 @@ class Player(SQLModel, table=True):
     tutorial_completed: bool = Field(default=False)
     tutorial_step: int = Field(default=0, ge=0)
     
+    battles_fought: int = Field(default=0, ge=0, sa_column=counter_column())
+    battles_won: int = Field(default=0, ge=0, sa_column=counter_column())
+    total_rikis_earned: int = Field(default=0, ge=0, sa_column=counter_column())
+    total_rikis_spent: int = Field(default=0, ge=0, sa_column=counter_column())
+    prayers_performed: int = Field(default=0, ge=0, sa_column=counter_column())
+    shards_earned: int = Field(default=0, ge=0, sa_column=counter_column())
+    shards_spent: int = Field(default=0, ge=0, sa_column=counter_column())
+    level_ups: int = Field(default=0, ge=0, sa_column=counter_column())
+    
     stats: Dict[str, int] = Field(
-        default_factory=lambda: {
-            "battles_fought": 0,
-            "battles_won": 0,
-            "total_rikis_earned": 0,
-            "total_rikis_spent": 0,
-            "prayers_performed": 0,
-            "shards_earned": 0,
-            "shards_spent": 0,
-            "level_ups": 0,
-            "overflow_energy_gained": 0,
-            "overflow_stamina_gained": 0,
-            "total_explorations": 0,
-            "total_miniboss_defeats": 0,
-            "total_maidens_purified": 0,
-            "total_floor_attempts": 0,
-            "total_floor_victories": 0,
-        },
-        sa_column=Column(JSON)
+        default_factory=_DEFAULT_STATS.copy,
+        sa_column=Column(JSONB)
     )
 
     highest_sector_reached: int = Field(default=0, ge=0)
@@ -137,11 +183,7 @@ class Player(SQLModel, table=True):
     
     def get_power_display(self) -> str:
         """Format total power with K/M abbreviations."""
-        if self.total_power >= 1_000_000:
-            return f"{self.total_power / 1_000_000:.1f}M"
-        elif self.total_power >= 1_000:
-            return f"{self.total_power / 1_000:.1f}K"
-        return str(self.total_power)
+        return compact_number(self.total_power)
     
     def get_prayer_regen_time_remaining(self) -> int:
         """
@@ -156,8 +198,7 @@ class Player(SQLModel, table=True):
         if self.last_prayer_regen is None:
             return 0
         
-        from src.services.config_manager import ConfigManager
-        regen_interval = ConfigManager.get("prayer_system.regen_minutes", 5) * 60
+        regen_interval = _config_manager().get("prayer_system.regen_minutes", 5) * 60
         time_since = (datetime.utcnow() - self.last_prayer_regen).total_seconds()
         return max(0, int(regen_interval - time_since))
     
@@ -183,14 +224,52 @@ class Player(SQLModel, table=True):
     
     def calculate_win_rate(self) -> float:
         """Calculate player's battle win rate as percentage."""
-        battles = self.stats.get("battles_fought", 0)
-        if battles == 0:
+        if self.battles_fought == 0:
             return 0.0
-        wins = self.stats.get("battles_won", 0)
-        return (wins / battles) * 100
+        return (self.battles_won / self.battles_fought) * 100
     
     def __repr__(self) -> str:
         return (
             f"<Player(discord_id={self.discord_id}, "
             f"level={self.level}, power={self.total_power})>"
-        )
\ No newline at end of file
+        )
+
+
+# Updated on nearly every command: leave page headroom so updates stay HOT
+event.listen(
+    Player.__table__,
+    "after_create",
+    DDL("ALTER TABLE players SET (fillfactor = 70)")
+)
+
+# Dense copy of the ranked player columns; leaderboard rebuilds and snapshot
+# regeneration read this instead of scanning the hot, wide players table
+LEADERBOARD_VIEW = "player_leaderboard_mv"
+LEADERBOARD_VIEW_COLUMNS = ("total_power", "level", "total_fusions", "total_maidens_owned")
+
+event.listen(
+    Player.__table__,
+    "after_create",
+    DDL(
+        f"CREATE MATERIALIZED VIEW IF NOT EXISTS {LEADERBOARD_VIEW} AS "
+        f"SELECT discord_id AS player_id, username, {', '.join(LEADERBOARD_VIEW_COLUMNS)} "
+        f"FROM players"
+    )
+)
+# Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+event.listen(
+    Player.__table__,
+    "after_create",
+    DDL(f"CREATE UNIQUE INDEX IF NOT EXISTS ix_{LEADERBOARD_VIEW}_player ON {LEADERBOARD_VIEW} (player_id)")
+)
+for _column in LEADERBOARD_VIEW_COLUMNS:
+    event.listen(
+        Player.__table__,
+        "after_create",
+        DDL(f"CREATE INDEX IF NOT EXISTS ix_{LEADERBOARD_VIEW}_{_column} ON {LEADERBOARD_VIEW} ({_column} DESC)")
+    )
+event.listen(
+    Player.__table__,
+    "before_drop",
+    DDL(f"DROP MATERIALIZED VIEW IF EXISTS {LEADERBOARD_VIEW}")
+)
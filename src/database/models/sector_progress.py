@@ -1,8 +1,12 @@
-from typing import Optional
+from typing import Optional, Tuple
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import BigInteger, Index
+from sqlalchemy import DDL, BigInteger, Index, event, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
+from ._columns import utc_timestamp_column
+
 
 class SectorProgress(SQLModel, table=True):
     """
@@ -36,6 +40,7 @@ class SectorProgress(SQLModel, table=True):
         Index("ix_sector_progress_player", "player_id"),
         Index("ix_sector_progress_last_explored", "last_explored"),
     )
+    __mapper_args__ = {"eager_defaults": True}
     
     id: Optional[int] = Field(default=None, primary_key=True)
     player_id: int = Field(
@@ -54,8 +59,67 @@ class SectorProgress(SQLModel, table=True):
     total_xp_earned: int = Field(default=0, ge=0, sa_column=Column(BigInteger))
     maidens_purified: int = Field(default=0, ge=0)
     
-    last_explored: datetime = Field(default_factory=datetime.utcnow, nullable=False, index=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    last_explored: Optional[datetime] = Field(default=None, sa_column=utc_timestamp_column())
+    created_at: Optional[datetime] = Field(default=None, sa_column=utc_timestamp_column())
+    
+    @classmethod
+    async def upsert_progress(
+        cls,
+        session: AsyncSession,
+        player_id: int,
+        sector_id: int,
+        sublevel: int,
+        delta_progress: float,
+        delta_xp: int,
+        delta_rikis: int
+    ) -> Optional[Tuple[float, bool]]:
+        """
+        Record one exploration in a single INSERT ... ON CONFLICT DO UPDATE.
+        
+        Creates the row on first exploration, otherwise adds the deltas
+        atomically (progress capped at 100). Completed sublevels (100% and
+        miniboss defeated) are left untouched.
+        
+        Args:
+            session: Database session (must be part of active transaction)
+            player_id: Discord ID
+            sector_id: Sector number
+            sublevel: Sublevel number
+            delta_progress: Progress percentage to add
+            delta_xp: XP earned by this exploration
+            delta_rikis: Rikis earned by this exploration
+        
+        Returns:
+            (new progress, miniboss_defeated), or None if the sublevel was
+            already complete and nothing was written
+        """
+        table = cls.__table__
+        
+        stmt = insert(table).values(
+            player_id=player_id,
+            sector_id=sector_id,
+            sublevel=sublevel,
+            progress=min(100.0, delta_progress),
+            miniboss_defeated=False,
+            times_explored=1,
+            total_rikis_earned=delta_rikis,
+            total_xp_earned=delta_xp,
+            maidens_purified=0
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["player_id", "sector_id", "sublevel"],
+            set_={
+                "progress": func.least(100.0, table.c.progress + stmt.excluded.progress),
+                "times_explored": table.c.times_explored + 1,
+                "total_rikis_earned": table.c.total_rikis_earned + stmt.excluded.total_rikis_earned,
+                "total_xp_earned": table.c.total_xp_earned + stmt.excluded.total_xp_earned,
+                "last_explored": stmt.excluded.last_explored,
+            },
+            where=~((table.c.progress >= 100.0) & table.c.miniboss_defeated)
+        ).returning(table.c.progress, table.c.miniboss_defeated)
+        
+        row = (await session.execute(stmt)).first()
+        return (row.progress, row.miniboss_defeated) if row is not None else None
     
     def is_complete(self) -> bool:
         """Check if sublevel is fully explored (100% + miniboss defeated)."""
@@ -70,4 +134,12 @@ class SectorProgress(SQLModel, table=True):
             f"<SectorProgress(player={self.player_id}, "
             f"sector={self.sector_id}, sublevel={self.sublevel}, "
             f"progress={self.progress:.1f}%, miniboss={self.miniboss_defeated})>"
-        )
\ No newline at end of file
+        )
+
+
+# Updated on nearly every command: leave page headroom so updates stay HOT
+event.listen(
+    SectorProgress.__table__,
+    "after_create",
+    DDL("ALTER TABLE sector_progress SET (fillfactor = 70)")
+)
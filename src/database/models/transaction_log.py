@@ -1,9 +1,15 @@
 from typing import Optional, Dict, Any
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import BigInteger, Index, Text
+from sqlalchemy import DDL, BigInteger, Index, Text, event
 from sqlalchemy.dialects.postgresql import JSON
 from datetime import datetime
 
+from ._columns import utc_timestamp_column
+
+
+# Rows outside every weekly range land here; cleaned by the DELETE fallback
+DEFAULT_PARTITION = "transaction_logs_default"
+
 
 class TransactionLog(SQLModel, table=True):
     """
@@ -22,17 +28,33 @@ class TransactionLog(SQLModel, table=True):
     Indexes:
         - (player_id, timestamp) for player history queries
         - transaction_type for aggregate queries
-        - timestamp for cleanup of old logs
+        - BRIN on timestamp for cleanup/range scans (append-only, tiny index)
+    
+    Partitioning:
+        Range-partitioned by timestamp into weekly tables named
+        transaction_logs_wYYYYMMDD (Monday of the week), so retention drops
+        whole partitions instead of deleting rows. The primary key includes
+        timestamp because Postgres requires the partition key in it.
+        Indexes declared here (including the BRIN) are created on every
+        partition automatically; range queries are partition-pruned.
     """
     
     __tablename__ = "transaction_logs"
     __table_args__ = (
         Index("ix_transaction_logs_player_time", "player_id", "timestamp"),
         Index("ix_transaction_logs_type", "transaction_type"),
-        Index("ix_transaction_logs_timestamp", "timestamp"),
+        Index(
+            "ix_transaction_logs_timestamp_brin", "timestamp",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 32}
+        ),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
     )
+    __mapper_args__ = {"eager_defaults": True}
     
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(BigInteger, primary_key=True, autoincrement=True)
+    )
     player_id: int = Field(
         sa_column=Column(BigInteger, nullable=False, index=True),
         foreign_key="players.discord_id"
@@ -42,10 +64,17 @@ class TransactionLog(SQLModel, table=True):
     details: Dict[str, Any] = Field(sa_column=Column(JSON), nullable=False)
     context: str = Field(sa_column=Column(Text), nullable=False)
     
-    timestamp: datetime = Field(default_factory=datetime.utcnow, nullable=False, index=True)
+    timestamp: Optional[datetime] = Field(default=None, sa_column=utc_timestamp_column(primary_key=True))
     
     def __repr__(self) -> str:
         return (
             f"<TransactionLog(id={self.id}, player={self.player_id}, "
             f"type='{self.transaction_type}', time={self.timestamp})>"
-        )
\ No newline at end of file
+        )
+
+
+event.listen(
+    TransactionLog.__table__,
+    "after_create",
+    DDL(f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF transaction_logs DEFAULT")
+)
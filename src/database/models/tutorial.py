@@ -1,8 +1,22 @@
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import BigInteger
-from sqlalchemy.dialects.postgresql import JSON
-from datetime import datetime
+from sqlalchemy import BigInteger, DateTime, Index, SmallInteger, func, text
+from datetime import datetime, timezone
+
+
+# Tutorial steps in play order; bit i of each mask is STEP_ORDER[i]
+STEP_ORDER: Tuple[str, ...] = (
+    "register_account",
+    "first_prayer",
+    "first_summon",
+    "first_fusion",
+    "view_collection",
+    "set_leader",
+    "complete_daily_quest",
+)
+STEP_BITS: Dict[str, int] = {step: 1 << i for i, step in enumerate(STEP_ORDER)}
+ALL_STEPS_MASK = (1 << len(STEP_ORDER)) - 1
+_PCT_PER_STEP = 100.0 / len(STEP_ORDER)
 
 
 class TutorialProgress(SQLModel, table=True):
@@ -28,48 +42,43 @@ class TutorialProgress(SQLModel, table=True):
     
     Attributes:
         player_id: Owner's Discord ID
-        steps_completed: Dict tracking which steps are done
-        rewards_claimed: Dict tracking which rewards taken
+        steps_completed: Completion bitmask over STEP_ORDER; 127 = all done
+        rewards_claimed: Reward-claimed bitmask over STEP_ORDER
         started_at: When tutorial began
         completed_at: When all steps finished (nullable)
+    
+    Indexes:
+        - player_id (unique) INCLUDE flags and completed_at for index-only status reads
+        - player_id partial on unclaimed rewards ("who has rewards waiting")
     """
     
     __tablename__ = "tutorial_progress"
+    __table_args__ = (
+        Index(
+            "ix_tutorial_progress_player_cov", "player_id", unique=True,
+            postgresql_include=["steps_completed", "rewards_claimed", "completed_at"]
+        ),
+        Index(
+            "ix_tutorial_progress_unclaimed", "player_id",
+            postgresql_where=text("(steps_completed & ~rewards_claimed) <> 0")
+        ),
+    )
+    __mapper_args__ = {"eager_defaults": True}
     
     id: Optional[int] = Field(default=None, primary_key=True)
     player_id: int = Field(
-        sa_column=Column(BigInteger, nullable=False, unique=True, index=True),
+        sa_column=Column(BigInteger, nullable=False),
         foreign_key="players.discord_id"
     )
     
-    steps_completed: Dict[str, bool] = Field(
-        default_factory=lambda: {
-            "register_account": False,
-            "first_prayer": False,
-            "first_summon": False,
-            "first_fusion": False,
-            "view_collection": False,
-            "set_leader": False,
-            "complete_daily_quest": False
-        },
-        sa_column=Column(JSON)
-    )
+    steps_completed: int = Field(default=0, sa_column=Column(SmallInteger, nullable=False, server_default="0"))
+    rewards_claimed: int = Field(default=0, sa_column=Column(SmallInteger, nullable=False, server_default="0"))
     
-    rewards_claimed: Dict[str, bool] = Field(
-        default_factory=lambda: {
-            "register_account": False,
-            "first_prayer": False,
-            "first_summon": False,
-            "first_fusion": False,
-            "view_collection": False,
-            "set_leader": False,
-            "complete_daily_quest": False
-        },
-        sa_column=Column(JSON)
+    started_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     )
-    
-    started_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    completed_at: Optional[datetime] = Field(default=None)
+    completed_at: Optional[datetime] = Field(default=None, sa_column=Column(DateTime(timezone=True)))
     
     def is_step_complete(self, step: str) -> bool:
         """
@@ -85,7 +94,7 @@ class TutorialProgress(SQLModel, table=True):
             >>> if tutorial.is_step_complete("first_prayer"):
             ...     print("Prayer step done!")
         """
-        return self.steps_completed.get(step, False)
+        return bool(self.steps_completed & STEP_BITS.get(step, 0))
     
     def is_reward_claimed(self, step: str) -> bool:
         """
@@ -101,7 +110,7 @@ class TutorialProgress(SQLModel, table=True):
             >>> if not tutorial.is_reward_claimed("first_summon"):
             ...     print("Reward available!")
         """
-        return self.rewards_claimed.get(step, False)
+        return bool(self.rewards_claimed & STEP_BITS.get(step, 0))
     
     def complete_step(self, step: str) -> bool:
         """
@@ -117,16 +126,14 @@ class TutorialProgress(SQLModel, table=True):
             >>> if tutorial.complete_step("first_fusion"):
             ...     print("Step newly completed!")
         """
-        if step not in self.steps_completed:
-            return False
-        
-        if self.steps_completed[step]:
+        bit = STEP_BITS.get(step)
+        if bit is None or self.steps_completed & bit:
             return False
         
-        self.steps_completed[step] = True
+        self.steps_completed |= bit
         
-        if self.is_tutorial_complete() and not self.completed_at:
-            self.completed_at = datetime.utcnow()
+        if self.steps_completed == ALL_STEPS_MASK and not self.completed_at:
+            self.completed_at = datetime.now(timezone.utc)
         
         return True
     
@@ -146,16 +153,17 @@ class TutorialProgress(SQLModel, table=True):
             >>> if tutorial.claim_reward("set_leader"):
             ...     print("Reward claimed!")
         """
-        if step not in self.rewards_claimed:
+        bit = STEP_BITS.get(step)
+        if bit is None:
             return False
         
-        if not self.is_step_complete(step):
+        if not self.steps_completed & bit:
             return False
         
-        if self.rewards_claimed[step]:
+        if self.rewards_claimed & bit:
             return False
         
-        self.rewards_claimed[step] = True
+        self.rewards_claimed |= bit
         return True
     
     def get_progress_count(self) -> int:
@@ -169,7 +177,7 @@ class TutorialProgress(SQLModel, table=True):
             >>> progress = tutorial.get_progress_count()
             >>> print(f"Tutorial: {progress}/7 steps")
         """
-        return sum(1 for completed in self.steps_completed.values() if completed)
+        return self.steps_completed.bit_count()
     
     def get_progress_percentage(self) -> float:
         """
@@ -182,9 +190,7 @@ class TutorialProgress(SQLModel, table=True):
             >>> percent = tutorial.get_progress_percentage()
             >>> print(f"Tutorial {percent:.1f}% complete")
         """
-        total = len(self.steps_completed)
-        completed = self.get_progress_count()
-        return (completed / total) * 100 if total > 0 else 0.0
+        return self.steps_completed.bit_count() * _PCT_PER_STEP
     
     def is_tutorial_complete(self) -> bool:
         """
@@ -197,7 +203,21 @@ class TutorialProgress(SQLModel, table=True):
             >>> if tutorial.is_tutorial_complete():
             ...     print("Tutorial finished!")
         """
-        return all(self.steps_completed.values())
+        return self.steps_completed == ALL_STEPS_MASK
+    
+    @property
+    def unclaimed_mask(self) -> int:
+        """Bitmask of completed steps whose reward is still unclaimed."""
+        return self.steps_completed & ~self.rewards_claimed & ALL_STEPS_MASK
+    
+    def has_unclaimed_rewards(self) -> bool:
+        """
+        Check if any completed step still has a reward to claim.
+        
+        Cheaper than get_unclaimed_rewards() when only a yes/no is needed
+        (e.g. a reward badge).
+        """
+        return bool(self.unclaimed_mask)
     
     def get_unclaimed_rewards(self) -> list[str]:
         """
@@ -210,23 +230,15 @@ class TutorialProgress(SQLModel, table=True):
             >>> unclaimed = tutorial.get_unclaimed_rewards()
             >>> print(f"Unclaimed rewards: {len(unclaimed)}")
         """
-        return [
-            step for step, completed in self.steps_completed.items()
-            if completed and not self.rewards_claimed.get(step, False)
-        ]
+        mask = self.unclaimed_mask
+        return [step for i, step in enumerate(STEP_ORDER) if mask >> i & 1]
     
     def get_next_step(self) -> Optional[str]:
         """
         Get next incomplete tutorial step.
         
-        Returns steps in order:
-        1. register_account
-        2. first_prayer
-        3. first_summon
-        4. first_fusion
-        5. view_collection
-        6. set_leader
-        7. complete_daily_quest
+        Steps are taken in STEP_ORDER (register_account first,
+        complete_daily_quest last).
         
         Returns:
             Step name or None if all complete
@@ -236,25 +248,15 @@ class TutorialProgress(SQLModel, table=True):
             >>> if next_step:
             ...     print(f"Next: {next_step}")
         """
-        step_order = [
-            "register_account",
-            "first_prayer",
-            "first_summon",
-            "first_fusion",
-            "view_collection",
-            "set_leader",
-            "complete_daily_quest"
-        ]
-        
-        for step in step_order:
-            if not self.steps_completed.get(step, False):
-                return step
-        
-        return None
+        remaining = ~self.steps_completed & ALL_STEPS_MASK
+        if not remaining:
+            return None
+        # Lowest unset bit: isolate it, then its index is bit_length() - 1
+        return STEP_ORDER[(remaining & -remaining).bit_length() - 1]
     
     def __repr__(self) -> str:
         return (
             f"<TutorialProgress(player={self.player_id}, "
-            f"progress={self.get_progress_count()}/7, "
+            f"progress={self.get_progress_count()}/{len(STEP_ORDER)}, "
             f"complete={self.is_tutorial_complete()})>"
         )
\ No newline at end of file
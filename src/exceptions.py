@@ -1,4 +1,4 @@
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Tuple
 
 
 class RIKIException(Exception):
@@ -14,20 +14,59 @@ class RIKIException(Exception):
     
     Example:
         >>> raise RIKIException("Something went wrong", {"context": "fusion"})
+    
+    Subclasses store their raw fields and override ``message``/``details``,
+    so nothing is formatted unless the error is actually logged or shown;
+    raise-and-catch flow control (cooldowns, rate limits) stays cheap. They
+    pass those raw fields as ``fields`` so ``args`` and ``repr()`` stay
+    informative, e.g. ``InsufficientResourcesError('rikis', 5000, 1000)``.
     """
     
-    def __init__(self, message: str, details: Optional[Any] = None):
-        self.message = message
-        self.details = details
-        super().__init__(self.message)
+    __slots__ = ("_message", "_details", "_as_dict")
+    
+    def __init__(
+        self,
+        message: str = "",
+        details: Optional[Any] = None,
+        *,
+        fields: Tuple[Any, ...] = ()
+    ):
+        self._message = message
+        self._details = details
+        self._as_dict: Optional[Dict[str, Any]] = None
+        if fields:
+            super().__init__(*fields)
+        elif details is None:
+            super().__init__(message)
+        else:
+            super().__init__(message, details)
+    
+    @property
+    def message(self) -> str:
+        """Human-readable error message, built on access."""
+        return self._message
+    
+    @property
+    def details(self) -> Optional[Any]:
+        """Structured error data, built on access."""
+        return self._details
+    
+    def __str__(self) -> str:
+        return self.message
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert exception to dictionary for logging/serialization."""
-        return {
-            "error_type": self.__class__.__name__,
-            "message": self.message,
-            "details": self.details
-        }
+        """
+        Convert exception to dictionary for logging/serialization.
+        
+        Built once per instance; later calls (logger, reply, metrics) reuse it.
+        """
+        if self._as_dict is None:
+            self._as_dict = {
+                "error_type": self.__class__.__name__,
+                "message": self.message,
+                "details": self.details
+            }
+        return self._as_dict
 
 
 class InsufficientResourcesError(RIKIException):
@@ -43,12 +82,21 @@ class InsufficientResourcesError(RIKIException):
         >>> raise InsufficientResourcesError("rikis", 5000, 1000)
     """
     
+    __slots__ = ("resource", "required", "current")
+    
     def __init__(self, resource: str, required: int, current: int):
         self.resource = resource
         self.required = required
         self.current = current
-        message = f"Insufficient {resource}: need {required:,}, have {current:,}"
-        super().__init__(message, {"resource": resource, "required": required, "current": current})
+        super().__init__(fields=(resource, required, current))
+    
+    @property
+    def message(self) -> str:
+        return f"Insufficient {self.resource}: need {self.required:,}, have {self.current:,}"
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"resource": self.resource, "required": self.required, "current": self.current}
 
 
 class MaidenNotFoundError(RIKIException):
@@ -60,11 +108,20 @@ class MaidenNotFoundError(RIKIException):
         maiden_name: Name of the maiden
     """
     
+    __slots__ = ("maiden_id", "maiden_name")
+    
     def __init__(self, maiden_id: Optional[int] = None, maiden_name: Optional[str] = None):
         self.maiden_id = maiden_id
         self.maiden_name = maiden_name
-        message = f"Maiden not found: {maiden_name or f'ID {maiden_id}'}"
-        super().__init__(message, {"maiden_id": maiden_id, "maiden_name": maiden_name})
+        super().__init__(fields=(maiden_id, maiden_name))
+    
+    @property
+    def message(self) -> str:
+        return f"Maiden not found: {self.maiden_name or f'ID {self.maiden_id}'}"
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"maiden_id": self.maiden_id, "maiden_name": self.maiden_name}
 
 
 class PlayerNotFoundError(RIKIException):
@@ -75,10 +132,19 @@ class PlayerNotFoundError(RIKIException):
         discord_id: Discord user ID
     """
     
+    __slots__ = ("discord_id",)
+    
     def __init__(self, discord_id: int):
         self.discord_id = discord_id
-        message = f"Player not found: {discord_id}"
-        super().__init__(message, {"discord_id": discord_id})
+        super().__init__(fields=(discord_id,))
+    
+    @property
+    def message(self) -> str:
+        return f"Player not found: {self.discord_id}"
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"discord_id": self.discord_id}
 
 
 class ValidationError(RIKIException):
@@ -90,10 +156,20 @@ class ValidationError(RIKIException):
         message: Description of why validation failed
     """
     
+    __slots__ = ("field", "reason")
+    
     def __init__(self, field: str, message: str):
         self.field = field
-        error_message = f"Validation error for {field}: {message}"
-        super().__init__(error_message, {"field": field, "message": message})
+        self.reason = message
+        super().__init__(fields=(field, message))
+    
+    @property
+    def message(self) -> str:
+        return f"Validation error for {self.field}: {self.reason}"
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"field": self.field, "message": self.reason}
 
 
 class FusionError(RIKIException):
@@ -104,9 +180,19 @@ class FusionError(RIKIException):
         reason: Description of why fusion failed
     """
     
+    __slots__ = ("reason",)
+    
     def __init__(self, reason: str):
-        message = f"Fusion failed: {reason}"
-        super().__init__(message, {"reason": reason})
+        self.reason = reason
+        super().__init__(fields=(reason,))
+    
+    @property
+    def message(self) -> str:
+        return f"Fusion failed: {self.reason}"
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"reason": self.reason}
 
 
 class CooldownError(RIKIException):
@@ -118,11 +204,20 @@ class CooldownError(RIKIException):
         remaining_seconds: Time remaining until action available
     """
     
+    __slots__ = ("action", "remaining_seconds")
+    
     def __init__(self, action: str, remaining_seconds: float):
         self.action = action
         self.remaining_seconds = remaining_seconds
-        message = f"{action} is on cooldown: {remaining_seconds:.1f}s remaining"
-        super().__init__(message, {"action": action, "remaining": remaining_seconds})
+        super().__init__(fields=(action, remaining_seconds))
+    
+    @property
+    def message(self) -> str:
+        return f"{self.action} is on cooldown: {self.remaining_seconds:.1f}s remaining"
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"action": self.action, "remaining": self.remaining_seconds}
 
 
 class ConfigurationError(RIKIException):
@@ -134,10 +229,20 @@ class ConfigurationError(RIKIException):
         message: Description of the configuration problem
     """
     
+    __slots__ = ("config_key", "reason")
+    
     def __init__(self, config_key: str, message: str):
         self.config_key = config_key
-        error_message = f"Configuration error for {config_key}: {message}"
-        super().__init__(error_message, {"config_key": config_key, "message": message})
+        self.reason = message
+        super().__init__(fields=(config_key, message))
+    
+    @property
+    def message(self) -> str:
+        return f"Configuration error for {self.config_key}: {self.reason}"
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"config_key": self.config_key, "message": self.reason}
 
 
 class DatabaseError(RIKIException):
@@ -149,11 +254,20 @@ class DatabaseError(RIKIException):
         original_error: The underlying exception
     """
     
+    __slots__ = ("operation", "original_error")
+    
     def __init__(self, operation: str, original_error: Exception):
         self.operation = operation
         self.original_error = original_error
-        message = f"Database error during {operation}: {str(original_error)}"
-        super().__init__(message, {"operation": operation, "error": str(original_error)})
+        super().__init__(fields=(operation, original_error))
+    
+    @property
+    def message(self) -> str:
+        return f"Database error during {self.operation}: {self.original_error}"
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"operation": self.operation, "error": str(self.original_error)}
 
 
 class RateLimitError(RIKIException):
@@ -165,8 +279,43 @@ class RateLimitError(RIKIException):
         retry_after: Seconds until command can be used again
     """
     
+    __slots__ = ("command", "retry_after")
+    
     def __init__(self, command: str, retry_after: float):
         self.command = command
         self.retry_after = retry_after
-        message = f"Rate limit exceeded for {command}: retry after {retry_after:.1f}s"
-        super().__init__(message, {"command": command, "retry_after": retry_after})
\ No newline at end of file
+        super().__init__(fields=(command, retry_after))
+    
+    @property
+    def message(self) -> str:
+        return f"Rate limit exceeded for {self.command}: retry after {self.retry_after:.1f}s"
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"command": self.command, "retry_after": self.retry_after}
+
+
+class LockContendedError(RIKIException):
+    """
+    Raised when a distributed lock is already held elsewhere.
+    
+    Distinct from TimeoutError so callers can tell "action already in
+    progress" apart from database, pool or HTTP timeouts.
+    
+    Args:
+        lock_name: Name of the contended lock
+    """
+    
+    __slots__ = ("lock_name",)
+    
+    def __init__(self, lock_name: str):
+        self.lock_name = lock_name
+        super().__init__(fields=(lock_name,))
+    
+    @property
+    def message(self) -> str:
+        return f"Failed to acquire lock: {self.lock_name}"
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return {"lock_name": self.lock_name}
@@ -1,43 +1,54 @@
-from .database_service import DatabaseService
-from .redis_service import RedisService
-from .config_manager import ConfigManager
-from .logger import get_logger
-from .event_bus import EventBus
-from .transaction_logger import TransactionLogger
-from .resource_service import ResourceService
-from .transaction_service import TransactionService
-from .cache_service import CacheService
-from .player_service import PlayerService
-from .leader_service import LeaderService
-from .maiden_service import MaidenService
-from .fusion_service import FusionService
-from .summon_service import SummonService
-from .daily_service import QuestService
-from .tutorial_service import TutorialService
-from .tutorial_listener import register_tutorial_listeners
-from .exploration_service import ExplorationService
-from .miniboss_service import MinibossService
-from .ascension_service import AscensionService
-
-__all__ = [
-    "DatabaseService",
-    "RedisService",
-    "ConfigManager",
-    "get_logger",
-    "EventBus",
-    "TransactionLogger",
-    "ResourceService",
-    "TransactionService",
-    "CacheService",
-    "PlayerService",
-    "LeaderService",
-    "MaidenService",
-    "FusionService",
-    "SummonService",
-    "QuestService",
-    "TutorialService",
-    "register_tutorial_listeners",
-    "ExplorationService",
-    "MinibossService",
-    "AscensionService",
-]
+"""
+Services package.
+
+Services are resolved lazily on first attribute access, so importing one
+service module (or the package itself) does not execute every other
+service and its dependency chain.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Dict
+
+# Public name -> submodule defining it
+_LAZY: Dict[str, str] = {
+    "DatabaseService": "database_service",
+    "RedisService": "redis_service",
+    "ConfigManager": "config_manager",
+    "get_logger": "logger",
+    "EventBus": "event_bus",
+    "TransactionLogger": "transaction_logger",
+    "ResourceService": "resource_service",
+    "TransactionService": "transaction_service",
+    "CacheService": "cache_service",
+    "LeaderboardCache": "leaderboard_cache",
+    "PlayerService": "player_service",
+    "LeaderService": "leader_service",
+    "MaidenService": "maiden_service",
+    "FusionService": "fusion_service",
+    "SummonService": "summon_service",
+    "DailyService": "daily_service",
+    "TutorialService": "tutorial_service",
+    "register_tutorial_listeners": "tutorial_listener",
+    "ExplorationService": "exploration_service",
+    "MinibossService": "miniboss_service",
+    "AscensionService": "ascension_service",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
@@ -1,7 +1,9 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, NamedTuple, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from datetime import datetime
+import bisect
+import functools
 import random
 import math
 
@@ -15,6 +17,65 @@ from src.services.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Distinct floors memoized per derived value; far above any live tower height
+_FLOOR_CACHE_SIZE = 4096
+
+# Enemy name prefixes per floor tier: floors <= 10, <= 50, <= 100, <= 200, above
+_NAME_TIER_BOUNDS = (10, 50, 100, 200)
+_NAME_TIER_PREFIXES = (
+    ("Lesser", "Minor", "Weak"),
+    ("Guardian", "Sentinel", "Watcher"),
+    ("Elite", "Champion", "Veteran"),
+    ("Ascended", "Exalted", "Divine"),
+    ("Transcendent", "Eternal", "Absolute"),
+)
+_ENEMY_TYPES = ("Warrior", "Mage", "Beast", "Construct", "Wraith")
+
+# Floors whose exponential HP/reward values are precomputed per config load
+_FLOOR_TABLE_SIZE = 1024
+
+
+class AscensionConfig(NamedTuple):
+    """Snapshot of the ascension_system config section."""
+    base_stamina_cost: int
+    stamina_increase_per_10: int
+    base_hp: float
+    hp_growth: float
+    reward_base_rikis: float
+    reward_base_xp: float
+    reward_growth: float
+    bonus_intervals: Dict[str, int]
+    milestones: Dict[Any, Dict[str, Any]]
+    # egg_rarity_floors ranges sorted by max floor, as parallel tuples
+    egg_floor_mins: Tuple[int, ...]
+    egg_floor_maxes: Tuple[int, ...]
+    egg_rarities: Tuple[str, ...]
+    x20_crit_bonus: float
+    x20_gem_cost: int
+
+
+class _GrowthTable:
+    """int(base * growth ** floor), precomputed for the first _FLOOR_TABLE_SIZE floors."""
+    
+    __slots__ = ("base", "growth", "values")
+    
+    def __init__(self, base: float, growth: float):
+        self.base = base
+        self.growth = growth
+        
+        values = []
+        for floor in range(_FLOOR_TABLE_SIZE):
+            try:
+                values.append(int(base * (growth ** floor)))
+            except OverflowError:
+                break  # Past float range; at() raises the same error on demand
+        self.values: Tuple[int, ...] = tuple(values)
+    
+    def at(self, floor: int) -> int:
+        if 0 <= floor < len(self.values):
+            return self.values[floor]
+        return int(self.base * (self.growth ** floor))
+
 
 class AscensionService:
     """
@@ -75,11 +136,10 @@ class AscensionService:
         Returns:
             Stamina cost
         """
-        base_cost = ConfigManager.get("ascension_system.base_stamina_cost", 5)
-        increase_per_10 = ConfigManager.get("ascension_system.stamina_increase_per_10_levels", 1)
+        cfg = AscensionService._cfg()
         
-        additional_cost = (player_level // 10) * increase_per_10
-        return base_cost + additional_cost
+        additional_cost = (player_level // 10) * cfg.stamina_increase_per_10
+        return cfg.base_stamina_cost + additional_cost
     
     @staticmethod
     def generate_floor_enemy(floor: int) -> Dict[str, Any]:
@@ -94,47 +154,69 @@ class AscensionService:
         Returns:
             Dictionary with enemy name, HP, rewards
         """
-        base_hp = ConfigManager.get("ascension_system.enemy_hp_base", 1000)
-        growth_rate = ConfigManager.get("ascension_system.enemy_hp_growth_rate", 1.12)
-        
-        hp = int(base_hp * (growth_rate ** floor))
-        
-        # Generate thematic name
-        name = AscensionService._generate_enemy_name(floor)
-        
-        # Calculate rewards
-        rewards = AscensionService._calculate_floor_rewards(floor)
-        
+        enemy = AscensionService._roll_enemy(floor)
+        enemy["rewards"] = AscensionService._calculate_floor_rewards(floor)
+        return enemy
+    
+    @staticmethod
+    def _roll_enemy(floor: int) -> Dict[str, Any]:
+        """Enemy name, HP and floor without the reward table."""
         return {
-            "name": name,
-            "hp": hp,
+            "name": AscensionService._generate_enemy_name(floor),
+            "hp": AscensionService._floor_enemy_hp(floor),
             "floor": floor,
-            "rewards": rewards,
         }
     
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _cfg() -> AscensionConfig:
+        """Ascension config values, read once per config reload."""
+        get = ConfigManager.get
+        egg_ranges = sorted(
+            (max_floor, min_floor, rarity)
+            for rarity, (min_floor, max_floor) in get("ascension_system.egg_rarity_floors", {}).items()
+        )
+        return AscensionConfig(
+            base_stamina_cost=get("ascension_system.base_stamina_cost", 5),
+            stamina_increase_per_10=get("ascension_system.stamina_increase_per_10_levels", 1),
+            base_hp=get("ascension_system.enemy_hp_base", 1000),
+            hp_growth=get("ascension_system.enemy_hp_growth_rate", 1.12),
+            reward_base_rikis=get("ascension_system.reward_base_rikis", 50),
+            reward_base_xp=get("ascension_system.reward_base_xp", 20),
+            reward_growth=get("ascension_system.reward_growth_rate", 1.1),
+            bonus_intervals=get("ascension_system.bonus_intervals", {}),
+            milestones=get("ascension_system.milestones", {}),
+            egg_floor_mins=tuple(min_floor for _, min_floor, _ in egg_ranges),
+            egg_floor_maxes=tuple(max_floor for max_floor, _, _ in egg_ranges),
+            egg_rarities=tuple(rarity for _, _, rarity in egg_ranges),
+            x20_crit_bonus=get("ascension_system.x20_attack_crit_bonus", 0.2),
+            x20_gem_cost=get("ascension_system.x20_attack_gem_cost", 10),
+        )
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _floor_tables() -> Tuple[_GrowthTable, _GrowthTable, _GrowthTable]:
+        """HP, riki and XP growth tables; rebuilt after every config reload."""
+        cfg = AscensionService._cfg()
+        return (
+            _GrowthTable(cfg.base_hp, cfg.hp_growth),
+            _GrowthTable(cfg.reward_base_rikis, cfg.reward_growth),
+            _GrowthTable(cfg.reward_base_xp, cfg.reward_growth),
+        )
+    
+    @staticmethod
+    def _floor_enemy_hp(floor: int) -> int:
+        """Enemy HP for a floor."""
+        return AscensionService._floor_tables()[0].at(floor)
+    
     @staticmethod
     def _generate_enemy_name(floor: int) -> str:
         """Generate thematic enemy name based on floor tier."""
-        if floor <= 10:
-            prefixes = ["Lesser", "Minor", "Weak"]
-        elif floor <= 50:
-            prefixes = ["Guardian", "Sentinel", "Watcher"]
-        elif floor <= 100:
-            prefixes = ["Elite", "Champion", "Veteran"]
-        elif floor <= 200:
-            prefixes = ["Ascended", "Exalted", "Divine"]
-        else:
-            prefixes = ["Transcendent", "Eternal", "Absolute"]
-        
-        types = ["Warrior", "Mage", "Beast", "Construct", "Wraith"]
-        
-        prefix = random.choice(prefixes)
-        enemy_type = random.choice(types)
-        
         if floor % 50 == 0:
             return f"Floor {floor} Guardian"
         
-        return f"{prefix} {enemy_type}"
+        prefixes = _NAME_TIER_PREFIXES[bisect.bisect_left(_NAME_TIER_BOUNDS, floor)]
+        return f"{random.choice(prefixes)} {random.choice(_ENEMY_TYPES)}"
     
     @staticmethod
     def _calculate_floor_rewards(floor: int) -> Dict[str, Any]:
@@ -144,22 +226,27 @@ class AscensionService:
         Base rewards scale exponentially. Bonus rewards at intervals.
         
         Returns:
-            Dictionary with rikis, xp, and optional bonus items
+            Dictionary with rikis, xp, and optional bonus items. The dict
+            itself is a fresh copy; nested values are shared with the
+            memoized result and must not be mutated.
         """
-        base_rikis = ConfigManager.get("ascension_system.reward_base_rikis", 50)
-        base_xp = ConfigManager.get("ascension_system.reward_base_xp", 20)
-        growth_rate = ConfigManager.get("ascension_system.reward_growth_rate", 1.1)
-        
-        rikis = int(base_rikis * (growth_rate ** floor))
-        xp = int(base_xp * (growth_rate ** floor))
+        return dict(AscensionService._compute_floor_rewards(floor))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=_FLOOR_CACHE_SIZE)
+    def _compute_floor_rewards(floor: int) -> Dict[str, Any]:
+        """Reward table for a floor; memoized until the next config reload."""
+        _, rikis_table, xp_table = AscensionService._floor_tables()
         
         rewards = {
-            "rikis": rikis,
-            "xp": xp,
+            "rikis": rikis_table.at(floor),
+            "xp": xp_table.at(floor),
         }
         
+        cfg = AscensionService._cfg()
+        
         # Bonus rewards at intervals
-        bonus_intervals = ConfigManager.get("ascension_system.bonus_intervals", {})
+        bonus_intervals = cfg.bonus_intervals
         
         egg_interval = bonus_intervals.get("egg_every_n_floors", 5)
         if floor % egg_interval == 0:
@@ -177,7 +264,7 @@ class AscensionService:
             rewards["fusion_catalyst"] = 1
         
         # Milestone rewards
-        milestones = ConfigManager.get("ascension_system.milestones", {})
+        milestones = cfg.milestones
         if floor in milestones:
             milestone_rewards = milestones[floor]
             rewards["milestone"] = milestone_rewards
@@ -187,11 +274,12 @@ class AscensionService:
     @staticmethod
     def _get_egg_rarity_for_floor(floor: int) -> str:
         """Determine maiden egg rarity based on floor number."""
-        egg_rarity_floors = ConfigManager.get("ascension_system.egg_rarity_floors", {})
+        cfg = AscensionService._cfg()
         
-        for rarity, (min_floor, max_floor) in egg_rarity_floors.items():
-            if min_floor <= floor <= max_floor:
-                return rarity
+        # First range ending at or above floor; ranges do not overlap
+        idx = bisect.bisect_left(cfg.egg_floor_maxes, floor)
+        if idx < len(cfg.egg_rarities) and cfg.egg_floor_mins[idx] <= floor:
+            return cfg.egg_rarities[idx]
         
         return "epic"  # Default fallback
     
@@ -213,15 +301,14 @@ class AscensionService:
         base_damage = player_power * attack_count
         
         if is_gem_attack:
-            crit_bonus = ConfigManager.get("ascension_system.x20_attack_crit_bonus", 0.2)
-            base_damage = int(base_damage * (1 + crit_bonus))
+            base_damage = int(base_damage * (1 + AscensionService._cfg().x20_crit_bonus))
         
         return base_damage
     
     @staticmethod
     def get_gem_attack_cost() -> int:
         """Get gem cost for x20 attack."""
-        return ConfigManager.get("ascension_system.x20_attack_gem_cost", 10)
+        return AscensionService._cfg().x20_gem_cost
     
     @staticmethod
     async def attempt_floor(
@@ -234,6 +321,8 @@ class AscensionService:
         
         Returns floor enemy data and validates stamina cost.
         Does NOT resolve combat - that's done via attack actions.
+        Nothing is flushed here; the caller's transaction commit writes
+        every change in one round-trip.
         
         Args:
             session: Database session
@@ -243,7 +332,7 @@ class AscensionService:
         Returns:
             Dictionary with:
                 - floor: Floor number
-                - enemy: Enemy data
+                - enemy: Enemy name, HP and floor (no rewards)
                 - stamina_cost: Stamina consumed
                 - estimated_attacks: Attacks needed estimate
         
@@ -266,12 +355,13 @@ class AscensionService:
         # Consume stamina
         player.stamina -= stamina_cost
         
-        # Generate enemy
-        enemy = AscensionService.generate_floor_enemy(floor)
+        # Rewards are only needed on victory; resolve_combat builds them
+        enemy = AscensionService._roll_enemy(floor)
         
-        # Update progress stats
+        # Update progress stats; resolve_combat reuses the enemy snapshot
         progress.total_attempts += 1
         progress.last_attempt = datetime.utcnow()
+        progress.pending_enemy = enemy
         
         # Estimate attacks needed
         estimated_attacks = math.ceil(enemy["hp"] / player_power) if player_power > 0 else 999
@@ -279,11 +369,9 @@ class AscensionService:
         # Update daily quest
         from src.services.daily_service import DailyService
         await DailyService.update_quest_progress(
-            session, player.discord_id, "spend_stamina", stamina_cost
+            session, player.discord_id, "spend_stamina", stamina_cost, flush=False
         )
         
-        await session.flush()
-        
         logger.info(
             f"Player {player.discord_id} attempting floor {floor}: "
             f"enemy HP {enemy['hp']}, power {player_power}, est. attacks {estimated_attacks}"
@@ -308,7 +396,10 @@ class AscensionService:
         """
         Resolve floor combat after player attacks complete.
         
-        Updates progress, grants rewards on victory.
+        Updates progress, grants rewards on victory. The enemy is the one
+        attempt_floor stored on progress.pending_enemy, so HP and name are
+        not re-derived here; the reward table is only built on victory.
+        Like attempt_floor, this does not flush; the caller's commit does.
         
         Args:
             session: Database session
@@ -327,8 +418,11 @@ class AscensionService:
         """
         progress = await AscensionService.get_or_create_progress(session, player.discord_id)
         
-        # Generate enemy for validation
-        enemy = AscensionService.generate_floor_enemy(floor)
+        # Enemy rolled by attempt_floor; regenerate only if none is pending for this floor
+        enemy = progress.pending_enemy
+        if not enemy or enemy.get("floor") != floor:
+            enemy = AscensionService._roll_enemy(floor)
+        progress.pending_enemy = None
         enemy_hp = enemy["hp"]
         
         victory = damage_dealt >= enemy_hp
@@ -348,7 +442,7 @@ class AscensionService:
                     player.highest_floor_ascended = floor
             
             # Grant rewards
-            rewards = enemy["rewards"]
+            rewards = AscensionService._calculate_floor_rewards(floor)
             
             # Rikis and XP via ResourceService
             await ResourceService.grant_resources(
@@ -391,8 +485,6 @@ class AscensionService:
                 f"(gems: {gems_spent}, new record: {floor > progress.highest_floor})"
             )
             
-            await session.flush()
-            
             return {
                 "victory": True,
                 "rewards": rewards,
@@ -426,8 +518,6 @@ class AscensionService:
                 f"{remaining_hp}/{enemy_hp} HP remaining after {attacks_used} attacks"
             )
             
-            await session.flush()
-            
             return {
                 "victory": False,
                 "rewards": None,
@@ -451,4 +541,10 @@ class AscensionService:
         if player_power == 0:
             return 999
         
-        return math.ceil(enemy_hp / player_power)
\ No newline at end of file
+        return math.ceil(enemy_hp / player_power)
+
+
+# Memoized floor values are derived from ascension_system config
+ConfigManager.register_reload(AscensionService._cfg.cache_clear)
+ConfigManager.register_reload(AscensionService._floor_tables.cache_clear)
+ConfigManager.register_reload(AscensionService._compute_floor_rewards.cache_clear)
@@ -1,7 +1,9 @@
 # src/services/cache_service.py
-from typing import Dict, Any, Optional, List, Set
+from typing import Dict, Any, Optional, List, Set, Tuple
+from collections import Counter
 from datetime import datetime, timedelta
-import json
+import asyncio
+import time
 import zlib
 
 from src.services.redis_service import RedisService
@@ -20,6 +22,7 @@ class CacheService:
     - Tag-based invalidation (invalidate all "player" caches at once)
     - Key templates for consistent naming
     - Metrics tracking (hits/misses)
+    - Rate-limited invalidation (pending keys coalesced into one UNLINK per cooldown)
     - Batch operations
     - Graceful degradation when Redis unavailable
     
@@ -62,8 +65,18 @@ class CacheService:
         "invalidations": 0
     }
     
+    # Per-cache lookup counters, keyed by KEY_TEMPLATES name
+    _hits: Counter = Counter()
+    _misses: Counter = Counter()
+    
     COMPRESSION_THRESHOLD = 1024
     
+    _pending_invalidations: Set[str] = set()
+    _last_invalidation_flush: float = 0.0
+    _invalidation_flush_scheduled: bool = False
+    # Strong refs to in-flight deferred flushes so they are not GC'd mid-run
+    _flush_tasks: Set["asyncio.Task[int]"] = set()
+    
     KEY_TEMPLATES = {
         "player_resources": "riki:player:{player_id}:resources",
         "maiden_collection": "riki:player:{player_id}:maidens",
@@ -93,19 +106,19 @@ class CacheService:
             await RedisService.set(f"{tag_key}:{key}", "1", ttl=None)
     
     @classmethod
-    async def _compress(cls, data: str) -> bytes:
-        """Compress data if above threshold."""
+    async def _compress(cls, data: bytes) -> bytes:
+        """Compress orjson.dumps() output if above threshold."""
         if len(data) > cls.COMPRESSION_THRESHOLD:
-            return zlib.compress(data.encode())
-        return data.encode()
+            return zlib.compress(data)
+        return data
     
     @classmethod
-    async def _decompress(cls, data: bytes) -> str:
-        """Decompress data if compressed."""
+    async def _decompress(cls, data: bytes) -> bytes:
+        """Decompress data if compressed; the result feeds orjson.loads()."""
         try:
-            return zlib.decompress(data).decode()
+            return zlib.decompress(data)
         except zlib.error:
-            return data.decode()
+            return data
     
     @classmethod
     async def cache_player_resources(
@@ -127,6 +140,7 @@ class CacheService:
         """
         key = cls._get_key("player_resources", player_id=player_id)
         success = await RedisService.set(key, resource_data, ttl=ttl)
+        cls._pending_invalidations.discard(key)
         
         if success:
             await cls._add_tags(key, [f"player:{player_id}", "resources"])
@@ -146,27 +160,142 @@ class CacheService:
             Cached resource data or None if not found/expired
         """
         key = cls._get_key("player_resources", player_id=player_id)
+        if key in cls._pending_invalidations:
+            cls.record_miss("player_resources")
+            return None
+        
         data = await RedisService.get(key)
         
         if data:
-            cls._metrics["hits"] += 1
+            cls.record_hit("player_resources")
             return data
         else:
-            cls._metrics["misses"] += 1
+            cls.record_miss("player_resources")
             return None
     
+    @classmethod
+    async def warm(cls, player_id: int) -> bool:
+        """
+        Rebuild and cache a player's resource summary from the database.
+        
+        Called by SystemTasksCog when a player-mutating event fires, so the
+        next read is a hit instead of a miss. Also refreshes the player's
+        live leaderboard scores.
+        
+        Args:
+            player_id: Player's Discord ID
+        
+        Returns:
+            True if cached successfully, False if player missing or Redis unavailable
+        """
+        from src.services.database_service import DatabaseService
+        from src.services.leaderboard_cache import LeaderboardCache
+        from src.services.player_service import PlayerService
+        from src.services.resource_service import ResourceService
+        
+        async with DatabaseService.get_readonly_session() as session:
+            player = await PlayerService.get_player_with_regen(session, player_id, lock=False)
+            if player is None:
+                return False
+            summary = ResourceService.get_resource_summary(player)
+        
+        # Same events move ranked values, so refresh the live leaderboards too
+        await LeaderboardCache.update_player(player)
+        return await cls.cache_player_resources(player_id, summary)
+    
     @classmethod
     async def invalidate_player_resources(cls, player_id: int) -> bool:
         """
         Invalidate player resource cache.
         
+        Rate-limited: the key is treated as a miss immediately, while the
+        Redis delete is batched with others (see schedule_invalidation).
+        
         Args:
             player_id: Player's Discord ID
         
         Returns:
-            True if invalidated successfully
+            True once the invalidation is recorded
         """
         key = cls._get_key("player_resources", player_id=player_id)
+        await cls.schedule_invalidation(key)
+        return True
+    
+    @classmethod
+    async def schedule_invalidation(cls, key: str) -> None:
+        """
+        Queue a key for deletion, flushing at most once per cooldown.
+        
+        Write bursts that invalidate the same keys repeatedly collapse into
+        a single UNLINK per cooldown window instead of one DEL per write.
+        
+        Staleness bound: the bot runs as a single process (one RIKIBot), and
+        reads check the pending set first, so the bot never serves a queued
+        key. The old Redis entry lives on for up to
+        cache.invalidation_cooldown_seconds (default 10s), visible only to
+        readers outside the bot. If the process exits before the flush, the
+        entry survives until its TTL. Paths where that matters (bans,
+        resets, evictions) must use invalidate_now() instead.
+        
+        Args:
+            key: Cache key to invalidate
+        """
+        cls._pending_invalidations.add(key)
+        
+        cooldown = ConfigManager.get("cache.invalidation_cooldown_seconds", 10)
+        elapsed = time.monotonic() - cls._last_invalidation_flush
+        if elapsed >= cooldown:
+            await cls.flush_invalidations()
+        elif not cls._invalidation_flush_scheduled:
+            cls._invalidation_flush_scheduled = True
+            asyncio.get_running_loop().call_later(cooldown - elapsed, cls._start_deferred_flush)
+    
+    @classmethod
+    def _start_deferred_flush(cls) -> None:
+        """call_later target: run flush_invalidations as a tracked task."""
+        task = asyncio.create_task(cls.flush_invalidations())
+        cls._flush_tasks.add(task)
+        task.add_done_callback(cls._deferred_flush_done)
+    
+    @classmethod
+    def _deferred_flush_done(cls, task: "asyncio.Task[int]") -> None:
+        cls._flush_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Deferred cache invalidation flush failed: {task.exception()}")
+    
+    @classmethod
+    async def flush_invalidations(cls) -> int:
+        """
+        Delete all pending keys in one non-blocking UNLINK.
+        
+        Returns:
+            Number of keys removed from Redis
+        """
+        cls._invalidation_flush_scheduled = False
+        cls._last_invalidation_flush = time.monotonic()
+        if not cls._pending_invalidations:
+            return 0
+        
+        keys = list(cls._pending_invalidations)
+        removed = await RedisService.unlink(*keys)
+        cls._pending_invalidations.difference_update(keys)
+        cls._metrics["invalidations"] += len(keys)
+        return removed
+    
+    @classmethod
+    async def invalidate_now(cls, key: str) -> bool:
+        """
+        Delete a key immediately, bypassing the invalidation cooldown.
+        
+        Use for evictions where stale data must not survive (bans, resets).
+        
+        Args:
+            key: Cache key to invalidate
+        
+        Returns:
+            True if invalidated successfully
+        """
+        cls._pending_invalidations.discard(key)
         success = await RedisService.delete(key)
         
         if success:
@@ -216,10 +345,10 @@ class CacheService:
         data = await RedisService.get(key)
         
         if data:
-            cls._metrics["hits"] += 1
+            cls.record_hit("active_modifiers")
             return data
         else:
-            cls._metrics["misses"] += 1
+            cls.record_miss("active_modifiers")
             return None
     
     @classmethod
@@ -282,6 +411,38 @@ class CacheService:
         logger.info(f"Redis automatically handles TTL expiration for pattern: {pattern}")
         return 0
     
+    @classmethod
+    def record_hit(cls, cache_name: str) -> None:
+        """Count a cache hit for ``cache_name`` and the global total."""
+        cls._hits[cache_name] += 1
+        cls._metrics["hits"] += 1
+    
+    @classmethod
+    def record_miss(cls, cache_name: str) -> None:
+        """Count a cache miss for ``cache_name`` and the global total."""
+        cls._misses[cache_name] += 1
+        cls._metrics["misses"] += 1
+    
+    @classmethod
+    def get_cache_hit_rates(cls, limit: int = 5) -> List[Tuple[str, int, float]]:
+        """
+        Per-cache hit rates, busiest caches first.
+        
+        A healthy global average can hide one cache being invalidated into
+        uselessness; this breaks the rate out per KEY_TEMPLATES name.
+        
+        Args:
+            limit: Max caches to return
+        
+        Returns:
+            List of (cache_name, lookups, hit_rate_percent)
+        """
+        lookups = cls._hits + cls._misses
+        return [
+            (name, total, cls._hits[name] / total * 100)
+            for name, total in lookups.most_common(limit)
+        ]
+    
     @classmethod
     def get_metrics(cls) -> Dict[str, int]:
         """
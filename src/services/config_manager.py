@@ -1,10 +1,12 @@
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import asyncio
+import time
 
 from src.database.models.game_config import GameConfig
+from src.services.event_bus import EventBus
 from src.services.logger import get_logger
 
 logger = get_logger(__name__)
@@ -21,9 +23,12 @@ class ConfigManager:
     Features:
         - Database-backed for live updates
         - In-memory cache with configurable TTL
+        - Memoized dot-path lookups (30s TTL, dropped whenever a value changes)
         - Automatic background refresh task
         - Graceful fallback to hardcoded defaults
         - Hierarchical config paths with dot notation
+        - Publishes "config_reloaded" so consumers can refresh hoisted values
+        - register_reload() hooks for dropping derived caches synchronously
     
     Usage:
         >>> await ConfigManager.initialize(session)
@@ -40,6 +45,13 @@ class ConfigManager:
     _cache_ttl: int = 300
     _refresh_task: Optional[asyncio.Task] = None
     
+    # Memoized dot-path lookups: key -> (monotonic timestamp, resolved value)
+    _resolved: Dict[str, Tuple[float, Any]] = {}
+    _resolved_ttl: float = 30.0
+    
+    # Callbacks run whenever memoized lookups are dropped (load, refresh, set, clear)
+    _reload_hooks: List[Callable[[], None]] = []
+    
     _defaults: Dict[str, Any] = {
         "fusion_rates": {
             "1": 70, "2": 65, "3": 60, "4": 55, "5": 50, "6": 45,
@@ -182,7 +194,11 @@ class ConfigManager:
             "riki_gems_max_cap": None,  # No cap for gems
             "modifier_stacking": "multiplicative",
             "passive_income_enabled": False,  # Future feature
-            "audit_retention_days": 90
+            "audit_retention_days": 90,
+            "audit_cleanup_batch_size": 5000
+        },
+        "cache": {
+            "invalidation_cooldown_seconds": 10
         },
         "modifier_rules": {
             "stack_method": "multiplicative",
@@ -370,6 +386,7 @@ class ConfigManager:
                 logger.info("ConfigManager initialized with default config (database empty)")
             
             cls._initialized = True
+            cls._invalidate_resolved()
             
             if cls._refresh_task is None:
                 cls._refresh_task = asyncio.create_task(cls._background_refresh())
@@ -393,11 +410,22 @@ class ConfigManager:
                     result = await session.execute(select(GameConfig))
                     configs = result.scalars().all()
                     
+                    changed = []
+                    now = datetime.utcnow()
                     for config in configs:
-                        cls._cache[config.config_key] = config.config_value
-                        cls._cache_timestamps[config.config_key] = datetime.utcnow()
+                        if cls._cache.get(config.config_key) != config.config_value:
+                            cls._cache[config.config_key] = config.config_value
+                            changed.append(config.config_key)
+                        cls._cache_timestamps[config.config_key] = now
                     
-                    logger.debug(f"ConfigManager cache refreshed ({len(configs)} entries)")
+                    logger.debug(
+                        f"ConfigManager cache refreshed ({len(configs)} entries, {len(changed)} changed)"
+                    )
+                
+                # Unchanged refreshes keep memoized lookups and derived caches warm
+                if changed:
+                    cls._invalidate_resolved()
+                    await EventBus.publish("config_reloaded", {"keys": changed})
                     
             except asyncio.CancelledError:
                 logger.info("ConfigManager background refresh cancelled")
@@ -443,26 +471,60 @@ class ConfigManager:
             cls._cache = cls._defaults.copy()
             cls._initialized = True
         
+        now = time.monotonic()
+        memo = cls._resolved.get(key)
+        if memo is not None and now - memo[0] < cls._resolved_ttl:
+            value = memo[1]
+            return value if value is not None else default
+        
         if key in cls._cache_timestamps:
             age = (datetime.utcnow() - cls._cache_timestamps[key]).total_seconds()
             if age > cls._cache_ttl:
                 cls._cache.pop(key, None)
                 cls._cache_timestamps.pop(key, None)
         
-        keys = key.split(".")
+        value = cls._resolve(key)
+        cls._resolved[key] = (now, value)
+        return value if value is not None else default
+    
+    @classmethod
+    def _resolve(cls, key: str) -> Any:
+        """Walk the cache by dot path, falling back to hardcoded defaults."""
         value = cls._cache
         
-        for k in keys:
+        for k in key.split("."):
             if isinstance(value, dict):
                 value = value.get(k)
                 if value is None:
-                    value = cls._get_from_defaults(key)
-                    return value if value is not None else default
+                    return cls._get_from_defaults(key)
             else:
-                value = cls._get_from_defaults(key)
-                return value if value is not None else default
+                return cls._get_from_defaults(key)
         
-        return value if value is not None else default
+        return value
+    
+    @classmethod
+    def _invalidate_resolved(cls) -> None:
+        """Drop memoized lookups after the underlying config changed."""
+        cls._resolved.clear()
+        for hook in cls._reload_hooks:
+            try:
+                hook()
+            except Exception as e:
+                logger.error(f"ConfigManager reload hook {hook!r} failed: {e}")
+    
+    @classmethod
+    def register_reload(cls, hook: Callable[[], None]) -> None:
+        """
+        Run hook every time the config cache is (re)loaded or changed.
+        
+        Unlike the "config_reloaded" event this also fires on initialize()
+        and clear_cache(), so caches derived from config values can never
+        outlive the values they were computed from.
+        
+        Example:
+            >>> ConfigManager.register_reload(_floor_rewards.cache_clear)
+        """
+        cls._reload_hooks.append(hook)
     
     @classmethod
     def _get_from_defaults(cls, key: str) -> Any:
@@ -542,7 +604,7 @@ class ConfigManager:
             if config:
                 config.config_value = final_value
                 config.modified_by = modified_by
-                config.last_modified = datetime.utcnow()
+                config.last_modified = datetime.now(timezone.utc)
             else:
                 config = GameConfig(
                     config_key=top_level_key,
@@ -563,8 +625,11 @@ class ConfigManager:
                     cls._cache[cfg.config_key] = cfg.config_value
             
             cls._cache_timestamps[top_level_key] = datetime.utcnow()
+            cls._invalidate_resolved()
             logger.info(f"ConfigManager updated: {key} by {modified_by}")
             
+            await EventBus.publish("config_reloaded", {"keys": [top_level_key]})
+            
         except Exception as e:
             logger.error(f"Failed to update config {key}: {e}")
             await session.rollback()
@@ -575,5 +640,6 @@ class ConfigManager:
         """Clear in-memory cache and reset initialization state."""
         cls._cache.clear()
         cls._cache_timestamps.clear()
+        cls._invalidate_resolved()
         cls._initialized = False
         logger.info("ConfigManager cache cleared")
\ No newline at end of file
@@ -1,9 +1,9 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import date, datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, text
 
-from src.database.models.daily_quest import DailyQuest
+from src.database.models.daily_quest import DailyQuest, STREAKS_VIEW
 from src.database.models.player import Player
 from src.services.config_manager import ConfigManager
 from src.services.transaction_logger import TransactionLogger
@@ -111,7 +111,8 @@ class DailyService:
         session: AsyncSession,
         player_id: int,
         quest_type: str,
-        amount: int = 1
+        amount: int = 1,
+        flush: bool = True
     ) -> Dict[str, Any]:
         """
         Update quest progress and check for completion.
@@ -128,6 +129,8 @@ class DailyService:
             player_id: Player's Discord ID
             quest_type: Type of quest to update
             amount: Amount to add (default 1)
+            flush: Flush immediately; pass False when the caller's commit
+                (or a later flush) writes the change anyway
         
         Returns:
             Dictionary with:
@@ -162,27 +165,29 @@ class DailyService:
         
         daily_quest = await DailyService.get_or_create_daily_quest(session, player_id)
         
-        was_completed_before = daily_quest.quests_completed.get(quest_type, False)
+        was_completed_before = daily_quest.is_quest_completed(quest_type)
         
-        daily_quest.quest_progress[progress_key] += amount
+        progress = getattr(daily_quest, progress_key) + amount
+        setattr(daily_quest, progress_key, progress)
         
         quest_completed = False
         if not was_completed_before:
-            if daily_quest.quest_progress[progress_key] >= required_amount:
-                daily_quest.quests_completed[quest_type] = True
+            if progress >= required_amount:
+                daily_quest.mark_completed(quest_type)
                 quest_completed = True
                 
                 logger.info(
                     f"Player {player_id} completed daily quest: {quest_type}"
                 )
         
-        await session.flush()
+        if flush:
+            await session.flush()
         
         return {
             "quest_completed": quest_completed,
             "all_completed": daily_quest.is_complete(),
-            "progress": daily_quest.quest_progress.copy(),
-            "quests_completed": daily_quest.quests_completed.copy(),
+            "progress": daily_quest.quest_progress,
+            "quests_completed": daily_quest.quests_completed,
             "completion_count": daily_quest.get_completion_count()
         }
     
@@ -391,12 +396,43 @@ class DailyService:
         
         return {
             "quest_date": daily_quest.quest_date,
-            "quests_completed": daily_quest.quests_completed.copy(),
-            "quest_progress": daily_quest.quest_progress.copy(),
+            "quests_completed": daily_quest.quests_completed,
+            "quest_progress": daily_quest.quest_progress,
             "requirements": requirements,
             "completion_count": daily_quest.get_completion_count(),
             "completion_percent": daily_quest.get_completion_percent(),
             "rewards_claimed": daily_quest.rewards_claimed,
             "streak": daily_quest.bonus_streak,
             "projected_rewards": projected_rewards
-        }
\ No newline at end of file
+        }
+    
+    @staticmethod
+    async def refresh_streak_view(session: AsyncSession) -> None:
+        """
+        Recompute the weekly streak rollup without blocking readers.
+        
+        Called periodically by SystemTasksCog; leaderboard reads hit the
+        materialized view instead of aggregating daily_quests rows.
+        """
+        await session.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {STREAKS_VIEW}"))
+    
+    @staticmethod
+    async def get_streak_leaders(session: AsyncSession, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Top players by best streak over the last 7 days.
+        
+        Args:
+            session: Database session (read-only is fine)
+            limit: Max rows to return
+        
+        Returns:
+            List of dicts with player_id, best_streak, week_total
+        """
+        result = await session.execute(
+            text(
+                f"SELECT player_id, best_streak, week_total FROM {STREAKS_VIEW} "
+                f"ORDER BY best_streak DESC, week_total DESC LIMIT :limit"
+            ),
+            {"limit": limit}
+        )
+        return [dict(row) for row in result.mappings()]
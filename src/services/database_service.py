@@ -1,4 +1,4 @@
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
@@ -7,8 +7,10 @@ from sqlalchemy.ext.asyncio import (
     AsyncEngine
 )
 from sqlalchemy.pool import NullPool, QueuePool
-from sqlalchemy import text
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
 import asyncio
+import orjson
 
 from src.config import Config
 from src.services.logger import get_logger
@@ -16,6 +18,35 @@ from src.services.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _json_serializer(value) -> str:
+    """orjson-backed JSON/JSONB bind serializer; non-str keys are stringified like stdlib json."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _connect_args(url: str) -> Dict[str, Any]:
+    """
+    Driver connect args for url.
+    
+    Only psycopg understands prepare_threshold; other drivers get none.
+    DATABASE_PREPARE_THRESHOLD defaults to psycopg's own 5 and exists so
+    it can be tuned or disabled (-1) for transaction-pooling PgBouncer.
+    """
+    if make_url(url).get_driver_name() != "psycopg":
+        return {}
+    threshold = Config.DATABASE_PREPARE_THRESHOLD
+    return {"prepare_threshold": threshold if threshold >= 0 else None}
+
+
+def _set_read_only(dbapi_connection, connection_record) -> None:
+    """Default every transaction on a new read-engine connection to READ ONLY."""
+    autocommit = dbapi_connection.autocommit
+    dbapi_connection.autocommit = True
+    cursor = dbapi_connection.cursor()
+    cursor.execute("SET SESSION default_transaction_read_only = on")
+    cursor.close()
+    dbapi_connection.autocommit = autocommit
+
+
 class DatabaseService:
     """
     Centralized database connection and session management.
@@ -26,6 +57,8 @@ class DatabaseService:
     Architecture:
         - Single async engine with connection pooling
         - Session factory for creating isolated sessions
+        - Optional second engine (DATABASE_READ_URL) behind read-only sessions,
+          e.g. asyncpg for its binary protocol on read-heavy paths
         - Automatic transaction management via context managers
         - Retry logic on initialization failure
     
@@ -38,13 +71,19 @@ class DatabaseService:
         # Read-only (no auto-commit)
         >>> async with DatabaseService.get_session() as session:
         ...     result = await session.execute(select(Player))
+        
+        # Pure reads (autocommit connection, no BEGIN/COMMIT)
+        >>> async with DatabaseService.get_readonly_session() as session:
+        ...     result = await session.execute(select(Player))
     
     Thread Safety:
         All methods are async-safe. Each session is isolated per coroutine.
     """
     
     _engine: AsyncEngine = None
+    _read_engine: AsyncEngine = None
     _session_factory: async_sessionmaker = None
+    _readonly_session_factory: async_sessionmaker = None
     _health_check_query: str = "SELECT 1"
     
     @classmethod
@@ -75,6 +114,9 @@ class DatabaseService:
                     max_overflow=Config.DATABASE_MAX_OVERFLOW if pool_class == QueuePool else None,
                     pool_pre_ping=True,
                     pool_recycle=Config.DATABASE_POOL_RECYCLE,
+                    json_serializer=_json_serializer,
+                    json_deserializer=orjson.loads,
+                    connect_args=_connect_args(Config.DATABASE_URL),
                 )
                 
                 cls._session_factory = async_sessionmaker(
@@ -85,6 +127,35 @@ class DatabaseService:
                     autoflush=False,
                 )
                 
+                # Shares the write pool unless DATABASE_READ_URL is set. Sessions run
+                # in AUTOCOMMIT (no BEGIN), so a per-transaction READ ONLY flag would
+                # never be sent; only the dedicated read engine enforces read-only,
+                # as a session default set on connect. On the shared pool, read-only
+                # sessions rely on callers not writing.
+                read_engine = cls._engine
+                if Config.DATABASE_READ_URL:
+                    cls._read_engine = create_async_engine(
+                        Config.DATABASE_READ_URL,
+                        echo=Config.DATABASE_ECHO,
+                        poolclass=pool_class,
+                        pool_size=Config.DATABASE_READ_POOL_SIZE if pool_class == QueuePool else None,
+                        pool_pre_ping=True,
+                        pool_recycle=Config.DATABASE_POOL_RECYCLE,
+                        json_serializer=_json_serializer,
+                        json_deserializer=orjson.loads,
+                        connect_args=_connect_args(Config.DATABASE_READ_URL),
+                    )
+                    event.listen(cls._read_engine.sync_engine, "connect", _set_read_only)
+                    read_engine = cls._read_engine
+                
+                cls._readonly_session_factory = async_sessionmaker(
+                    read_engine.execution_options(isolation_level="AUTOCOMMIT"),
+                    class_=AsyncSession,
+                    expire_on_commit=False,
+                    autocommit=False,
+                    autoflush=False,
+                )
+                
                 await cls.health_check()
                 logger.info(f"DatabaseService initialized successfully on attempt {attempt}")
                 return
@@ -107,8 +178,12 @@ class DatabaseService:
         
         try:
             await cls._engine.dispose()
+            if cls._read_engine is not None:
+                await cls._read_engine.dispose()
+                cls._read_engine = None
             cls._engine = None
             cls._session_factory = None
+            cls._readonly_session_factory = None
             logger.info("DatabaseService shutdown successfully")
             
         except Exception as e:
@@ -158,6 +233,42 @@ class DatabaseService:
             finally:
                 await session.close()
     
+    @classmethod
+    @asynccontextmanager
+    async def get_readonly_session(cls) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Get a session for pure reads (RIKI LAW Article I.11).
+        
+        Runs on an AUTOCOMMIT connection, so no BEGIN/COMMIT round-trips are
+        issued. Nothing is flushed or committed; in-memory changes to loaded
+        objects are discarded on exit. Postgres only rejects writes when
+        DATABASE_READ_URL is configured. Server-side cursors (session.stream)
+        need a transaction and do not work here; use get_session() instead.
+        
+        Yields:
+            AsyncSession instance
+        
+        Raises:
+            RuntimeError: If DatabaseService not initialized
+        
+        Example:
+            >>> async with DatabaseService.get_readonly_session() as session:
+            ...     player = await PlayerService.get_player_with_regen(
+            ...         session, discord_id, lock=False
+            ...     )
+        """
+        if cls._readonly_session_factory is None:
+            raise RuntimeError("DatabaseService not initialized")
+        
+        async with cls._readonly_session_factory() as session:
+            try:
+                yield session
+            except Exception as e:
+                logger.error(f"Read-only session error: {e}")
+                raise
+            finally:
+                await session.close()
+    
     @classmethod
     @asynccontextmanager
     async def get_transaction(cls) -> AsyncGenerator[AsyncSession, None]:
@@ -204,10 +315,10 @@ class DatabaseService:
             RuntimeError: If DatabaseService not initialized
         """
         from sqlmodel import SQLModel
-        from src.database.models import (
-            Player, Maiden, MaidenBase, GameConfig,
-            DailyQuest, LeaderboardSnapshot, TransactionLog
-        )
+        from src.database.models import load_all
+        
+        # Register every table once, right before metadata is used as a whole
+        load_all()
         
         if cls._engine is None:
             raise RuntimeError("DatabaseService not initialized")
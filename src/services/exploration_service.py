@@ -1,7 +1,6 @@
 from typing import Dict, Any, Optional, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from datetime import datetime
 import random
 
 from src.database.models.player import Player
@@ -305,17 +304,22 @@ class ExplorationService:
         if sector_id not in unlocked_sectors:
             raise InvalidOperationError(f"Sector {sector_id} is not unlocked")
         
-        # Get progress
-        progress = await ExplorationService.get_or_create_progress(
-            session, player.discord_id, sector_id, sublevel
-        )
+        # Calculate costs, rewards and progress up front (no DB access)
+        energy_cost = ExplorationService.calculate_energy_cost(sector_id, sublevel)
+        rewards = ExplorationService.calculate_rewards(sector_id, sublevel)
+        progress_gain = ExplorationService.calculate_progress_gain(sector_id, sublevel)
         
-        # Check if already complete
-        if progress.is_complete():
+        # Single-statement upsert; None means the sublevel is already complete.
+        # Any later failure (e.g. energy) rolls this back with the transaction.
+        upserted = await SectorProgress.upsert_progress(
+            session, player.discord_id, sector_id, sublevel,
+            delta_progress=progress_gain,
+            delta_xp=rewards["xp"],
+            delta_rikis=rewards["rikis"]
+        )
+        if upserted is None:
             raise InvalidOperationError(f"Sector {sector_id}, Sublevel {sublevel} is already complete")
-        
-        # Calculate costs and rewards
-        energy_cost = ExplorationService.calculate_energy_cost(sector_id, sublevel)
+        new_progress, miniboss_defeated = upserted
         
         # Validate energy
         if player.energy < energy_cost:
@@ -328,9 +332,6 @@ class ExplorationService:
         # Consume energy
         player.energy -= energy_cost
         
-        # Calculate rewards
-        rewards = ExplorationService.calculate_rewards(sector_id, sublevel)
-        
         # Grant rewards via ResourceService
         await ResourceService.grant_resources(
             session=session,
@@ -340,17 +341,9 @@ class ExplorationService:
             details={"sector": sector_id, "sublevel": sublevel}
         )
         
-        # Add progress
-        progress_gain = ExplorationService.calculate_progress_gain(sector_id, sublevel)
-        progress.progress = min(100.0, progress.progress + progress_gain)
-        progress.times_explored += 1
-        progress.total_rikis_earned += rewards["rikis"]
-        progress.total_xp_earned += rewards["xp"]
-        progress.last_explored = datetime.utcnow()
-        
         # Roll for maiden encounter (only if not at 100% yet)
         maiden_encounter = None
-        if progress.progress < 100.0:
+        if new_progress < 100.0:
             if ExplorationService.roll_maiden_encounter(sector_id):
                 maiden_encounter = ExplorationService.generate_encounter_maiden(sector_id, player.level)
         
@@ -372,7 +365,7 @@ class ExplorationService:
                 "rikis": rewards["rikis"],
                 "xp": rewards["xp"],
                 "progress_gain": progress_gain,
-                "new_progress": progress.progress,
+                "new_progress": new_progress,
                 "maiden_encountered": maiden_encounter is not None
             },
             context="explore_command"
@@ -380,7 +373,7 @@ class ExplorationService:
         
         logger.info(
             f"Player {player.discord_id} explored sector {sector_id} sublevel {sublevel}: "
-            f"+{progress_gain:.1f}% progress (now {progress.progress:.1f}%), "
+            f"+{progress_gain:.1f}% progress (now {new_progress:.1f}%), "
             f"+{rewards['rikis']} rikis, encounter={maiden_encounter is not None}"
         )
         
@@ -391,9 +384,9 @@ class ExplorationService:
             "rikis_gained": rewards["rikis"],
             "xp_gained": rewards["xp"],
             "progress_gained": progress_gain,
-            "current_progress": progress.progress,
+            "current_progress": new_progress,
             "maiden_encounter": maiden_encounter,
-            "miniboss_ready": progress.progress >= 100.0 and not progress.miniboss_defeated
+            "miniboss_ready": new_progress >= 100.0 and not miniboss_defeated
         }
     
     @staticmethod
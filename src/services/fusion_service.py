@@ -269,7 +269,7 @@ class FusionService:
             player.fusion_shards[key] -= shards_needed
             shards_used = shards_needed
             success = True
-            player.stats["shards_spent"] = player.stats.get("shards_spent", 0) + shards_needed
+            player.shards_spent += shards_needed
         else:
             event_bonus = ConfigManager.get("event_modifiers.fusion_rate_boost", 0.0)
             success = FusionService.roll_fusion_success(tier, event_bonus)
@@ -344,7 +344,7 @@ class FusionService:
             key = f"tier_{tier}"
             current_shards = player.fusion_shards.get(key, 0)
             player.fusion_shards[key] = current_shards + shards_gained
-            player.stats["shards_earned"] = player.stats.get("shards_earned", 0) + shards_gained
+            player.shards_earned += shards_gained
             
             maiden_1.quantity -= 1
             maiden_2.quantity -= 1
@@ -426,7 +426,7 @@ class FusionService:
         key = f"tier_{tier}"
         current = player.fusion_shards.get(key, 0)
         player.fusion_shards[key] = current + actual_amount
-        player.stats["shards_earned"] = player.stats.get("shards_earned", 0) + actual_amount
+        player.shards_earned += actual_amount
         
         shards_for_redemption = ConfigManager.get("shard_system.shards_for_redemption", 100)
         
@@ -460,7 +460,7 @@ class FusionService:
         
         key = f"tier_{tier}"
         player.fusion_shards[key] -= shards_needed
-        player.stats["shards_spent"] = player.stats.get("shards_spent", 0) + shards_needed
+        player.shards_spent += shards_needed
         return True
     
     @staticmethod
@@ -0,0 +1,192 @@
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select, text
+
+from src.database.models.leaderboard import LeaderboardSnapshot
+from src.database.models.player import LEADERBOARD_VIEW, Player
+from src.services.database_service import DatabaseService
+from src.services.redis_service import RedisService
+from src.services.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LeaderboardCache:
+    """
+    Live leaderboards held in Redis sorted sets.
+
+    Top-N and rank-of-player reads are served from a ZSET per category;
+    LeaderboardSnapshot is only the cold persisted copy, written
+    periodically through its bulk path.
+
+    Keys:
+        - leaderboard:{category} -> member = discord_id, score = ranked value
+
+    Lifecycle:
+        - refresh_view(): refresh player_leaderboard_mv from players
+        - rebuild_all(): recompute every ZSET from the view (bot startup)
+        - update_player(): refresh one player's scores (after mutating events)
+        - persist_snapshots(): dump top entries into LeaderboardSnapshot
+
+    Usage:
+        >>> top = await LeaderboardCache.get_top("total_power", limit=10)
+        >>> mine = await LeaderboardCache.get_rank("total_power", player_id)
+
+    Graceful Degradation:
+        Reads return None when Redis is unavailable so callers can fall
+        back to LeaderboardSnapshot; persist_snapshots() then ranks
+        straight off player_leaderboard_mv.
+    """
+
+    # Category -> Player attribute holding the ranked value
+    CATEGORIES: Dict[str, str] = {
+        "total_power": "total_power",
+        "level": "level",
+        "fusions": "total_fusions",
+    }
+
+    REBUILD_BATCH = 5000
+    SNAPSHOT_SIZE = 1000
+
+    @staticmethod
+    def _key(category: str) -> str:
+        return f"leaderboard:{category}"
+
+    @classmethod
+    async def update_player(cls, player: Player) -> None:
+        """Write a player's current value into every category ZSET (one round-trip)."""
+        member = str(player.discord_id)
+        await RedisService.zadd_many({
+            cls._key(category): {member: getattr(player, attr)}
+            for category, attr in cls.CATEGORIES.items()
+        })
+
+    @classmethod
+    async def get_top(cls, category: str, limit: int = 100) -> Optional[List[Tuple[int, int]]]:
+        """
+        Highest entries for a category.
+
+        Returns:
+            List of (player_id, value) in rank order, or None if Redis unavailable
+        """
+        entries = await RedisService.zrevrange(cls._key(category), 0, limit - 1)
+        if entries is None:
+            return None
+        return [(int(member), int(score)) for member, score in entries]
+
+    @classmethod
+    async def get_rank(cls, category: str, player_id: int) -> Optional[Tuple[int, int]]:
+        """
+        A player's 1-based rank and value in a category.
+
+        Returns:
+            (rank, value), or None if unranked or Redis unavailable
+        """
+        found = await RedisService.zrevrank_with_score(cls._key(category), str(player_id))
+        if found is None:
+            return None
+        rank, score = found
+        return rank + 1, int(score)
+
+    @staticmethod
+    async def refresh_view() -> None:
+        """Recompute player_leaderboard_mv without blocking readers."""
+        async with DatabaseService.get_transaction() as session:
+            await session.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {LEADERBOARD_VIEW}"))
+
+    @classmethod
+    async def rebuild(cls, category: str) -> int:
+        """
+        Recompute a category ZSET from player_leaderboard_mv.
+
+        Builds into a temporary key and renames it over the live one, so
+        readers never see a partially filled leaderboard. Call refresh_view()
+        first if the view may be stale.
+
+        Returns:
+            Number of players loaded
+        """
+        column = cls.CATEGORIES[category]
+        tmp_key = f"{cls._key(category)}:rebuild"
+        await RedisService.delete(tmp_key)
+
+        loaded = 0
+        # Server-side cursor: needs a transaction, so not the AUTOCOMMIT read-only session
+        async with DatabaseService.get_session() as session:
+            result = await session.stream(text(f"SELECT player_id, {column} FROM {LEADERBOARD_VIEW}"))
+            async for batch in result.partitions(cls.REBUILD_BATCH):
+                await RedisService.zadd(tmp_key, {str(pid): value for pid, value in batch})
+                loaded += len(batch)
+
+        if loaded:
+            await RedisService.rename(tmp_key, cls._key(category))
+        logger.info(f"Leaderboard '{category}' rebuilt from database ({loaded} players)")
+        return loaded
+
+    @classmethod
+    async def rebuild_all(cls) -> None:
+        """Refresh player_leaderboard_mv, then recompute every category ZSET from it."""
+        await cls.refresh_view()
+        for category in cls.CATEGORIES:
+            await cls.rebuild(category)
+
+    @classmethod
+    async def persist_snapshots(cls) -> None:
+        """
+        Persist the top SNAPSHOT_SIZE entries of each category.
+
+        rank_change is computed against the previous snapshot, then the
+        category is replaced via LeaderboardSnapshot.bulk_replace. When Redis
+        is unavailable or the category ZSET is empty, the ranking comes from
+        player_leaderboard_mv instead.
+        """
+        view_refreshed = False
+        for category in cls.CATEGORIES:
+            top = await cls.get_top(category, limit=cls.SNAPSHOT_SIZE)
+            # None: Redis down; []: ZSET missing (e.g. a failed rebuild)
+            if not top:
+                if not view_refreshed:
+                    await cls.refresh_view()
+                    view_refreshed = True
+                top = await cls._top_from_view(category, cls.SNAPSHOT_SIZE)
+            if not top:
+                continue
+
+            player_ids = [player_id for player_id, _ in top]
+            async with DatabaseService.get_transaction() as session:
+                names = dict((await session.execute(
+                    select(Player.discord_id, Player.username).where(Player.discord_id.in_(player_ids))
+                )).all())
+                previous = dict((await session.execute(
+                    select(LeaderboardSnapshot.player_id, LeaderboardSnapshot.rank)
+                    .where(LeaderboardSnapshot.category == category)
+                )).all())
+
+                rows = [
+                    {
+                        "player_id": player_id,
+                        "username": names.get(player_id, "Unknown"),
+                        "rank": rank,
+                        "rank_change": previous[player_id] - rank if player_id in previous else 0,
+                        "value": value,
+                    }
+                    for rank, (player_id, value) in enumerate(top, start=1)
+                    if player_id in names
+                ]
+                await LeaderboardSnapshot.bulk_replace(session, category, rows)
+
+            logger.debug(f"Persisted {len(rows)} '{category}' leaderboard snapshots")
+
+    @classmethod
+    async def _top_from_view(cls, category: str, limit: int) -> List[Tuple[int, int]]:
+        """Highest entries for a category, ranked off player_leaderboard_mv's index."""
+        column = cls.CATEGORIES[category]
+        async with DatabaseService.get_readonly_session() as session:
+            result = await session.execute(
+                text(
+                    f"SELECT player_id, {column} FROM {LEADERBOARD_VIEW} "
+                    f"ORDER BY {column} DESC, player_id LIMIT :limit"
+                ),
+                {"limit": limit}
+            )
+            return [(player_id, value) for player_id, value in result.all()]
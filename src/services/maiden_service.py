@@ -307,7 +307,7 @@ class MaidenService:
         Calculate player's total power from all maidens with leader bonus.
         
         Formula:
-            Total Power = Sum of (maiden_stats × quantity) × leader_bonus
+            Total Power = Sum of (base ATK + base DEF) × quantity × leader_bonus
         
         Args:
             session: Database session
@@ -320,31 +320,32 @@ class MaidenService:
             >>> power = await MaidenService.calculate_player_total_power(session, player_id)
             >>> print(f"Total Power: {power:,}")
         """
-        maidens = await MaidenService.get_player_maidens(session, player_id)
-        
-        player = await session.get(Player, player_id)
-        if not player:
+        # Column-only reads: totals come back as Row tuples, no Maiden/Player hydration
+        leader = await session.execute(
+            select(Player.leader_maiden_id).where(Player.discord_id == player_id)
+        )
+        leader_row = leader.first()
+        if leader_row is None:
             return 0
-        
-        total_power = 0
-        
-        for maiden in maidens:
-            if not maiden.maiden_base:
-                continue
-            
-            maiden_base = maiden.maiden_base
-            
-            maiden_power = (
-                maiden_base.base_attack +
-                maiden_base.base_defense +
-                maiden_base.base_hp
+        leader_maiden_id = leader_row.leader_maiden_id
+        
+        power_sum = await session.scalar(
+            select(
+                func.coalesce(
+                    func.sum(
+                        (MaidenBase.base_atk + MaidenBase.base_def) * Maiden.quantity
+                    ),
+                    0
+                )
             )
-            
-            total_power += maiden_power * maiden.quantity
+            .join(MaidenBase, Maiden.maiden_base_id == MaidenBase.id)
+            .where(Maiden.player_id == player_id)
+        )
+        total_power = int(power_sum or 0)
         
-        if player.leader_maiden_id:
+        if leader_maiden_id:
             leader_maiden = await MaidenService.get_maiden_by_id(
-                session, player.leader_maiden_id
+                session, leader_maiden_id
             )
             
             if leader_maiden and leader_maiden.maiden_base:
@@ -387,23 +388,23 @@ class MaidenService:
             >>> stats = await MaidenService.get_collection_stats(session, player_id)
             >>> print(f"Collection: {stats['unique_maidens']} unique maidens")
         """
-        maidens = await MaidenService.get_player_maidens(session, player_id)
+        rows = (await session.execute(
+            select(Maiden.tier, Maiden.quantity, MaidenBase.element)
+            .join(MaidenBase, Maiden.maiden_base_id == MaidenBase.id)
+            .where(Maiden.player_id == player_id)
+        )).all()
         
-        total_maidens = sum(maiden.quantity for maiden in maidens)
-        unique_maidens = len(maidens)
+        total_maidens = sum(quantity for _, quantity, _ in rows)
+        unique_maidens = len(rows)
         
         tier_distribution = {}
         element_distribution = {}
         highest_tier = 0
         
-        for maiden in maidens:
-            tier = maiden.tier
-            tier_distribution[tier] = tier_distribution.get(tier, 0) + maiden.quantity
+        for tier, quantity, element in rows:
+            tier_distribution[tier] = tier_distribution.get(tier, 0) + quantity
             highest_tier = max(highest_tier, tier)
-            
-            if maiden.maiden_base:
-                element = maiden.maiden_base.element
-                element_distribution[element] = element_distribution.get(element, 0) + maiden.quantity
+            element_distribution[element] = element_distribution.get(element, 0) + quantity
         
         total_power = await MaidenService.calculate_player_total_power(session, player_id)
         
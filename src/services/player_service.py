@@ -219,6 +219,9 @@ class PlayerService:
         
         Grace amount affected by player class (invoker gets +20%).
         Uses ResourceService for grace granting with modifier application.
+        
+        The returned has_modifiers flag is True when an income or XP
+        boost above 1.0 was applied, so callers can skip modifier display.
         """
         if player.prayer_charges <= 0:
             raise InsufficientResourcesError(
@@ -249,15 +252,20 @@ class PlayerService:
         )
         
         grace_gained = result["granted"]["grace"]
+        modifiers_applied = result["modifiers_applied"]
         
-        player.stats["prayers_performed"] = player.stats.get("prayers_performed", 0) + 1
+        player.prayers_performed += 1
         
         return {
             "grace_gained": grace_gained,
             "total_grace": player.grace,
             "charges_remaining": player.prayer_charges,
             "next_charge_in": player.get_prayer_regen_display(),
-            "modifiers_applied": result["modifiers_applied"]
+            "modifiers_applied": modifiers_applied,
+            "has_modifiers": (
+                modifiers_applied.get("income_boost", 1.0) > 1.0
+                or modifiers_applied.get("xp_boost", 1.0) > 1.0
+            )
         }
     
     @staticmethod
@@ -360,7 +368,7 @@ class PlayerService:
             leveled_up = True
             
             player.last_level_up = datetime.utcnow()
-            player.stats["level_ups"] = player.stats.get("level_ups", 0) + 1
+            player.level_ups += 1
             
             if allow_overcap:
                 old_energy = player.energy
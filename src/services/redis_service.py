@@ -1,12 +1,13 @@
-from typing import Optional, Any
+from typing import Optional, Any, Dict, List, Tuple
 from contextlib import asynccontextmanager
-import json
+import orjson
 import redis.asyncio as redis
 from redis.asyncio.lock import Lock
 from datetime import datetime
 import asyncio
 
 from src.config import Config
+from src.exceptions import LockContendedError
 from src.services.logger import get_logger
 
 logger = get_logger(__name__)
@@ -218,8 +219,8 @@ class RedisService:
                 return None
             
             try:
-                return json.loads(value)
-            except json.JSONDecodeError:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
                 return value
                 
         except Exception as e:
@@ -232,7 +233,7 @@ class RedisService:
         """
         Set value in Redis cache with optional TTL.
         
-        Automatically serializes dicts/lists to JSON.
+        Automatically serializes dicts/lists to JSON (orjson, written as bytes).
         
         Args:
             key: Cache key
@@ -251,7 +252,7 @@ class RedisService:
         
         try:
             if isinstance(value, (dict, list)):
-                value = json.dumps(value)
+                value = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
             
             if ttl:
                 await cls._client.setex(key, ttl, value)
@@ -282,6 +283,29 @@ class RedisService:
             logger.error(f"Redis DELETE error for key {key}: {e}")
             return False
     
+    @classmethod
+    async def unlink(cls, *keys: str) -> int:
+        """
+        Delete keys without blocking Redis (UNLINK frees memory in the background).
+        
+        Args:
+            *keys: Cache keys to remove in a single round-trip
+        
+        Returns:
+            Number of keys removed, 0 if Redis unavailable
+        """
+        if not keys or cls._client is None or not cls._circuit_breaker.can_attempt():
+            return 0
+        
+        try:
+            result = await cls._client.unlink(*keys)
+            cls._circuit_breaker.call_succeeded()
+            return result
+        except Exception as e:
+            cls._circuit_breaker.call_failed()
+            logger.error(f"Redis UNLINK error for {len(keys)} keys: {e}")
+            return 0
+    
     @classmethod
     async def exists(cls, key: str) -> bool:
         """Check if key exists in Redis cache."""
@@ -336,26 +360,146 @@ class RedisService:
             logger.error(f"Redis EXPIRE error for key {key}: {e}")
             return False
     
+    @classmethod
+    async def zadd(cls, key: str, mapping: Dict[str, float]) -> bool:
+        """
+        Add or update sorted-set members with their scores.
+        
+        Args:
+            key: Sorted set key
+            mapping: member -> score
+        
+        Returns:
+            True if successful, False if Redis unavailable
+        """
+        if not mapping or cls._client is None or not cls._circuit_breaker.can_attempt():
+            return False
+        
+        try:
+            await cls._client.zadd(key, mapping)
+            cls._circuit_breaker.call_succeeded()
+            return True
+        except Exception as e:
+            cls._circuit_breaker.call_failed()
+            logger.error(f"Redis ZADD error for key {key}: {e}")
+            return False
+    
+    @classmethod
+    async def zadd_many(cls, mappings: Dict[str, Dict[str, float]]) -> bool:
+        """
+        ZADD into several sorted sets in one pipelined round-trip.
+        
+        Args:
+            mappings: key -> {member: score}
+        
+        Returns:
+            True if successful, False if Redis unavailable
+        """
+        if not mappings or cls._client is None or not cls._circuit_breaker.can_attempt():
+            return False
+        
+        try:
+            async with cls._client.pipeline(transaction=False) as pipe:
+                for key, mapping in mappings.items():
+                    pipe.zadd(key, mapping)
+                await pipe.execute()
+            cls._circuit_breaker.call_succeeded()
+            return True
+        except Exception as e:
+            cls._circuit_breaker.call_failed()
+            logger.error(f"Redis pipelined ZADD error for keys {list(mappings)}: {e}")
+            return False
+    
+    @classmethod
+    async def zrevrange(cls, key: str, start: int, stop: int) -> Optional[List[Tuple[str, float]]]:
+        """
+        Highest-scored members in [start, stop] with their scores.
+        
+        Returns:
+            List of (member, score), or None if Redis unavailable
+        """
+        if cls._client is None or not cls._circuit_breaker.can_attempt():
+            return None
+        
+        try:
+            result = await cls._client.zrevrange(key, start, stop, withscores=True)
+            cls._circuit_breaker.call_succeeded()
+            return result
+        except Exception as e:
+            cls._circuit_breaker.call_failed()
+            logger.error(f"Redis ZREVRANGE error for key {key}: {e}")
+            return None
+    
+    @classmethod
+    async def zrevrank_with_score(cls, key: str, member: str) -> Optional[Tuple[int, float]]:
+        """
+        0-based descending rank and score of a member in one round-trip.
+        
+        Returns:
+            (rank, score), or None if member absent or Redis unavailable
+        """
+        if cls._client is None or not cls._circuit_breaker.can_attempt():
+            return None
+        
+        try:
+            async with cls._client.pipeline(transaction=False) as pipe:
+                pipe.zrevrank(key, member)
+                pipe.zscore(key, member)
+                rank, score = await pipe.execute()
+            cls._circuit_breaker.call_succeeded()
+            return (rank, score) if rank is not None else None
+        except Exception as e:
+            cls._circuit_breaker.call_failed()
+            logger.error(f"Redis ZREVRANK error for key {key}: {e}")
+            return None
+    
+    @classmethod
+    async def rename(cls, src: str, dst: str) -> bool:
+        """Atomically replace dst with src (used to swap in rebuilt keys)."""
+        if cls._client is None or not cls._circuit_breaker.can_attempt():
+            return False
+        
+        try:
+            await cls._client.rename(src, dst)
+            cls._circuit_breaker.call_succeeded()
+            return True
+        except Exception as e:
+            cls._circuit_breaker.call_failed()
+            logger.error(f"Redis RENAME error {src} -> {dst}: {e}")
+            return False
+    
     @classmethod
     @asynccontextmanager
-    async def acquire_lock(cls, lock_name: str, timeout: int = 5, blocking_timeout: int = 3):
+    async def acquire_lock(
+        cls,
+        lock_name: str,
+        timeout: float = 5,
+        blocking_timeout: float = 3,
+        blocking: bool = True
+    ):
         """
         Acquire distributed lock for critical sections (RIKI LAW Article I.3).
         
         Prevents race conditions in concurrent operations like fusion, trading,
         or button double-clicks.
         
+        The lock is an owner-fenced SET NX PX, so a short fractional timeout
+        is fine for user-scoped locks. With blocking=False a held lock fails
+        immediately instead of polling, letting the caller reply right away.
+        
         Args:
             lock_name: Unique identifier for the lock
-            timeout: Lock expiration time (seconds)
+            timeout: Lock expiration time (seconds, fractions allowed)
             blocking_timeout: Max time to wait for lock (seconds)
+            blocking: Whether to wait for a held lock (False = fail fast)
         
         Yields:
             Lock object
         
         Raises:
             RuntimeError: If Redis unavailable (circuit breaker open)
-            TimeoutError: If lock cannot be acquired within blocking_timeout
+            LockContendedError: If lock is held elsewhere (not acquired in
+                time, or immediately when blocking=False)
         
         Example:
             >>> async with RedisService.acquire_lock(f"fusion:{player_id}"):
@@ -372,18 +516,19 @@ class RedisService:
         lock = Lock(cls._client, lock_name, timeout=timeout, blocking_timeout=blocking_timeout)
         
         try:
-            acquired = await lock.acquire(blocking=True, blocking_timeout=blocking_timeout)
+            acquired = await lock.acquire(blocking=blocking, blocking_timeout=blocking_timeout)
             cls._circuit_breaker.call_succeeded()
-            
-            if not acquired:
-                raise TimeoutError(f"Failed to acquire lock: {lock_name}")
-            
-            yield lock
-            
         except Exception as e:
             cls._circuit_breaker.call_failed()
             logger.error(f"Redis LOCK error for {lock_name}: {e}")
             raise
+        
+        # Contention is not a Redis failure; keep it out of the circuit breaker
+        if not acquired:
+            raise LockContendedError(lock_name)
+        
+        try:
+            yield lock
         finally:
             try:
                 await lock.release()
@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models.transaction_log import TransactionLog
@@ -7,6 +7,8 @@ from src.services.logger import get_logger
 
 logger = get_logger(__name__)
 
+_PARTITION_PREFIX = "transaction_logs_w"
+
 
 class TransactionLogger:
     """
@@ -46,6 +48,9 @@ class TransactionLogger:
         """
         Log a transaction to the database.
         
+        The details dict is stored as-is; the engine's orjson JSON serializer
+        encodes it once at flush, and rejects types it cannot represent.
+        
         Args:
             session: Database session (must be part of active transaction)
             player_id: Discord ID of the player
@@ -58,8 +63,7 @@ class TransactionLogger:
                 player_id=player_id,
                 transaction_type=transaction_type,
                 details=details,
-                context=context or "unknown",
-                timestamp=datetime.utcnow()
+                context=context or "unknown"
             )
             
             session.add(log_entry)
@@ -199,29 +203,220 @@ class TransactionLogger:
             raise
 
     @staticmethod
-    async def cleanup_old_logs(cutoff_days: int = 90) -> int:
+    def partition_name(week_start: date) -> str:
+        """Name of the weekly transaction_logs partition starting on week_start (a Monday)."""
+        return f"{_PARTITION_PREFIX}{week_start:%Y%m%d}"
+    
+    @staticmethod
+    async def _list_partitions(session: AsyncSession) -> Optional[Dict[str, date]]:
+        """
+        Weekly partitions of transaction_logs mapped to their week start.
+        
+        Returns None when transaction_logs is not a partitioned table
+        (databases created before partitioning), so callers fall back to DELETE.
+        """
+        from sqlalchemy import text
+        
+        relkind = await session.scalar(
+            text("SELECT relkind FROM pg_class WHERE relname = 'transaction_logs'")
+        )
+        if relkind != "p":
+            return None
+        
+        result = await session.execute(text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = 'transaction_logs'"
+        ))
+        partitions: Dict[str, date] = {}
+        for name in result.scalars():
+            if name.startswith(_PARTITION_PREFIX):
+                try:
+                    partitions[name] = datetime.strptime(name[len(_PARTITION_PREFIX):], "%Y%m%d").date()
+                except ValueError:
+                    continue
+        return partitions
+    
+    @staticmethod
+    async def ensure_partitions(weeks_ahead: int = 4) -> int:
+        """
+        Pre-create weekly partitions for the current week and the next weeks_ahead.
+        
+        Safe to call repeatedly (used by SystemTasksCog weekly task). Each
+        partition is created in its own short transaction with a lock_timeout,
+        so one failure (or a busy table) does not block the rest. Rows that
+        already landed in the default partition for a week are moved into the
+        new partition; otherwise Postgres would reject the CREATE.
+        
+        Args:
+            weeks_ahead: Number of future weeks to create beyond the current one
+        
+        Returns:
+            Number of partitions created (0 if the table is not partitioned)
+        """
+        from src.services.database_service import DatabaseService
+        
+        today = datetime.utcnow().date()
+        current_week = today - timedelta(days=today.weekday())
+        
+        async with DatabaseService.get_session() as session:
+            existing = await TransactionLogger._list_partitions(session)
+        if existing is None:
+            return 0
+        
+        created = 0
+        for offset in range(weeks_ahead + 1):
+            start = current_week + timedelta(weeks=offset)
+            name = TransactionLogger.partition_name(start)
+            if name in existing:
+                continue
+            try:
+                await TransactionLogger._create_partition(name, start, start + timedelta(weeks=1))
+                created += 1
+            except Exception as e:
+                logger.error(f"Failed to create transaction_logs partition {name}: {e}")
+        
+        if created:
+            logger.info(f"Created {created} transaction_logs partitions")
+        return created
+    
+    @staticmethod
+    async def _create_partition(name: str, start: date, end: date) -> None:
+        """
+        Create one weekly partition, moving matching default-partition rows into it.
+        
+        Creating a range partition scans the default partition under ACCESS
+        EXCLUSIVE to prove it holds no rows for the range. The default only
+        fills when a week was not pre-created (and is trimmed by the DELETE
+        fallback), so the scan is normally over an empty table; lock_timeout
+        keeps a contended attempt from queueing writers behind it.
+        """
+        from src.database.models.transaction_log import DEFAULT_PARTITION
+        from src.services.database_service import DatabaseService
+        from sqlalchemy import text
+        
+        bounds = {"start": start, "end": end}
+        in_range = "timestamp >= :start AND timestamp < :end"
+        partition_ddl = (
+            f"CREATE TABLE {name} PARTITION OF transaction_logs "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        
+        async with DatabaseService.get_transaction() as session:
+            await session.execute(text("SET LOCAL lock_timeout = '5s'"))
+            
+            stray = await session.scalar(
+                text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_range})"),
+                bounds
+            )
+            if not stray:
+                await session.execute(text(partition_ddl))
+                return
+            
+            # Documented procedure: detach the default, create the partition,
+            # move the rows across, then re-attach the default
+            await session.execute(text(f"ALTER TABLE transaction_logs DETACH PARTITION {DEFAULT_PARTITION}"))
+            await session.execute(text(partition_ddl))
+            await session.execute(
+                text(f"INSERT INTO {name} SELECT * FROM {DEFAULT_PARTITION} WHERE {in_range}"),
+                bounds
+            )
+            moved = await session.execute(
+                text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}"),
+                bounds
+            )
+            await session.execute(
+                text(f"ALTER TABLE transaction_logs ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
+            )
+            logger.warning(f"Moved {moved.rowcount} rows from {DEFAULT_PARTITION} into {name}")
+    
+    @staticmethod
+    async def drop_expired_partitions(cutoff_days: int = 90) -> Optional[int]:
+        """
+        Drop weekly partitions whose whole range is older than cutoff_days.
+        
+        A metadata-only operation: no row deletes, WAL churn, or vacuum debt.
+        Retention is therefore week-granular; a partition is kept until its
+        newest possible row has expired.
+        
+        Args:
+            cutoff_days: Drop partitions ending before this many days ago
+        
+        Returns:
+            Number of partitions dropped, or None if the table is not
+            partitioned (caller should use cleanup_old_logs instead)
+        """
+        from src.services.database_service import DatabaseService
+        from sqlalchemy import text
+        
+        cutoff = datetime.utcnow().date() - timedelta(days=cutoff_days)
+        
+        async with DatabaseService.get_transaction() as session:
+            partitions = await TransactionLogger._list_partitions(session)
+            if partitions is None:
+                return None
+            
+            expired = [
+                name for name, start in partitions.items()
+                if start + timedelta(weeks=1) <= cutoff
+            ]
+            for name in expired:
+                await session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+        
+        if expired:
+            logger.info(f"Dropped {len(expired)} transaction_logs partitions older than {cutoff_days} days")
+        return len(expired)
+    
+    @staticmethod
+    async def cleanup_old_logs(
+        cutoff_days: int = 90,
+        limit: Optional[int] = None,
+        table_name: Optional[str] = None
+    ) -> int:
         """
         Delete transaction logs older than specified days.
         Automatically manages its own database transaction.
         
         Safe to call standalone (used by SystemTasksCog daily cleanup task).
+        With ``limit`` set, deletes at most one batch of the oldest rows,
+        skipping rows locked by other writers, so each call holds row locks
+        only briefly. Callers loop until a short batch comes back.
+        
+        On a partitioned table this is the fallback for rows in the default
+        partition; expired weekly partitions go through drop_expired_partitions.
         
         Args:
             cutoff_days: Delete logs older than this many days (default 90)
+            limit: Max rows to delete in this call (None = all in one statement)
+            table_name: Restrict the delete to one partition (None = transaction_logs)
         
         Returns:
             Number of logs deleted
         """
-        from src.database.models.transaction_log import TransactionLog
         from src.services.database_service import DatabaseService
-        from sqlalchemy import delete
-        from datetime import datetime, timedelta
+        from sqlalchemy import column, delete, select, table
 
         cutoff_date = datetime.utcnow() - timedelta(days=cutoff_days)
+        if table_name is None:
+            target = TransactionLog.__table__
+        else:
+            target = table(table_name, column("id"), column("timestamp"))
 
         async with DatabaseService.get_transaction() as session:
-            stmt = delete(TransactionLog).where(TransactionLog.timestamp < cutoff_date)
+            if limit is None:
+                stmt = delete(target).where(target.c.timestamp < cutoff_date)
+            else:
+                batch_ids = (
+                    select(target.c.id)
+                    .where(target.c.timestamp < cutoff_date)
+                    .order_by(target.c.id)
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                    .scalar_subquery()
+                )
+                stmt = delete(target).where(target.c.id.in_(batch_ids))
             result = await session.execute(stmt)
             deleted_count = result.rowcount or 0
             logger.info(f"Cleaned up {deleted_count} transaction logs older than {cutoff_days} days")
-            return deleted_count
\ No newline at end of file
+            return deleted_count
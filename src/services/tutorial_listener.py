@@ -1,6 +1,6 @@
 import asyncio
 from src.services.event_bus import EventBus
-from src.services.tutorial_service import TutorialService
+from src.services.tutorial_service import TRIGGER_INDEX, TutorialService
 from src.services.database_service import DatabaseService
 from src.services.logger import get_logger
 
@@ -16,24 +16,36 @@ async def _handle_tutorial_event(event_name: str, data):
         logger.warning(f"Tutorial event {event_name} missing required data")
         return
 
+    step = TRIGGER_INDEX.get(event_name)
+    if not step:
+        return
+    step_key = step["key"]
+
+    # Column-only read (cached per player) so repeat events from veterans
+    # never hydrate and lock the full Player row
+    if step_key in await TutorialService.get_completed_steps(player_id):
+        return
+
     async with DatabaseService.get_transaction() as session:
         from src.database.models.player import Player
         player = await session.get(Player, player_id, with_for_update=True)
         if not player:
             return
 
-        result = await TutorialService.complete_step(session, player, event_name)
+        result = await TutorialService.complete_step(session, player, step_key)
         if not result:
             return  # Already completed or invalid
 
-        # Send congrats message to channel
-        channel = bot.get_channel(channel_id)
-        if channel:
-            await channel.send(
-                f"🎉 **Tutorial Complete:** {result['title']}\n"
-                f"{result['congrats']}\n\n"
-                f"💰 Rewards: +{result['reward']['rikis']} Rikis, +{result['reward']['grace']} Grace"
-            )
+    TutorialService.remember_completed(player_id, step_key)
+
+    # Send congrats message to channel
+    channel = bot.get_channel(channel_id)
+    if channel:
+        await channel.send(
+            f"🎉 **Tutorial Complete:** {result['title']}\n"
+            f"{result['congrats']}\n\n"
+            f"💰 Rewards: +{result['reward']['rikis']} Rikis, +{result['reward']['grace']} Grace"
+        )
 
 async def register_tutorial_listeners(bot):
     """Bind tutorial steps to the EventBus."""
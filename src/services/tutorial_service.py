@@ -1,8 +1,13 @@
 from __future__ import annotations
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Set
 from datetime import datetime
 
+from sqlalchemy import case, func, select, update
+
 from src.database.models.player import Player
+from src.database.models.tutorial import ALL_STEPS_MASK, STEP_BITS, TutorialProgress
+from src.services.database_service import DatabaseService
 from src.services.resource_service import ResourceService  # ✅ added
 from src.services.logger import get_logger
 
@@ -60,6 +65,111 @@ KEY_INDEX: Dict[str, Dict[str, Any]] = {s["key"]: s for s in TUTORIAL_STEPS}
 
 
 class TutorialService:
+    # player_id -> completed step keys; lets veterans' events skip the locked transaction
+    _COMPLETED_CACHE_SIZE = 10_000
+    _completed_steps: "OrderedDict[int, Set[str]]" = OrderedDict()
+
+    @classmethod
+    async def get_completed_steps(cls, player_id: int) -> Set[str]:
+        """
+        Completed step keys for a player, seeded with one read-only query
+        on first use and kept in a bounded LRU afterwards.
+        """
+        cached = cls._completed_steps.get(player_id)
+        if cached is not None:
+            cls._completed_steps.move_to_end(player_id)
+            return cached
+
+        async with DatabaseService.get_readonly_session() as session:
+            result = await session.execute(
+                select(Player.stats).where(Player.discord_id == player_id)
+            )
+            stats = result.scalar_one_or_none() or {}
+
+        completed = set((stats.get("tutorial") or {}).get("completed") or {})
+        cls._completed_steps[player_id] = completed
+        if len(cls._completed_steps) > cls._COMPLETED_CACHE_SIZE:
+            cls._completed_steps.popitem(last=False)
+        return completed
+
+    @classmethod
+    def remember_completed(cls, player_id: int, step_key: str) -> None:
+        """Record a committed step completion in the LRU (no-op if not seeded)."""
+        cached = cls._completed_steps.get(player_id)
+        if cached is not None:
+            cached.add(step_key)
+
+    @staticmethod
+    async def get_players_with_unclaimed_rewards(session, limit: Optional[int] = None) -> List[int]:
+        """
+        Player IDs with at least one completed step whose reward is unclaimed.
+        
+        The bitmask test runs in Postgres and is served by the partial
+        ix_tutorial_progress_unclaimed index; no rows are loaded into Python.
+        
+        Groundwork: reads the tutorial_progress table, which nothing writes
+        yet. The live flow (complete_step, tutorial_listener) still keeps
+        state in Player.stats["tutorial"], so this returns [] until the
+        listener moves onto the table.
+        """
+        stmt = select(TutorialProgress.player_id).where(
+            TutorialProgress.steps_completed.bitwise_and(
+                TutorialProgress.rewards_claimed.bitwise_not()
+            ) != 0
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await session.execute(stmt)
+        return list(result.scalars())
+
+    @staticmethod
+    async def complete_step_atomic(session, player_id: int, step: str) -> Optional[int]:
+        """
+        Set a TutorialProgress step bit in one UPDATE ... RETURNING.
+        
+        No read-modify-write: the OR happens in Postgres, and completed_at is
+        stamped with now() in the same statement when the last bit lands.
+        The WHERE clause only matches rows missing the bit, so concurrent
+        completions of the same step cannot both succeed.
+        
+        Groundwork: nothing calls this or creates tutorial_progress rows yet.
+        The live flow (complete_step via tutorial_listener) still records
+        steps in Player.stats["tutorial"]; switching it over also needs a
+        backfill of existing players' progress into the table.
+        
+        Args:
+            session: Database session (must be part of active transaction)
+            player_id: Player's Discord ID
+            step: Tutorial step name (see STEP_ORDER)
+        
+        Returns:
+            New steps_completed mask if the step was newly completed, or None
+            if it was already done, the step is unknown, or no row exists
+        """
+        bit = STEP_BITS.get(step)
+        if bit is None:
+            return None
+        
+        table = TutorialProgress.__table__
+        new_mask = table.c.steps_completed.bitwise_or(bit)
+        stmt = (
+            update(table)
+            .where(
+                table.c.player_id == player_id,
+                table.c.steps_completed.bitwise_and(bit) == 0,
+            )
+            .values(
+                steps_completed=new_mask,
+                completed_at=func.coalesce(
+                    table.c.completed_at,
+                    case((new_mask == ALL_STEPS_MASK, func.now())),
+                ),
+            )
+            .returning(table.c.steps_completed)
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
     @staticmethod
     def _ensure_state(player: Player) -> None:
         """Ensure player has tutorial tracking structure initialized."""
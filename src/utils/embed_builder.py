@@ -28,7 +28,7 @@ class EmbedBuilder:
             title=title,
             description=description,
             color=color,
-            timestamp=datetime.utcnow()
+            timestamp=discord.utils.utcnow()
         )
         if footer:
             embed.set_footer(text=footer)